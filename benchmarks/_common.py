@@ -0,0 +1,64 @@
+# benchmarks/_common.py
+import random
+import statistics
+import string
+import time
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from linkedin.navigation.enums import ProfileState
+
+# Rough shape of a mature account: most leads are done, a few are waiting.
+STATE_WEIGHTS = {
+    ProfileState.DISCOVERED.value: 5,
+    ProfileState.ENRICHED.value: 5,
+    ProfileState.PENDING.value: 15,
+    ProfileState.CONNECTED.value: 5,
+    ProfileState.COMPLETED.value: 60,
+    ProfileState.FAILED.value: 10,
+}
+
+
+class BenchSession:
+    """Minimal stand-in for AccountSession — only exposes db_session."""
+
+    def __init__(self, engine):
+        self.db_session = sessionmaker(bind=engine)()
+
+
+def public_ids(n: int, seed: int = 42) -> list[str]:
+    rnd = random.Random(seed)
+    alphabet = string.ascii_lowercase + string.digits
+    return [f"{''.join(rnd.choices(alphabet, k=10))}-{i}" for i in range(n)]
+
+
+def seed_profiles(engine, n: int, chunk: int = 50_000, seed: int = 42) -> list[str]:
+    """Bulk-insert `n` bare profile rows with a realistic state mix."""
+    rnd = random.Random(seed)
+    ids = public_ids(n, seed)
+    states = rnd.choices(list(STATE_WEIGHTS), weights=list(STATE_WEIGHTS.values()), k=n)
+    with engine.begin() as conn:
+        for start in range(0, n, chunk):
+            conn.execute(
+                text(
+                    "INSERT INTO profiles (public_identifier, state, cloud_synced, created_at, updated_at) "
+                    "VALUES (:pid, :state, :synced, datetime('now', :age), datetime('now', :age))"
+                ),
+                [
+                    {"pid": pid, "state": state, "synced": rnd.random() < 0.9, "age": f"-{rnd.randint(0, 10**6)} seconds"}
+                    for pid, state in zip(ids[start:start + chunk], states[start:start + chunk])
+                ],
+            )
+    return ids
+
+
+def timed(fn: Callable, repeat: int = 5) -> float:
+    """Median wall time of `fn()` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
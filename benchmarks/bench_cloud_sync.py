@@ -0,0 +1,47 @@
+# benchmarks/bench_cloud_sync.py
+"""
+Cloud sync throughput (profiles/sec) against the local stand-in server,
+for several batch sizes. Every profile is the raw Voyager fixture, so body
+sizes are realistic; the server runs in-process on 127.0.0.1.
+
+    python -m benchmarks.bench_cloud_sync --profiles 2000 --batch-sizes 1 10 50 200 1000
+"""
+import argparse
+import json
+import time
+
+from benchmarks.sync_server import SyncServer
+from linkedin.api.cloud_sync import HttpSyncBackend, encode_ndjson_gzip
+from linkedin.conf import FIXTURE_PROFILES_DIR
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=2000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 50, 200, 1000])
+    args = parser.parse_args()
+
+    with open(FIXTURE_PROFILES_DIR / "linkedin_profile.json", encoding="utf-8") as f:
+        raw = json.load(f)
+    profiles = [dict(raw, public_identifier=f"lead-{i}") for i in range(args.profiles)]
+
+    raw_size = len(json.dumps(raw).encode())
+    gz_size = len(encode_ndjson_gzip([raw])[0])
+    print(f"{args.profiles:,} profiles │ {raw_size / 1024:,.0f} KB raw → {gz_size / 1024:,.0f} KB gzip each")
+    print(f"{'batch':>6} │ {'requests':>8} │ {'profiles/s':>10} │ {'MB sent':>8}")
+
+    for batch_size in args.batch_sizes:
+        with SyncServer() as server:
+            backend = HttpSyncBackend(server.url)
+            started = time.perf_counter()
+            for i in range(0, len(profiles), batch_size):
+                assert backend.send(profiles[i:i + batch_size])
+            elapsed = time.perf_counter() - started
+            backend.close()
+            assert server.profiles_received == len(profiles)
+        print(f"{batch_size:>6} │ {server.requests:>8,} │ {len(profiles) / elapsed:>10,.0f} │ "
+              f"{backend.bytes_sent / 2**20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# benchmarks/bench_commit_latency.py
+"""
+Per-commit latency of set_profile_state under each SQLite storage profile.
+
+    python -m benchmarks.bench_commit_latency --commits 500
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from linkedin.db.engine import Database, STORAGE_PROFILES
+from linkedin.db.profiles import set_profile_state
+from linkedin.navigation.enums import ProfileState
+
+
+class _Session:
+    def __init__(self, db: Database):
+        self.db_session = db.get_session()
+
+
+def bench(profile: str, workdir: Path, commits: int) -> list[float]:
+    db = Database(str(workdir / f"{profile}.db"), storage_profile=profile)
+    session = _Session(db)
+    states = [ProfileState.ENRICHED.value, ProfileState.PENDING.value]
+
+    samples = []
+    for i in range(commits):
+        started = time.perf_counter()
+        set_profile_state(session, f"lead-{i % 50}", states[i % 2])
+        samples.append((time.perf_counter() - started) * 1000)
+
+    session.db_session.close()
+    db.engine.dispose()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commits", type=int, default=500)
+    parser.add_argument("--profiles", nargs="+", default=list(STORAGE_PROFILES))
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} │ {'median ms':>10} │ {'p95 ms':>8} │ {'commits/s':>10}")
+    print("─" * 48)
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in args.profiles:
+            samples = bench(profile, Path(tmp), args.commits)
+            p95 = statistics.quantiles(samples, n=20)[-1]
+            print(f"{profile:<10} │ {statistics.median(samples):>10.3f} │ {p95:>8.3f} │ "
+                  f"{len(samples) / (sum(samples) / 1000):>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/bench_csv_ingest.py
+"""
+Loading a large lead CSV: streaming it into SQLite in chunks
+(stage_profiles_csv), a restart on the unchanged file
+(import_profiles_csv hits its cache) and a restart after 1% more rows were
+appended (only the tail is parsed). Each variant runs in its own process so
+peak RSS is comparable.
+
+    python -m benchmarks.bench_csv_ingest --rows 2000000
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from benchmarks._common import BenchSession, public_ids
+from linkedin.csv_launcher import import_profiles_csv, stage_profiles_csv
+from linkedin.db.migrations import ensure_schema
+
+VARIANTS = ["staged", "restart", "append"]
+
+
+def write_csv(path: Path, rows: int):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("name,url,company\n")
+        for i, pid in enumerate(public_ids(rows)):
+            # ~5% duplicates, like a merged export
+            pid = pid if i % 20 else f"dup-{i % 1000}"
+            f.write(f"Lead {i},https://www.linkedin.com/in/{pid}/,Acme {i % 97}\n")
+
+
+def run_variant(csv: Path, db: Path, variant: str):
+    if variant in ("restart", "append"):
+        engine = create_engine(f"sqlite:///{db}")
+        ensure_schema(engine)
+        import_profiles_csv(BenchSession(engine), csv)
+    if variant == "append":
+        with open(csv, encoding="utf-8") as f:
+            rows = sum(1 for _ in f) - 1
+        with open(csv, "a", encoding="utf-8") as f:
+            for pid in public_ids(max(rows // 100, 1), seed=7):
+                f.write(f"New lead,https://www.linkedin.com/in/{pid}/,Acme\n")
+
+    started = time.perf_counter()
+    if variant == "staged":
+        engine = create_engine(f"sqlite:///{db}")
+        ensure_schema(engine)
+        count = stage_profiles_csv(BenchSession(engine), csv)
+    else:
+        count = import_profiles_csv(BenchSession(engine), csv)
+    elapsed = time.perf_counter() - started
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"seconds": elapsed, "rows": count, "peak_rss_mb": rss}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--variant", help=argparse.SUPPRESS)
+    parser.add_argument("--csv", help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(Path(args.csv), Path(args.db), args.variant)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = Path(tmp) / "leads.csv"
+        write_csv(csv, args.rows)
+        print(f"{args.rows:,} rows │ CSV {csv.stat().st_size / 2**20:,.0f} MB")
+        for variant in VARIANTS:
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_csv_ingest", "--variant", variant,
+                 "--csv", str(csv), "--db", str(Path(tmp) / f"{variant}.db")],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            print(f"{variant:<10} │ {result['seconds']:7.3f}s │ {result['rows']:>10,} leads │ "
+                  f"peak RSS {result['peak_rss_mb']:6.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# benchmarks/bench_data_codec.py
+"""
+Raw Voyager `data` column: plain JSON text (old) vs CompressedJSON (orjson + zlib).
+Replicates tests/fixtures/profiles/linkedin_profile.json --rows times.
+
+    python -m benchmarks.bench_data_codec --rows 5000
+"""
+import argparse
+import copy
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import JSON, Column, MetaData, String, Table, create_engine, insert, select
+
+from linkedin.conf import FIXTURE_PROFILES_DIR
+from linkedin.db.types import CompressedJSON, decode_json_blob, encode_json_blob
+
+
+def _payloads(rows: int) -> list[dict]:
+    with open(FIXTURE_PROFILES_DIR / "linkedin_profile.json", encoding="utf-8") as f:
+        template = json.load(f)
+    payloads = []
+    for i in range(rows):
+        payload = copy.deepcopy(template)
+        payload["data"]["entityUrn"] = f"urn:li:collectionResponse:{i}"
+        payloads.append(payload)
+    return payloads
+
+
+def _per_sec(count: int, fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - started)
+
+
+def _db_roundtrip(workdir: Path, column_type, payloads: list[dict]) -> tuple[float, float, int]:
+    path = workdir / f"{column_type.__name__}.db"
+    engine = create_engine(f"sqlite:///{path}")
+    table = Table("profiles", MetaData(), Column("public_identifier", String, primary_key=True),
+                  Column("data", column_type))
+    table.create(engine)
+
+    rows = [{"public_identifier": f"p{i}", "data": p} for i, p in enumerate(payloads)]
+    with engine.begin() as conn:
+        write = _per_sec(len(rows), lambda: conn.execute(insert(table), rows))
+    with engine.connect() as conn:
+        read = _per_sec(len(rows), lambda: conn.execute(select(table.c.data)).all())
+    engine.dispose()
+    return write, read, os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000)
+    args = parser.parse_args()
+
+    payloads = _payloads(args.rows)
+    sample = payloads[0]
+    plain, blob = json.dumps(sample).encode(), encode_json_blob(sample)
+    print(f"Per row: JSON text {len(plain):,} B → compressed {len(blob):,} B ({len(plain) / len(blob):.1f}x smaller)")
+
+    n = min(args.rows, 2_000)
+    enc_old = _per_sec(n, lambda: [json.dumps(p) for p in payloads[:n]])
+    enc_new = _per_sec(n, lambda: [encode_json_blob(p) for p in payloads[:n]])
+    texts, blobs = [json.dumps(p) for p in payloads[:n]], [encode_json_blob(p) for p in payloads[:n]]
+    dec_old = _per_sec(n, lambda: [json.loads(t) for t in texts])
+    dec_new = _per_sec(n, lambda: [decode_json_blob(b) for b in blobs])
+    print(f"Encode: json {enc_old:,.0f}/s │ CompressedJSON {enc_new:,.0f}/s ({enc_new / enc_old:.1f}x)")
+    print(f"Decode: json {dec_old:,.0f}/s │ CompressedJSON {dec_new:,.0f}/s ({dec_new / dec_old:.1f}x)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for column_type in (JSON, CompressedJSON):
+            write, read, size = _db_roundtrip(Path(tmp), column_type, payloads)
+            print(f"{column_type.__name__:<15} {args.rows:,} rows │ DB {size / 2**20:7.1f} MB │ "
+                  f"insert {write:8,.0f} rows/s │ load {read:8,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
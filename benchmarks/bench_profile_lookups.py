@@ -0,0 +1,88 @@
+# benchmarks/bench_profile_lookups.py
+"""
+Per-row lookup cost of the campaign loop: full ORM row with the raw `data` blob
+(old get_profile) vs the (state, profile) projection used now.
+Each variant runs in its own process so peak RSS is comparable.
+
+    python -m benchmarks.bench_profile_lookups --rows 100000
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import undefer
+
+from benchmarks._common import BenchSession, public_ids
+from linkedin.api.voyager import parse_linkedin_voyager_response
+from linkedin.conf import FIXTURE_PROFILES_DIR
+from linkedin.db.migrations import ensure_schema
+from linkedin.db.models import Profile
+from linkedin.db.profiles import get_state_and_profile
+from linkedin.db.types import dumps_json, encode_json_blob
+
+VARIANTS = {
+    "full row + data": lambda s, pid: s.db_session.query(Profile).options(undefer(Profile.data))
+    .filter_by(public_identifier=pid).first(),
+    "state+profile": get_state_and_profile,
+}
+
+
+def build_db(path: Path, rows: int):
+    with open(FIXTURE_PROFILES_DIR / "linkedin_profile.json", encoding="utf-8") as f:
+        raw = json.load(f)
+    blob, parsed = encode_json_blob(raw), dumps_json(parse_linkedin_voyager_response(raw)).decode()
+
+    engine = create_engine(f"sqlite:///{path}")
+    ensure_schema(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO profiles (public_identifier, state, profile, data) VALUES (:pid, 'completed', :p, :d)"),
+            [{"pid": pid, "p": parsed, "d": blob} for pid in public_ids(rows)],
+        )
+    engine.dispose()
+
+
+def run_variant(path: Path, rows: int, variant: str):
+    session = BenchSession(create_engine(f"sqlite:///{path}"))
+    lookup = VARIANTS[variant]
+    started = time.perf_counter()
+    for pid in public_ids(rows):
+        lookup(session, pid)
+    elapsed = time.perf_counter() - started
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"us_per_row": elapsed / rows * 1e6, "peak_rss_mb": rss}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--variant", help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(Path(args.db), args.rows, args.variant)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "lookups.db"
+        build_db(db, args.rows)
+        print(f"{args.rows:,} profiles │ DB {db.stat().st_size / 2**20:,.0f} MB")
+        for variant in VARIANTS:
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_profile_lookups",
+                 "--rows", str(args.rows), "--variant", variant, "--db", str(db)],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            print(f"{variant:<16} │ {result['us_per_row']:8.1f} µs/row │ peak RSS {result['peak_rss_mb']:6.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
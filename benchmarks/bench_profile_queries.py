@@ -0,0 +1,76 @@
+# benchmarks/bench_profile_queries.py
+"""
+Hot-path profile queries before / after the schema migrations add indexes.
+
+    python -m benchmarks.bench_profile_queries --sizes 10000 100000 1000000
+"""
+import argparse
+import random
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select, text
+
+from benchmarks._common import BenchSession, seed_profiles, timed
+from linkedin.db.engine import _unsynced
+from linkedin.db.migrations import ensure_schema, run_migrations
+from linkedin.db.models import Profile
+from linkedin.db.profiles import count_pending_scrape, get_next_url_to_scrape, get_profile_states
+
+
+def _queries(session, sample_ids):
+    return {
+        "get_next_url_to_scrape": lambda: get_next_url_to_scrape(session, limit=5),
+        "count_pending_scrape": lambda: count_pending_scrape(session),
+        "get_profile_states(500)": lambda: get_profile_states(session, sample_ids),
+        "unsynced backlog": lambda: session.db_session.execute(
+            _unsynced(select(func.count()).select_from(Profile))
+        ).scalar(),
+    }
+
+
+def bench(size: int, workdir: Path, repeat: int) -> dict:
+    engine = create_engine(f"sqlite:///{workdir / f'profiles_{size}.db'}")
+    ensure_schema(engine)
+
+    # Start from the pre-migration layout: no secondary indexes, version 0
+    with engine.begin() as conn:
+        for ix in Profile.__table__.indexes:
+            conn.execute(text(f"DROP INDEX IF EXISTS {ix.name}"))
+        conn.execute(text("DELETE FROM schema_version"))
+
+    ids = seed_profiles(engine, size)
+    sample_ids = random.Random(7).sample(ids, 500)
+    session = BenchSession(engine)
+
+    before = {name: timed(fn, repeat) for name, fn in _queries(session, sample_ids).items()}
+    session.db_session.close()
+
+    run_migrations(engine)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+    session = BenchSession(engine)
+    after = {name: timed(fn, repeat) for name, fn in _queries(session, sample_ids).items()}
+    session.db_session.close()
+    engine.dispose()
+
+    return {name: (before[name], after[name]) for name in before}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} │ {'query':<24} │ {'before ms':>10} │ {'after ms':>10} │ {'speed-up':>8}")
+    print("─" * 74)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            for name, (before, after) in bench(size, Path(tmp), args.repeat).items():
+                print(f"{size:>10,} │ {name:<24} │ {before:>10.2f} │ {after:>10.2f} │ {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# benchmarks/bench_reparse.py
+"""
+Offline re-parse of stored Voyager payloads (reparse_profiles): profiles/s in
+one process vs a process pool. Every row holds the fixture payload with a
+stale parsed profile, so each one is decoded, parsed and written back.
+
+    python -m benchmarks.bench_reparse --rows 20000 --workers 4
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from benchmarks._common import BenchSession, public_ids
+from linkedin.db.migrations import ensure_schema
+from linkedin.db.reparse import reparse_profiles
+from linkedin.db.types import encode_json_blob
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "profiles" / "linkedin_profile.json"
+
+
+def build_db(path: Path, rows: int):
+    engine = create_engine(f"sqlite:///{path}")
+    ensure_schema(engine)
+    blob = encode_json_blob(json.loads(FIXTURE.read_text(encoding="utf-8")))
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO profiles (public_identifier, state, profile, data) VALUES (:pid, 'enriched', '{}', :data)"),
+            [{"pid": pid, "data": blob} for pid in public_ids(rows)],
+        )
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = None
+        for workers in sorted({1, args.workers}):
+            engine = build_db(Path(tmp) / f"reparse-{workers}.db", args.rows)
+            started = time.perf_counter()
+            run = reparse_profiles(BenchSession(engine), workers=workers)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(f"{workers} worker(s) │ {elapsed:6.2f}s │ {run.processed / elapsed:>8,.0f} profiles/s │ "
+                  f"{run.changed:,} changed │ {baseline / elapsed:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
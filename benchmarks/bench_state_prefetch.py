@@ -0,0 +1,79 @@
+# benchmarks/bench_state_prefetch.py
+"""
+Scanning a mature campaign (90% of leads COMPLETED / FAILED): one state lookup
+per lead, as process_profile_row does before returning on finished leads, vs
+iter_campaign_leads dropping them from its prefetched page states.
+
+    python -m benchmarks.bench_state_prefetch --leads 200000
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from benchmarks._common import BenchSession, public_ids
+from linkedin.db.leads import TERMINAL_STATES, build_campaign_queue, iter_campaign_leads, stage_leads
+from linkedin.db.migrations import ensure_schema
+from linkedin.db.models import CampaignLead, CampaignQueue
+from linkedin.db.profiles import get_state_and_profile
+from linkedin.navigation.enums import ProfileState
+
+
+def build_db(path: Path, leads: int) -> BenchSession:
+    engine = create_engine(f"sqlite:///{path}")
+    ensure_schema(engine)
+    rnd = random.Random(7)
+    ids = public_ids(leads)
+    open_states = [ProfileState.ENRICHED.value, ProfileState.PENDING.value, ProfileState.CONNECTED.value]
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO profiles (public_identifier, state, profile) VALUES (:pid, :state, '{}')"),
+            [
+                {"pid": pid, "state": rnd.choice(sorted(TERMINAL_STATES)) if rnd.random() < 0.9
+                 else rnd.choice(open_states)}
+                for pid in ids
+            ],
+        )
+    session = BenchSession(engine)
+    stage_leads(session, [{"public_identifier": pid, "url": f"https://www.linkedin.com/in/{pid}/"} for pid in ids])
+    return session
+
+
+def per_row_lookups(session) -> int:
+    build_campaign_queue(session)
+    rows = session.db_session.query(CampaignQueue.public_identifier, CampaignLead.url) \
+        .join(CampaignLead, (CampaignLead.source == CampaignQueue.source)
+              & (CampaignLead.public_identifier == CampaignQueue.public_identifier)) \
+        .order_by(CampaignQueue.position).yield_per(500)
+    todo = 0
+    for public_identifier, _ in rows:
+        state, _ = get_state_and_profile(session, public_identifier)
+        todo += state not in TERMINAL_STATES
+    return todo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leads", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = build_db(Path(tmp) / "mature.db", args.leads)
+        print(f"{args.leads:,} leads, ~90% finished")
+
+        started = time.perf_counter()
+        todo = per_row_lookups(session)
+        baseline = time.perf_counter() - started
+        print(f"per-row state lookups │ {baseline:6.2f}s │ {todo:,} leads to work on")
+
+        started = time.perf_counter()
+        todo = sum(1 for _ in iter_campaign_leads(session))
+        elapsed = time.perf_counter() - started
+        print(f"prefetched page states│ {elapsed:6.2f}s │ {todo:,} leads to work on │ {baseline / elapsed:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_voyager_extract.py
+"""
+Decoding a Voyager profile response: the whole tree (`json.loads`, what
+`res.json()` did) vs `extract_entities`, which keeps only the entity types the
+parser reads. Peak Python heap (tracemalloc) and time per decode, on the
+fixture and on the fixture padded with `--padding` extra copies of every
+discarded entity (skills, media, publications, ... as in long profiles).
+
+    python -m benchmarks.bench_voyager_extract --padding 20
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from linkedin.api.voyager import PARSED_ENTITY_TYPES, extract_entities, parse_linkedin_voyager_response
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "profiles" / "linkedin_profile.json"
+
+
+def padded(raw: bytes, copies: int) -> bytes:
+    response = json.loads(raw)
+    extra = [e for e in response["included"] if e.get("$type") not in PARSED_ENTITY_TYPES]
+    for i in range(copies):
+        response["included"] += [{**e, "entityUrn": f"{e.get('entityUrn')}:{i}"} for e in extra]
+    return json.dumps(response, ensure_ascii=False).encode("utf-8")
+
+
+def measure(fn, raw: bytes, repeat: int = 50):
+    tracemalloc.start()
+    result = fn(raw)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(raw)
+    return peak, (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--padding", type=int, default=20)
+    args = parser.parse_args()
+
+    fixture = FIXTURE.read_bytes()
+    for label, raw in (("fixture", fixture), (f"fixture + {args.padding}× padding", padded(fixture, args.padding))):
+        full, slim = json.loads(raw), extract_entities(raw)
+        assert parse_linkedin_voyager_response(slim) == parse_linkedin_voyager_response(full)
+        print(f"{label}: {len(raw) / 1024:,.0f} KB, kept {len(slim['included'])}/{len(full['included'])} entities")
+
+        baseline = None
+        for name, fn in (("json.loads", json.loads), ("extract_entities", extract_entities)):
+            peak, seconds = measure(fn, raw)
+            baseline = baseline or peak
+            print(f"  {name:<17} │ peak {peak / 1024:8,.0f} KB ({peak / baseline:4.0%}) │ {seconds * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
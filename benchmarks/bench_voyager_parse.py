@@ -0,0 +1,140 @@
+# benchmarks/bench_voyager_parse.py
+"""
+Voyager profile parsing, parses/sec on the test fixture: the previous
+implementation (two scans of `included`, nested dataclasses, `asdict` deep
+copy — reproduced below) vs the single-pass `parse_linkedin_voyager_response`,
+with and without dataclass validation. Outputs are checked to serialize
+identically.
+
+    python -m benchmarks.bench_voyager_parse --seconds 3
+"""
+import argparse
+import json
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from linkedin.api.voyager import (
+    PROFILE_TYPE,
+    Date,
+    DateRange,
+    Education,
+    LinkedInProfile,
+    Position,
+    _extract_connection_info,
+    _resolve_star_field,
+    parse_linkedin_voyager_response,
+)
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "profiles" / "linkedin_profile.json"
+
+
+def _legacy_date_range(raw):
+    if not raw:
+        return None
+    start, end = raw.get("start"), raw.get("end")
+    return DateRange(
+        start=Date(year=start.get("year"), month=start.get("month")) if start else None,
+        end=Date(year=end.get("year"), month=end.get("month")) if end else None,
+    )
+
+
+def legacy_parse(json_response, public_identifier=None):
+    urn_map = {e.get("entityUrn"): e for e in json_response.get("included", []) if e.get("entityUrn")}
+    profile_entity = None
+    for entity in json_response.get("included", []):
+        if entity.get("$type") == PROFILE_TYPE:
+            if public_identifier is None or entity.get("publicIdentifier") == public_identifier:
+                profile_entity = entity
+                break
+    if not profile_entity:
+        profile_entity = urn_map.get(json_response.get("data", {}).get("*elements", [None])[0])
+    if not profile_entity:
+        raise ValueError("Could not find profile entity in the Voyager response")
+
+    first_name, last_name = profile_entity.get("firstName", ""), profile_entity.get("lastName", "")
+    distance, degree, pending = _extract_connection_info(profile_entity, urn_map)
+
+    positions = []
+    groups = urn_map.get(profile_entity.get("*profilePositionGroups")) or {}
+    for group_urn in groups.get("*elements") or []:
+        group = urn_map.get(group_urn) or {}
+        for pos_urn in (urn_map.get(group.get("*profilePositionInPositionGroup")) or {}).get("*elements") or []:
+            pos = urn_map.get(pos_urn)
+            if pos:
+                company = _resolve_star_field(pos, urn_map, "*company")
+                positions.append(Position(
+                    title=pos.get("title") or "Unknown Title",
+                    company_name=company.get("name") if company else pos.get("companyName", "Unknown Company"),
+                    company_urn=company.get("entityUrn") if company else pos.get("companyUrn"),
+                    location=pos.get("locationName"),
+                    date_range=_legacy_date_range(pos.get("dateRange")),
+                    description=pos.get("description"),
+                    urn=pos.get("entityUrn"),
+                ))
+
+    educations = []
+    for edu_urn in (urn_map.get(profile_entity.get("*profileEducations")) or {}).get("*elements") or []:
+        edu = urn_map.get(edu_urn)
+        if edu:
+            school = _resolve_star_field(edu, urn_map, "*school")
+            educations.append(Education(
+                school_name=school.get("name") if school else edu.get("schoolName", "Unknown School"),
+                degree_name=edu.get("degreeName"),
+                field_of_study=edu.get("fieldOfStudy"),
+                date_range=_legacy_date_range(edu.get("dateRange")),
+                urn=edu.get("entityUrn"),
+            ))
+
+    return asdict(LinkedInProfile(
+        urn=profile_entity["entityUrn"],
+        first_name=first_name,
+        last_name=last_name,
+        full_name=f"{first_name} {last_name}".strip() or None,
+        headline=profile_entity.get("headline"),
+        summary=profile_entity.get("summary"),
+        public_identifier=profile_entity.get("publicIdentifier"),
+        location_name=profile_entity.get("locationName"),
+        geo=_resolve_star_field(profile_entity, urn_map, "*geo"),
+        industry=_resolve_star_field(profile_entity, urn_map, "*industry"),
+        url=f"https://www.linkedin.com/in/{profile_entity.get('publicIdentifier', '')}/",
+        positions=positions,
+        educations=educations,
+        connection_distance=distance,
+        connection_degree=degree,
+        invitation_pending=pending,
+    ))
+
+
+def parses_per_second(fn, data, seconds: float) -> float:
+    count, started = 0, time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < seconds:
+        for _ in range(100):
+            fn(data)
+        count += 100
+    return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=3.0, help="time spent per variant")
+    args = parser.parse_args()
+
+    data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    variants = {
+        "legacy (dataclasses + asdict)": legacy_parse,
+        "single pass": parse_linkedin_voyager_response,
+        "single pass + validate": lambda d: parse_linkedin_voyager_response(d, validate=True),
+    }
+
+    reference = json.dumps(legacy_parse(data), ensure_ascii=False)
+    baseline = None
+    for name, fn in variants.items():
+        assert json.dumps(fn(data), ensure_ascii=False) == reference, f"{name} output differs"
+        rate = parses_per_second(fn, data, args.seconds)
+        baseline = baseline or rate
+        print(f"{name:<30} │ {rate:>10,.0f} parses/s │ {rate / baseline:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
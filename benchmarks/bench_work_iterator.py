@@ -0,0 +1,83 @@
+# benchmarks/bench_work_iterator.py
+"""
+Feeding the campaign loop: the whole sorted list of dicts up front
+(get_staged_profiles) vs the lazy keyset
+iterator over the run-start queue (iter_campaign_leads). Each variant runs in
+its own process; peak RSS is measured while walking every lead.
+
+    python -m benchmarks.bench_work_iterator --leads 1000000
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from benchmarks._common import BenchSession, public_ids, seed_profiles
+from linkedin.db.leads import get_staged_profiles, iter_campaign_leads, stage_leads
+from linkedin.db.migrations import ensure_schema
+
+VARIANTS = {
+    "list of dicts": get_staged_profiles,
+    "lazy iterator": iter_campaign_leads,
+}
+
+
+def build_db(path: Path, leads: int):
+    engine = create_engine(f"sqlite:///{path}")
+    ensure_schema(engine)
+    seed_profiles(engine, leads // 3)  # a third of the leads were already worked on
+    session = BenchSession(engine)
+    ids = public_ids(leads)
+    for start in range(0, leads, 50_000):
+        stage_leads(session, [
+            {"public_identifier": pid, "url": f"https://www.linkedin.com/in/{pid}/"}
+            for pid in ids[start:start + 50_000]
+        ])
+    engine.dispose()
+
+
+def run_variant(path: Path, variant: str):
+    session = BenchSession(create_engine(f"sqlite:///{path}"))
+    started = time.perf_counter()
+    first_at, count = None, 0
+    for _ in VARIANTS[variant](session):
+        first_at = first_at or time.perf_counter()
+        count += 1
+    elapsed = time.perf_counter() - started
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"first": first_at - started, "total": elapsed, "count": count, "peak_rss_mb": rss}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leads", type=int, default=1_000_000)
+    parser.add_argument("--variant", help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(Path(args.db), args.variant)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "work.db"
+        build_db(db, args.leads)
+        print(f"{args.leads:,} staged leads")
+        for variant in VARIANTS:
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_work_iterator", "--variant", variant, "--db", str(db)],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            print(f"{variant:<14} │ first lead {r['first']:6.2f}s │ all {r['count']:,} in {r['total']:6.2f}s │ "
+                  f"peak RSS {r['peak_rss_mb']:6.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
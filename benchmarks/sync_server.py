@@ -0,0 +1,108 @@
+# benchmarks/sync_server.py
+"""
+Local stand-in for the CRM sync endpoint, for tests and benchmarks.
+
+Accepts gzip'd NDJSON batches on POST, counts profiles, and drops batches whose
+Idempotency-Key it has already seen. `fail_next` makes the next N requests
+answer 503 (with `retry_after` as their Retry-After header, if set) to
+exercise client retries.
+
+    python -m benchmarks.sync_server [port]
+"""
+import gzip
+import logging
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+
+class SyncServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, host: str = "127.0.0.1"):
+        super().__init__((host, port), _SyncHandler)
+        self.lock = threading.Lock()
+        self.seen_keys: set[str] = set()
+        self.profiles_received = 0
+        self.requests = 0
+        self.duplicates = 0
+        self.fail_next = 0
+        self.retry_after: str | None = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/profiles"
+
+    def start(self) -> "SyncServer":
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, name="sync-server", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _SyncHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so client pooling is measurable
+    server: SyncServer
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.requests += 1
+            if self.server.fail_next:
+                self.server.fail_next -= 1
+                retry_after = {"Retry-After": self.server.retry_after} if self.server.retry_after else {}
+                return self._reply(503, retry_after)
+
+        if self.headers.get("Content-Encoding") == "gzip":
+            try:
+                body = gzip.decompress(body)
+            except OSError:
+                return self._reply(400)
+        profiles = body.count(b"\n")
+
+        key = self.headers.get("Idempotency-Key")
+        with self.server.lock:
+            if key and key in self.server.seen_keys:
+                self.server.duplicates += 1
+            else:
+                if key:
+                    self.server.seen_keys.add(key)
+                self.server.profiles_received += profiles
+        self._reply(200)
+
+    def _reply(self, status: int, headers: dict[str, str] | None = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, fmt, *args):
+        logger.debug("sync-server: " + fmt, *args)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    server = SyncServer(port)
+    logger.info("Sync stand-in listening on %s", server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+        logger.info("Received %s profile(s) in %s request(s)", server.profiles_received, server.requests)
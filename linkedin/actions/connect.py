@@ -1,7 +1,8 @@
 # linkedin/actions/connect.py
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from linkedin.actions.search import search_profile
 from linkedin.navigation.enums import ProfileState
 from linkedin.navigation.exceptions import SkipProfile, ReachedConnectionLimit
 from linkedin.navigation.utils import get_top_card
@@ -25,10 +26,12 @@ SELECTORS = {
 def send_connection_request(
         handle: str,
         profile: Dict[str, Any],
+        fresh: Optional[Dict[str, Any]] = None,
 ) -> ProfileState:
     """
     Sends a LinkedIn connection request WITHOUT a note (fastest & safest).
     All note-sending logic preserved below for future use.
+    `fresh`: the profile as just fetched from the API, reused for the status check.
     """
     from linkedin.actions.connection_status import get_connection_status
 
@@ -39,7 +42,7 @@ def send_connection_request(
     public_identifier = profile.get('public_identifier')
 
     logger.debug("Checking current connection status...")
-    connection_status = get_connection_status(session, profile)
+    connection_status = get_connection_status(session, profile, fresh=fresh)
     logger.info("Current status → %s", connection_status.value)
 
     skip_reasons = {
@@ -51,6 +54,9 @@ def send_connection_request(
         logger.info("Skipping %s – %s", public_identifier, skip_reasons[connection_status])
         return connection_status
 
+    # The status may have come from the API alone — open the profile before clicking
+    search_profile(session, profile)
+
     # Send invitation WITHOUT note (current active flow)
     s1 = _connect_direct(session)
     s2 = s1 or _connect_via_more(session)
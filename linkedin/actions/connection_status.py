@@ -1,10 +1,14 @@
 # linkedin/actions/connection_status.py
 import logging
-from typing import Dict, Any
+from collections import Counter
+from typing import Dict, Any, Optional
 
 from linkedin.actions.search import search_profile
+from linkedin.api.client import PlaywrightLinkedinAPI
 from linkedin.navigation.enums import ProfileState
+from linkedin.navigation.exceptions import AuthenticationError
 from linkedin.navigation.utils import get_top_card
+from linkedin.sessions.account import MAX_API_DELAY, MIN_API_DELAY, human_delay
 
 logger = logging.getLogger(__name__)
 
@@ -13,24 +17,87 @@ SELECTORS = {
     "invite_to_connect": 'button[aria-label*="Invite"][aria-label*="to connect"]:visible',
 }
 
+# How each status check was decided: "api" (relationship from Voyager, no page load) or "ui" (profile page inspected)
+STATUS_CHECK_PATHS: Counter = Counter()
+
 
 def get_connection_status(
         session: "AccountSession",
         profile: Dict[str, Any],
+        fresh: Optional[Dict[str, Any]] = None,
 ) -> ProfileState:
     """
-    Reliably detects connection status using UI inspection.
-    Only trusts degree=1 as CONNECTED. Everything else is verified on the page.
+    API-first connection status.
+
+    The relationship is read fresh from the Voyager API — no navigation. A
+    profile the caller has just fetched from the API can be passed as `fresh`
+    to skip that request. The page is inspected only when the answer is
+    ambiguous (request failed, or neither connected, pending nor clearly open
+    to an invite). Callers that go on to click something must open the profile
+    page themselves.
     """
-    # Ensure browser is ready (safe to call multiple times)
     session.ensure_browser()
+    public_identifier = profile.get("public_identifier")
+
+    if fresh is None:
+        fresh = _fetch_relationship(session, profile)
+    status = _status_from_api(fresh) if fresh else None
+    if status is not None:
+        STATUS_CHECK_PATHS["api"] += 1
+        logger.debug("Connection status from API → %s %s (%s)", public_identifier, status.value, _paths_summary())
+        return status
+
+    STATUS_CHECK_PATHS["ui"] += 1
+    logger.debug("API answer ambiguous for %s → UI inspection (%s)", public_identifier, _paths_summary())
+    return _status_from_ui(session, profile, degree=(fresh or profile).get("connection_degree"))
+
+
+def _paths_summary() -> str:
+    return f"api={STATUS_CHECK_PATHS['api']} ui={STATUS_CHECK_PATHS['ui']}"
+
+
+def _fetch_relationship(session: "AccountSession", profile: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Freshly parsed profile (with connection fields) from the API, or None if it could not be fetched."""
+    # Paced like every other Voyager call: due rechecks would otherwise fire back-to-back
+    human_delay(MIN_API_DELAY, MAX_API_DELAY)
+    try:
+        api = PlaywrightLinkedinAPI(session=session)
+        fresh, _ = api.get_profile(
+            public_identifier=profile.get("public_identifier"),
+            profile_url=profile.get("url"),
+        )
+    except AuthenticationError:
+        raise
+    except Exception as e:
+        logger.debug("Relationship lookup failed for %s → %s", profile.get("public_identifier"), e)
+        return None
+    return fresh
+
+
+def _status_from_api(fresh: Dict[str, Any]) -> Optional[ProfileState]:
+    """Status when the API answer is conclusive, else None."""
+    degree = fresh.get("connection_degree")
+    pending = fresh.get("invitation_pending")
+
+    if degree == 1:
+        return ProfileState.CONNECTED
+    if pending:
+        return ProfileState.PENDING
+    if pending is False and degree in (2, 3):
+        return ProfileState.ENRICHED
+    return None
+
+
+def _status_from_ui(session: "AccountSession", profile: Dict[str, Any], degree: Optional[int]) -> ProfileState:
+    """
+    Detects connection status on the profile page.
+    Only trusts degree=1 as CONNECTED. Everything else is verified on the page.
+    """
     search_profile(session, profile)
     session.wait()
 
     logger.debug("Checking connection status → %s", profile.get("public_identifier"))
 
-    degree = profile.get("connection_degree", None)
-
     # Fast path: API says 1st degree → trust it
     if degree == 1:
         logger.debug("API reports 1st degree → instantly trusted as CONNECTED")
@@ -5,6 +5,7 @@ import sys
 from typing import Dict, Any
 
 from linkedin.actions.connection_status import get_connection_status
+from linkedin.actions.search import search_profile
 from linkedin.navigation.enums import ProfileState, MessageStatus
 from linkedin.navigation.utils import goto_page
 from linkedin.sessions.registry import get_session
@@ -49,6 +50,8 @@ def send_follow_up_message(
         if template_file:
             message = render_template(session, template_file, template_type, profile)
 
+        # The status may have come from the API alone — open the profile before clicking
+        search_profile(session, profile)
         s1 = _send_msg_pop_up(session, profile, message)
         s2 = s1 or _send_message(session, profile, message)
         success = s2
@@ -68,4 +68,4 @@ if __name__ == "__main__":
     from pprint import pprint
 
     pprint(profile)
-    # _save_profile_to_fixture(data, FIXTURE_PATH)
+    # _save_profile_to_fixture(json.loads(data), FIXTURE_PATH)
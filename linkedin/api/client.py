@@ -1,67 +1,133 @@
 # linkedin/api/client.py
 import json
 import logging
-from typing import Optional, Any
+import time
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
-from linkedin.api.voyager import parse_linkedin_voyager_response
+from linkedin.api.voyager import extract_entities, parse_linkedin_voyager_response, parse_many
 from linkedin.db.profiles import url_to_public_id
 from linkedin.navigation.exceptions import AuthenticationError
 
 logger = logging.getLogger(__name__)
 
 
-class PlaywrightLinkedinAPI:
-
-    def __init__(
-            self,
-            session: "AccountSession",
-    ):
-        self.session = session
-        self.page = session.page
-        self.context = session.context
-
-        # Extract cookies from the browser context to get JSESSIONID for csrf-token
-        cookies = self.context.cookies()
-        cookies_dict = {c['name']: c['value'] for c in cookies}
+# Everything the headers need from the browser, in one round-trip
+_BROWSER_HINTS_JS = """() => {
+    const ua = navigator.userAgentData;
+    return {
+        userAgent: navigator.userAgent,
+        acceptLanguage: navigator.languages ? navigator.languages.join(',') : navigator.language,
+        secChUa: ua ? ua.brands.map(brand => `"${brand.brand}";v="${brand.version}"`).join(', ') : '',
+        secChUaMobile: ua ? (ua.mobile ? '?1' : '?0') : '?0',
+        secChUaPlatform: ua ? `"${ua.platform}"` : '',
+    };
+}"""
+
+
+class ApiHeaderCache:
+    """
+    Voyager request headers for one account session, built once and reused by every API call.
+
+    Rebuilding costs a cookie read plus a page evaluate; the result only changes
+    when the browser context is replaced (crash recovery, re-login) or LinkedIn
+    rotates the JSESSIONID cookie the csrf-token comes from, so only the
+    cookie is re-read per use. `referer` is left to the caller — it follows
+    the current page.
+    """
+
+    def __init__(self):
+        self._context = None
+        self._jsessionid = None
+        self._headers: Optional[Dict[str, str]] = None
+
+        # Instrumentation: how often the bundle was built / reused and what building cost
+        self.builds = 0
+        self.hits = 0
+        self.build_seconds = 0.0
+
+    def get(self, context, page) -> Dict[str, str]:
+        cookies_dict = {c['name']: c['value'] for c in context.cookies()}
         jsessionid = cookies_dict.get('JSESSIONID', '').strip('"')
 
-        # Dynamically fetch browser-specific details using page.evaluate
-        user_agent = self.page.evaluate("navigator.userAgent")
-        accept_language = self.page.evaluate("navigator.languages ? navigator.languages.join(',') : navigator.language")
-        sec_ch_ua = self.page.evaluate("""() => {
-            if (navigator.userAgentData) {
-                return navigator.userAgentData.brands.map(brand => `"${brand.brand}";v="${brand.version}"`).join(', ');
-            }
-            return '';
-        }""")
-        sec_ch_ua_mobile = self.page.evaluate(
-            """() => navigator.userAgentData ? (navigator.userAgentData.mobile ? '?1' : '?0') : '?0' """)
-        sec_ch_ua_platform = self.page.evaluate(
-            """() => navigator.userAgentData ? `"${navigator.userAgentData.platform}"` : '' """)
-
-        # Set up headers with dynamic values
-        self.headers = {
+        if self._headers is not None and context is self._context and jsessionid == self._jsessionid:
+            self.hits += 1
+            return self._headers
+
+        started = time.perf_counter()
+        hints = page.evaluate(_BROWSER_HINTS_JS)
+        self._headers = {
             'accept': 'application/vnd.linkedin.normalized+json+2.1',
-            'accept-language': accept_language,
+            'accept-language': hints['acceptLanguage'],
             'csrf-token': jsessionid,
             'priority': 'u=1, i',
-            'referer': self.page.url,
             'sec-ch-prefers-color-scheme': 'light',
-            'sec-ch-ua': sec_ch_ua,
-            'sec-ch-ua-mobile': sec_ch_ua_mobile,
-            'sec-ch-ua-platform': sec_ch_ua_platform,
+            'sec-ch-ua': hints['secChUa'],
+            'sec-ch-ua-mobile': hints['secChUaMobile'],
+            'sec-ch-ua-platform': hints['secChUaPlatform'],
             'sec-fetch-dest': 'empty',
             'sec-fetch-mode': 'cors',
             'sec-fetch-site': 'same-origin',
-            'user-agent': user_agent,
+            'user-agent': hints['userAgent'],
             'x-li-lang': 'en_US',
             'x-restli-protocol-version': '2.0.0',
         }
+        self._context, self._jsessionid = context, jsessionid
+        self.builds += 1
+        self.build_seconds += time.perf_counter() - started
+        logger.debug("API headers (re)built → %d build(s), %d reuse(s)", self.builds, self.hits)
+        return self._headers
+
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated time not spent rebuilding: reuses × mean build cost."""
+        return self.hits * self.build_seconds / self.builds if self.builds else 0.0
+
+
+class PlaywrightLinkedinAPI:
+
+    def __init__(
+            self,
+            session: "AccountSession",
+    ):
+        self.session = session
+        self.page = session.page
+        self.context = session.context
+
+        # Shared per account session; a bare session object just gets a throwaway cache
+        cache = getattr(session, "api_headers", None) or ApiHeaderCache()
+        self.headers = {**cache.get(self.context, self.page), 'referer': self.page.url}
 
     def get_profile(
             self, public_identifier: Optional[str] = None, profile_url: Optional[str] = None
-    ) -> tuple[None, None] | tuple[dict, Any]:
+    ) -> tuple[None, None] | tuple[dict, bytes]:
+        public_identifier, raw = self._fetch_profile(public_identifier, profile_url)
+        if raw is None:
+            return None, None
+
+        # Parse from a slim decode of just the entities the parser reads; the raw bytes
+        # are returned untouched and archived as-is (no re-serialization)
+        extracted_info = parse_linkedin_voyager_response(extract_entities(raw), public_identifier=public_identifier)
+        return extracted_info, raw
+
+    def get_profiles(
+            self, public_identifier: Optional[str] = None, profile_url: Optional[str] = None
+    ) -> tuple[List[dict], Optional[bytes]]:
+        """
+        Like `get_profile`, but returns every member profile embedded in the
+        response (`parse_many`). The first one is the requested member, picked
+        exactly as `get_profile` picks it; the rest are embedded members only.
+        """
+        public_identifier, raw = self._fetch_profile(public_identifier, profile_url)
+        if raw is None:
+            return [], None
+
+        return parse_many(extract_entities(raw), public_identifier=public_identifier), raw
+
+    def _fetch_profile(
+            self, public_identifier: Optional[str], profile_url: Optional[str]
+    ) -> tuple[str, Optional[bytes]]:
+        """(public_identifier, raw response body), body None when the profile is inaccessible."""
         if not public_identifier and profile_url:
             public_identifier = url_to_public_id(profile_url)
 
@@ -89,13 +155,11 @@ class PlaywrightLinkedinAPI:
                 logger.info("Profile inaccessible → private / deleted / restricted → %s (HTTP %d)",
                            public_identifier, res.status)
                 logger.debug(f"Body: {json.dumps(res.json(), indent=2)}")
-                return None, None
+                return public_identifier, None
 
         if not res.ok:
             body_str = res.body().decode("utf-8", errors="ignore") if isinstance(res.body(), bytes) else str(res.body())
             logger.error("API request failed → %s | Status: %s", public_identifier, res.status)
             raise Exception(f"LinkedIn API error {res.status}: {body_str[:500]}")
 
-        data = res.json()
-        extracted_info = parse_linkedin_voyager_response(data, public_identifier=public_identifier)
-        return extracted_info, data
\ No newline at end of file
+        return public_identifier, res.body()
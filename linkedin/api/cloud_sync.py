@@ -1,9 +1,195 @@
-# linkedin/api/logging.py
+# linkedin/api/cloud_sync.py
+"""
+Ships enriched profiles to the CRM.
+
+`sync_profiles(batch)` delegates to the process-wide backend:
+
+- `NullBackend` when `CLOUD_SYNC_URL` is unset — accepts everything, sends nothing
+- `HttpSyncBackend` otherwise — one gzip'd NDJSON POST per batch
+
+Try it locally against the stand-in server:
+
+    python -m benchmarks.sync_server 8765
+    CLOUD_SYNC_URL=http://127.0.0.1:8765/profiles python main.py
+"""
+import gzip
+import hashlib
 import logging
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from linkedin.db.types import dumps_json
 
 logger = logging.getLogger(__name__)
 
+RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class SyncBackend(ABC):
+    """Interface: `send()` returns True only when the whole batch was accepted."""
+
+    @abstractmethod
+    def send(self, batch: list[dict]) -> bool:
+        ...
+
+    def close(self):
+        pass
+
+
+class NullBackend(SyncBackend):
+    def send(self, batch: list[dict]) -> bool:
+        return True
+
+
+def encode_ndjson_gzip(batch: list[dict], level: int = 5) -> tuple[bytes, str]:
+    """One JSON object per line, gzip'd. Returns (body, idempotency key of the uncompressed body)."""
+    raw = b"\n".join(dumps_json(item) for item in batch) + b"\n"
+    return gzip.compress(raw, compresslevel=level), hashlib.sha256(raw).hexdigest()
+
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """The server's `Retry-After` (delay in seconds or an HTTP date) as seconds from now, or None if absent/invalid."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HttpSyncBackend(SyncBackend):
+    """
+    POSTs each batch as gzip'd NDJSON over a pooled keep-alive session.
+
+    The `Idempotency-Key` header is the SHA-256 of the uncompressed body, so a
+    retried (or re-sent after a crash) batch carries the same key and the
+    server can drop the duplicate. Connection errors, timeouts and
+    408/425/429/5xx are retried up to `max_retries` times with full-jitter
+    exponential backoff, or after the server's `Retry-After` when it sends one
+    (capped at `backoff_cap`); any other non-2xx fails the batch immediately.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            token: Optional[str] = None,
+            timeout: float = 30.0,
+            max_retries: int = 4,
+            backoff_base: float = 0.5,
+            backoff_cap: float = 30.0,
+            pool_size: int = 4,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        self.http.headers.update({
+            "Content-Type": "application/x-ndjson",
+            "Content-Encoding": "gzip",
+        })
+        if token:
+            self.http.headers["Authorization"] = f"Bearer {token}"
+
+        # Stats
+        self.batches_sent = 0
+        self.retries = 0
+        self.bytes_sent = 0
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def send(self, batch: list[dict]) -> bool:
+        if not batch:
+            return True
+
+        body, key = encode_ndjson_gzip(batch)
+        headers = {"Idempotency-Key": key}
+
+        retry_after = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.retries += 1
+                time.sleep(self._backoff(attempt - 1) if retry_after is None else min(self.backoff_cap, retry_after))
+                retry_after = None
+            try:
+                response = self.http.post(self.url, data=body, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                logger.warning("Cloud sync attempt %d/%d failed: %s", attempt + 1, self.max_retries + 1, e)
+                continue
+
+            self.bytes_sent += len(body)
+            if response.ok:
+                self.batches_sent += 1
+                logger.debug("Cloud sync → %d profile(s), %d bytes", len(batch), len(body))
+                return True
+            if response.status_code not in RETRYABLE_STATUSES:
+                logger.error("Cloud sync rejected batch: HTTP %s %s", response.status_code, response.text[:200])
+                return False
+            retry_after = retry_after_seconds(response)
+            logger.warning("Cloud sync attempt %d/%d → HTTP %s%s",
+                           attempt + 1, self.max_retries + 1, response.status_code,
+                           "" if retry_after is None else f" (Retry-After {retry_after:.0f}s)")
+
+        logger.error("Cloud sync gave up after %d attempt(s)", self.max_retries + 1)
+        return False
+
+    def close(self):
+        self.http.close()
+
+
+_backend: Optional[SyncBackend] = None
+# The CloudSyncWorker thread and the main thread both sync: build the backend only once
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> SyncBackend:
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                from linkedin.conf import CLOUD_SYNC_URL, CLOUD_SYNC_TOKEN
+                _backend = HttpSyncBackend(CLOUD_SYNC_URL, token=CLOUD_SYNC_TOKEN) if CLOUD_SYNC_URL else NullBackend()
+                logger.debug("Cloud sync backend → %s", type(_backend).__name__)
+    return _backend
+
+
+def set_backend(backend: Optional[SyncBackend]):
+    """Swap the process-wide backend (tests, benchmarks). None → rebuild from config on next use."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+def close_backend():
+    """Close the process-wide backend (its pooled connections); the next sync builds a new one."""
+    global _backend
+    with _backend_lock:
+        backend, _backend = _backend, None
+    if backend is not None:
+        backend.close()
+
 
-def sync_profiles(data: list[dict]):
-    # logger.debug(f"Logging {len(data)} profiles.")
-    return True
+def sync_profiles(data: list[dict]) -> bool:
+    return get_backend().send(data)
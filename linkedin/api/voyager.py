@@ -1,8 +1,11 @@
 # linkedin/api/voyager.py
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Literal, Any
+import codecs
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Collection, List, Optional, Dict, Literal, Any
 
 ConnectionDistance = Literal["DISTANCE_1", "DISTANCE_2", "DISTANCE_3", "OUT_OF_NETWORK", None]
 
@@ -18,19 +21,19 @@ DISTANCE_TO_DEGREE: Dict[str, Optional[int]] = {
 # Internal dataclasses (only used for validation & structure)
 # ======================
 
-@dataclass
+@dataclass(slots=True)
 class Date:
     year: Optional[int] = None
     month: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DateRange:
     start: Optional[Date] = None
     end: Optional[Date] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     title: str
     company_name: str
@@ -41,7 +44,7 @@ class Position:
     urn: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Education:
     school_name: str
     degree_name: Optional[str] = None
@@ -50,7 +53,7 @@ class Education:
     urn: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkedInProfile:
     url: str
     urn: str
@@ -70,19 +73,175 @@ class LinkedInProfile:
 
     connection_distance: Optional[ConnectionDistance] = None
     connection_degree: Optional[int] = None
+    # True: our invitation is pending · False: no invitation · None: not in the response
+    invitation_pending: Optional[bool] = None
+
+
+PROFILE_TYPE = "com.linkedin.voyager.dash.identity.profile.Profile"
+
+# Every `included` entity type the parser reads; the rest (skills, media, publications, ...) can be dropped
+PARSED_ENTITY_TYPES = frozenset({
+    PROFILE_TYPE,
+    "com.linkedin.restli.common.CollectionResponse",
+    "com.linkedin.voyager.dash.relationships.MemberRelationship",
+    "com.linkedin.voyager.dash.identity.profile.PositionGroup",
+    "com.linkedin.voyager.dash.identity.profile.Position",
+    "com.linkedin.voyager.dash.identity.profile.Education",
+    "com.linkedin.voyager.dash.organization.Company",
+    "com.linkedin.voyager.dash.organization.School",
+    "com.linkedin.voyager.dash.common.Geo",
+    "com.linkedin.voyager.dash.common.Industry",
+})
+
+
+# ======================
+# Streaming extraction
+# ======================
+
+# Bytes decoded into the text window at a time
+EXTRACT_CHUNK_SIZE = 8 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# What may follow a complete number inside the documents we read
+_NUMBER_END = frozenset(",]} \t\n\r")
+_raw_decode = json.JSONDecoder().raw_decode
+
+
+class _JsonStream:
+    """
+    JSON values read one at a time from UTF-8 bytes through a sliding text window.
+
+    Only the unread part of the current chunk is held as `str`, so neither the
+    whole document nor its full decoded text exists at once. A value that does
+    not fit yet is retried on a window at least twice as large.
+    """
+
+    def __init__(self, raw: bytes | str, chunk_size: int = EXTRACT_CHUNK_SIZE):
+        if isinstance(raw, str):
+            self._raw, self.text = memoryview(b""), raw
+        else:
+            self._raw, self.text = memoryview(raw), ""
+        self._offset = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._chunk_size = chunk_size
+        self.pos = 0
+
+    def _fill(self, min_size: int = 0) -> bool:
+        if self._offset >= len(self._raw):
+            return False
+        if self.pos > self._chunk_size:
+            self.text, self.pos = self.text[self.pos:], 0
+        end = self._offset + max(self._chunk_size, min_size)
+        self.text += self._decoder.decode(self._raw[self._offset:end], final=end >= len(self._raw))
+        self._offset = end
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at the end)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text) or not self._fill():
+                return self.text[self.pos:self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.text, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _raw_decode(self.text, self.pos)
+                # A number may be cut short at the window edge, including mid-fraction
+                # or mid-exponent ("1." / "1.5e" decode as 1 / 1.5): only trust one
+                # that is followed by a structural character
+                complete = end < len(self.text) and (
+                        isinstance(value, bool)
+                        or not isinstance(value, (int, float))
+                        or self.text[end] in _NUMBER_END
+                )
+                if complete or self._offset >= len(self._raw):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._offset >= len(self._raw):
+                    raise
+            self._fill(len(self.text) - self.pos)
+
+
+def extract_entities(
+        raw: bytes | str,
+        keep_types: Collection[str] = PARSED_ENTITY_TYPES,
+        chunk_size: int = EXTRACT_CHUNK_SIZE,
+) -> dict:
+    """
+    Decode a Voyager response keeping only the `included` entities the parser needs.
+
+    The top-level object is read key by key and the `included` array one
+    element at a time, so an entity whose `$type` is not in `keep_types` is
+    dropped as soon as it is decoded; entities without a `$type` are kept.
+    Other top-level values (`data`, ...) are decoded whole. The result is a
+    response dict that `parse_linkedin_voyager_response` reads exactly like
+    the full one, at a peak memory of roughly the kept entities plus one
+    window of text.
+    """
+    stream = _JsonStream(raw, chunk_size)
+    response: Dict[str, Any] = {}
+
+    stream.expect("{")
+    if stream.peek() == "}":
+        return response
+
+    while True:
+        if stream.peek() != '"':
+            raise json.JSONDecodeError("Expecting property name", stream.text, stream.pos)
+        key = stream.value()
+        stream.expect(":")
+
+        if key == "included" and stream.peek() == "[":
+            stream.expect("[")
+            kept = []
+            if stream.peek() == "]":
+                stream.expect("]")
+            else:
+                while True:
+                    entity = stream.value()
+                    if isinstance(entity, dict):
+                        entity_type = entity.get("$type")
+                        if entity_type is None or entity_type in keep_types:
+                            kept.append(entity)
+                    if stream.expect(",]") == "]":
+                        break
+            response[key] = kept
+        else:
+            response[key] = stream.value()
+
+        if stream.expect(",}") == "}":
+            return response
 
 
 # ======================
 # Private helpers
+#
+# The parser builds the output dicts directly, in the field order of the
+# dataclasses above (the order `asdict` used to produce), so the result
+# serializes byte-for-byte as before without a dataclass round-trip.
 # ======================
 
-def _resolve_references(data: dict) -> Dict[str, dict]:
-    """Build urn → entity lookup from 'included' array."""
-    return {
-        entity.get("entityUrn"): entity
-        for entity in data.get("included", [])
-        if entity.get("entityUrn")
-    }
+def _index_included(included: List[dict]) -> tuple[Dict[str, dict], List[dict]]:
+    """One pass over `included`: urn → entity lookup, plus every Profile entity in order."""
+    urn_map: Dict[str, dict] = {}
+    profile_entities: List[dict] = []
+    for entity in included:
+        urn = entity.get("entityUrn")
+        if urn:
+            urn_map[urn] = entity
+        if entity.get("$type") == PROFILE_TYPE:
+            profile_entities.append(entity)
+    return urn_map, profile_entities
 
 
 def _resolve_star_field(entity: dict, urn_map: Dict[str, dict], field_name: str) -> Any:
@@ -95,69 +254,126 @@ def _resolve_star_field(entity: dict, urn_map: Dict[str, dict], field_name: str)
     return urn_map.get(value)
 
 
-def _date_from_raw(raw: Optional[dict]) -> Optional[Date]:
+def _collection(urn_map: Dict[str, dict], collection_urn: Optional[str]) -> List[dict]:
+    """Entities listed in a collection's `*elements`, skipping unresolved URNs."""
+    if not collection_urn:
+        return []
+    collection = urn_map.get(collection_urn)
+    if not collection:
+        return []
+    entities = []
+    for urn in collection.get("*elements") or ():
+        entity = urn_map.get(urn)
+        if entity:
+            entities.append(entity)
+    return entities
+
+
+def _date(raw: Optional[dict]) -> Optional[dict]:
     if not raw:
         return None
-    return Date(year=raw.get("year"), month=raw.get("month"))
+    return {"year": raw.get("year"), "month": raw.get("month")}
 
 
-def _date_range_from_raw(raw: Optional[dict]) -> Optional[DateRange]:
+def _date_range(raw: Optional[dict]) -> Optional[dict]:
     if not raw:
         return None
-    return DateRange(
-        start=_date_from_raw(raw.get("start")),
-        end=_date_from_raw(raw.get("end")),
-    )
+    return {"start": _date(raw.get("start")), "end": _date(raw.get("end"))}
 
 
-def _enrich_position(pos: dict, urn_map: Dict[str, dict]) -> Position:
+def _position(pos: dict, urn_map: Dict[str, dict]) -> dict:
     company = _resolve_star_field(pos, urn_map, "*company")
 
-    return Position(
-        title=pos.get("title") or "Unknown Title",
-        company_name=company.get("name") if company else pos.get("companyName", "Unknown Company"),
-        company_urn=company.get("entityUrn") if company else pos.get("companyUrn"),
-        location=pos.get("locationName"),
-        date_range=_date_range_from_raw(pos.get("dateRange")),
-        description=pos.get("description"),
-        urn=pos.get("entityUrn"),
-    )
+    return {
+        "title": pos.get("title") or "Unknown Title",
+        "company_name": company.get("name") if company else pos.get("companyName", "Unknown Company"),
+        "company_urn": company.get("entityUrn") if company else pos.get("companyUrn"),
+        "location": pos.get("locationName"),
+        "date_range": _date_range(pos.get("dateRange")),
+        "description": pos.get("description"),
+        "urn": pos.get("entityUrn"),
+    }
 
 
-def _enrich_education(edu: dict, urn_map: Dict[str, dict]) -> Education:
+def _education(edu: dict, urn_map: Dict[str, dict]) -> dict:
     school = _resolve_star_field(edu, urn_map, "*school")
 
-    return Education(
-        school_name=school.get("name") if school else edu.get("schoolName", "Unknown School"),
-        degree_name=edu.get("degreeName"),
-        field_of_study=edu.get("fieldOfStudy"),
-        date_range=_date_range_from_raw(edu.get("dateRange")),
-        urn=edu.get("entityUrn"),
-    )
+    return {
+        "school_name": school.get("name") if school else edu.get("schoolName", "Unknown School"),
+        "degree_name": edu.get("degreeName"),
+        "field_of_study": edu.get("fieldOfStudy"),
+        "date_range": _date_range(edu.get("dateRange")),
+        "urn": edu.get("entityUrn"),
+    }
+
+
+def _invitation_pending(invitation_union: Optional[dict], profile_urn: Optional[str]) -> Optional[bool]:
+    """Read `invitationUnion` (or the flat `memberRelationshipData`) of a not-connected member."""
+    if not invitation_union:
+        return None
+    if "noInvitation" in invitation_union:
+        return False
+
+    invitation = invitation_union.get("invitation")
+    if not invitation:
+        return None
+    state, inviter = invitation.get("invitationState"), invitation.get("inviter")
+    if state is None or inviter is None:
+        # Half-populated: can't tell whose invitation it is or whether it is still open
+        return None
+    if profile_urn and inviter == profile_urn:
+        # They invited us — not an invitation of ours waiting on them
+        return None
+    return state == "PENDING"
 
 
-def _extract_connection_info(profile_entity: dict, urn_map: Dict[str, dict]) -> tuple[Optional[str], Optional[int]]:
+def _extract_connection_info(
+        profile_entity: dict,
+        urn_map: Dict[str, dict],
+) -> tuple[Optional[str], Optional[int], Optional[bool]]:
+    """(connection_distance, connection_degree, invitation_pending) from `*memberRelationship`."""
     member_rel_urn = profile_entity.get("*memberRelationship")
     if not member_rel_urn:
-        return None, None
+        return None, None, None
 
     rel = urn_map.get(member_rel_urn)
     if not rel:
-        return None, None
+        return None, None, None
 
     union = rel.get("memberRelationshipUnion") or rel.get("memberRelationshipData")
     if not union:
-        return None, None
+        return None, None, None
 
     if "connectedMember" in union or "connected" in union:
-        return "DISTANCE_1", 1
+        return "DISTANCE_1", 1, False
 
+    profile_urn = profile_entity.get("entityUrn")
     if "noConnection" in union:
-        distance_str = union["noConnection"].get("memberDistance")
+        no_connection = union["noConnection"]
+        distance_str = no_connection.get("memberDistance")
         degree = DISTANCE_TO_DEGREE.get(distance_str)
-        return distance_str, degree
+        invitation_union = no_connection.get("invitationUnion") or rel.get("memberRelationshipData")
+        return distance_str, degree, _invitation_pending(invitation_union, profile_urn)
+
+    return None, None, _invitation_pending(union, profile_urn)
+
 
-    return None, None
+def _validate(profile: dict):
+    """Build the slotted dataclasses from the output dicts — raises TypeError on a missing or unknown field."""
+    LinkedInProfile(**{
+        **profile,
+        "positions": [Position(**{**p, "date_range": _validate_range(p["date_range"])}) for p in profile["positions"]],
+        "educations": [Education(**{**e, "date_range": _validate_range(e["date_range"])}) for e in profile["educations"]],
+    })
+
+
+def _validate_range(raw: Optional[dict]) -> Optional[DateRange]:
+    if raw is None:
+        return None
+    return DateRange(
+        start=Date(**raw["start"]) if raw["start"] else None,
+        end=Date(**raw["end"]) if raw["end"] else None,
+    )
 
 
 # ======================
@@ -167,30 +383,61 @@ def _extract_connection_info(profile_entity: dict, urn_map: Dict[str, dict]) ->
 def parse_linkedin_voyager_response(
         json_response: dict,
         public_identifier: Optional[str] = None,
+        validate: bool = False,
 ) -> dict:
     """
     Parse a full LinkedIn Voyager profile response and return a clean dictionary.
 
-    Uses dataclasses internally for validation and structure,
-    but returns a plain, JSON-serializable dict (no dataclass leakage).
+    `included` is indexed in a single pass and the plain, JSON-serializable
+    dict is built directly. `geo` / `industry` are the response's own entity
+    dicts, not copies.
 
     Args:
         json_response: Raw JSON from Voyager API (with "data" and "included")
         public_identifier: Optional filter – only parse profile with this public ID
+        validate: Also check the result against the dataclasses (slower; for tests / debugging)
 
     Returns:
         dict with clean, structured LinkedIn profile data
     """
-    urn_map = _resolve_references(json_response)
+    urn_map, profile_entities = _index_included(json_response.get("included", []))
+    profile_entity = _main_profile_entity(json_response, urn_map, profile_entities, public_identifier)
+    return _build_profile(profile_entity, urn_map, validate)
 
-    # Find the main Profile entity
-    profile_entity = None
-    for entity in json_response.get("included", []):
-        if entity.get("$type") == "com.linkedin.voyager.dash.identity.profile.Profile":
-            entity_id = entity.get("publicIdentifier")
-            if public_identifier is None or entity_id == public_identifier:
-                profile_entity = entity
-                break
+
+def parse_many(json_response: dict, public_identifier: Optional[str] = None, validate: bool = False) -> List[dict]:
+    """
+    Parse every Profile entity of a Voyager response.
+
+    Responses can embed several members (the viewer, people in the
+    relationship, ...). All of them are built from one pass over `included`
+    and a shared URN index; duplicates of the same entity are parsed once.
+    The first profile is the one `parse_linkedin_voyager_response` would
+    return for `public_identifier`; the others follow in `included` order.
+    """
+    urn_map, profile_entities = _index_included(json_response.get("included", []))
+    main = _main_profile_entity(json_response, urn_map, profile_entities, public_identifier)
+    profiles, seen = [_build_profile(main, urn_map, validate)], {main.get("entityUrn")}
+    for entity in profile_entities:
+        urn = entity.get("entityUrn")
+        if not urn or urn in seen:
+            continue
+        seen.add(urn)
+        profiles.append(_build_profile(entity, urn_map, validate))
+    return profiles
+
+
+def _main_profile_entity(
+        json_response: dict,
+        urn_map: Dict[str, dict],
+        profile_entities: List[dict],
+        public_identifier: Optional[str],
+) -> dict:
+    """The requested member's Profile entity: by `public_identifier`, else the response's main element."""
+    profile_entity = next(
+        (e for e in profile_entities if public_identifier is None or e.get("publicIdentifier") == public_identifier),
+        None,
+    )
 
     # Fallback if not found via $type
     if not profile_entity:
@@ -199,64 +446,48 @@ def parse_linkedin_voyager_response(
 
     if not profile_entity:
         raise ValueError("Could not find profile entity in the Voyager response")
+    return profile_entity
 
+
+def _build_profile(profile_entity: dict, urn_map: Dict[str, dict], validate: bool) -> dict:
     first_name = profile_entity.get("firstName", "")
     last_name = profile_entity.get("lastName", "")
 
     # Extract connection info
-    connection_distance, connection_degree = _extract_connection_info(profile_entity, urn_map)
-
-    # Build positions
-    positions: List[Position] = []
-    pos_groups_urn = profile_entity.get("*profilePositionGroups")
-    if pos_groups_urn:
-        pos_groups_resp = urn_map.get(pos_groups_urn)
-        if pos_groups_resp and pos_groups_resp.get("*elements"):
-            for group_urn in pos_groups_resp["*elements"]:
-                group = urn_map.get(group_urn)
-                if not group:
-                    continue
-                positions_coll_urn = group.get("*profilePositionInPositionGroup")
-                if positions_coll_urn:
-                    positions_coll = urn_map.get(positions_coll_urn)
-                    if positions_coll and positions_coll.get("*elements"):
-                        for pos_urn in positions_coll["*elements"]:
-                            pos = urn_map.get(pos_urn)
-                            if pos:
-                                positions.append(_enrich_position(pos, urn_map))
-
-    # Build educations
-    educations: List[Education] = []
-    educations_urn = profile_entity.get("*profileEducations")
-    if educations_urn:
-        edu_coll = urn_map.get(educations_urn)
-        if edu_coll and edu_coll.get("*elements"):
-            for edu_urn in edu_coll["*elements"]:
-                edu = urn_map.get(edu_urn)
-                if edu:
-                    educations.append(_enrich_education(edu, urn_map))
-
-    # Assemble data for dataclass validation
-    profile_data = {
+    connection_distance, connection_degree, invitation_pending = _extract_connection_info(profile_entity, urn_map)
+
+    # Positions: group collection → each group's position collection
+    positions = [
+        _position(pos, urn_map)
+        for group in _collection(urn_map, profile_entity.get("*profilePositionGroups"))
+        for pos in _collection(urn_map, group.get("*profilePositionInPositionGroup"))
+    ]
+    educations = [
+        _education(edu, urn_map)
+        for edu in _collection(urn_map, profile_entity.get("*profileEducations"))
+    ]
+
+    # Same key order as the LinkedInProfile fields
+    profile = {
+        "url": f"https://www.linkedin.com/in/{profile_entity.get('publicIdentifier', '')}/",
         "urn": profile_entity["entityUrn"],
+        "full_name": f"{first_name} {last_name}".strip() or None,
         "first_name": first_name,
         "last_name": last_name,
-        "full_name": f"{first_name} {last_name}".strip() or None,
         "headline": profile_entity.get("headline"),
         "summary": profile_entity.get("summary"),
         "public_identifier": profile_entity.get("publicIdentifier"),
         "location_name": profile_entity.get("locationName"),
         "geo": _resolve_star_field(profile_entity, urn_map, "*geo"),
         "industry": _resolve_star_field(profile_entity, urn_map, "*industry"),
-        "url": f"https://www.linkedin.com/in/{profile_entity.get('publicIdentifier', '')}/",
         "positions": positions,
         "educations": educations,
         "connection_distance": connection_distance,
         "connection_degree": connection_degree,
+        "invitation_pending": invitation_pending,
     }
 
-    # Validate with dataclass (will raise if something is wrong)
-    profile_obj = LinkedInProfile(**profile_data)
+    if validate:
+        _validate(profile)
 
-    # Return clean dictionary – perfect for JSON, APIs, logging, etc.
-    return asdict(profile_obj)
+    return profile
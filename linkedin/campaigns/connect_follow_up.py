@@ -1,10 +1,13 @@
 # campaigns/connect_follow_up.py
 import logging
+from typing import Iterable, Optional, Tuple
 
 from termcolor import colored
 
 from linkedin.actions.connection_status import get_connection_status
-from linkedin.db.profiles import set_profile_state, get_profile, save_scraped_profile
+from linkedin.db.leads import Lead
+from linkedin.db.limits import connection_limit_active, record_connection_limit
+from linkedin.db.profiles import set_profile_state, get_state_and_profile, save_scraped_profile
 from linkedin.navigation.enums import MessageStatus
 from linkedin.navigation.enums import ProfileState
 from linkedin.navigation.exceptions import TerminalStateError, SkipProfile, ReachedConnectionLimit
@@ -23,18 +26,24 @@ def process_profile_row(
         session: "AccountSession",
         simple_profile: dict,
         perform_connections=True,
-):
+        fresh_profile: Optional[dict] = None,
+) -> Tuple[Optional[dict], Optional[dict]]:
+    """
+    Advances one profile by one step. Returns the profile to keep working on
+    (or None) and, when this step scraped it, the profile fresh from the API:
+    the next step reuses its relationship instead of requesting it again.
+    """
     from linkedin.actions.connect import send_connection_request
     from linkedin.actions.message import send_follow_up_message
     from linkedin.actions.profile import scrape_profile
 
     url = simple_profile['url']
     public_identifier = simple_profile['public_identifier']
-    profile_row = get_profile(session, public_identifier)
+    state, stored_profile = get_state_and_profile(session, public_identifier)
 
-    if profile_row:
-        current_state = ProfileState(profile_row.state)
-        profile = profile_row.profile or simple_profile
+    if state:
+        current_state = ProfileState(state)
+        profile = stored_profile or simple_profile
     else:
         current_state = ProfileState.DISCOVERED
         profile = simple_profile
@@ -42,9 +51,10 @@ def process_profile_row(
     logger.debug(f"Actual state: {public_identifier}  {current_state}")
 
     new_state = None
+    scraped = None
     match current_state:
         case ProfileState.COMPLETED | ProfileState.FAILED:
-            return None
+            return None, None
 
         case ProfileState.DISCOVERED:
             profile, data = scrape_profile(handle=handle, profile=profile)
@@ -53,14 +63,15 @@ def process_profile_row(
             else:
                 new_state = ProfileState.ENRICHED
                 save_scraped_profile(session, url, profile, data)
+                scraped = profile
 
         case ProfileState.ENRICHED:
             if not perform_connections:
-                return None
-            new_state = send_connection_request(handle=handle, profile=profile)
+                return None, None
+            new_state = send_connection_request(handle=handle, profile=profile, fresh=fresh_profile)
             profile = None if new_state != ProfileState.CONNECTED else profile
         case ProfileState.PENDING:
-            new_state = get_connection_status(session, profile)
+            new_state = get_connection_status(session, profile, fresh=fresh_profile)
             profile = None if new_state != ProfileState.CONNECTED else profile
         case ProfileState.CONNECTED:
             status = send_follow_up_message(
@@ -75,20 +86,27 @@ def process_profile_row(
 
     set_profile_state(session, public_identifier, new_state.value)
 
-    return profile
+    return profile, scraped
 
 
-def process_profiles(handle, session, profiles: list[dict]):
-    perform_connections = True
-    for simple_profile in profiles:
+def process_profiles(handle, session, profiles: Iterable[Lead | dict]):
+    perform_connections = not connection_limit_active(session)
+    for lead in profiles:
+        # Leads stream in as compact tuples; only the one being worked on becomes a dict
+        if isinstance(lead, Lead):
+            simple_profile = {"url": lead.url, "public_identifier": lead.public_identifier}
+        else:
+            simple_profile = lead
         continue_same_profile = True
+        fresh_profile = None
         while continue_same_profile:
             try:
-                profile = process_profile_row(
+                profile, fresh_profile = process_profile_row(
                     handle=handle,
                     session=session,
                     simple_profile=simple_profile,
                     perform_connections=perform_connections,
+                    fresh_profile=fresh_profile,
                 )
                 continue_same_profile = bool(profile)
             except SkipProfile as e:
@@ -100,6 +118,7 @@ def process_profiles(handle, session, profiles: list[dict]):
                 continue_same_profile = False
             except ReachedConnectionLimit as e:
                 perform_connections = False
+                record_connection_limit(session)
                 public_identifier = simple_profile["public_identifier"]
                 logger.info(
                     colored(f"Skipping profile: {public_identifier} reason: {e}", "red", attrs=["bold"])
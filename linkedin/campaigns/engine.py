@@ -2,15 +2,17 @@
 from __future__ import annotations
 
 import logging
+from typing import Iterable
 
 from linkedin.api.emails import ensure_newsletter_subscription
 from linkedin.campaigns.connect_follow_up import process_profiles
+from linkedin.db.leads import Lead
 from linkedin.sessions.account import AccountSession
 
 logger = logging.getLogger(__name__)
 
 
-def start_campaign(handle: str, session: AccountSession, profiles: list[dict]):
+def start_campaign(handle: str, session: AccountSession, profiles: Iterable[Lead | dict]):
     session.ensure_browser()
 
     ensure_newsletter_subscription(session)
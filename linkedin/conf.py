@@ -17,6 +17,12 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_API_BASE = os.getenv("OPENAI_API_BASE")
 AI_MODEL = os.getenv("AI_MODEL", "gpt-4o-mini")
 
+# ----------------------------------------------------------------------
+# Cloud sync (unset URL → profiles are only marked as synced locally)
+# ----------------------------------------------------------------------
+CLOUD_SYNC_URL = os.getenv("CLOUD_SYNC_URL")
+CLOUD_SYNC_TOKEN = os.getenv("CLOUD_SYNC_TOKEN")
+
 # ----------------------------------------------------------------------
 # Paths (all under assets/)
 # ----------------------------------------------------------------------
@@ -89,6 +95,9 @@ def get_account_config(handle: str) -> Dict[str, Any]:
 
         "cookie_file": COOKIES_DIR / f"{handle}.json",
         "db_path": account_db_path,
+        "storage_profile": acct.get("storage_profile"),
+        "write_behind": acct.get("write_behind"),
+        "background_sync": acct.get("background_sync"),
 
         "input_csv": ASSETS_DIR / input_csv_rel,
         "followup_template": ASSETS_DIR / followup_rel,
@@ -1,90 +1,269 @@
 # linkedin/csv_launcher.py
+import hashlib
+import io
 import logging
+from itertools import tee
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional, Tuple
 
 import pandas as pd
 
 from linkedin.campaigns.engine import start_campaign
 from linkedin.conf import get_first_active_account
-from linkedin.db.profiles import get_updated_at_df
-from linkedin.db.profiles import url_to_public_id
+from linkedin.db.leads import (
+    clear_staged_leads,
+    count_staged_leads,
+    get_csv_import,
+    iter_campaign_leads,
+    record_csv_import,
+    stage_leads,
+)
+from linkedin.db.profiles import extract_public_ids
 from linkedin.sessions.registry import get_session
+from linkedin.utils import ordered_pool_map
 
 logger = logging.getLogger(__name__)
 
+URL_COLUMNS = ["url", "linkedin_url", "profile_url"]
 
-def load_profiles_df(csv_path: Path | str):
+# Rows parsed per pandas chunk when streaming a CSV into SQLite
+CSV_CHUNK_SIZE = 50_000
+
+# Read size when fingerprinting an input file
+SCAN_BLOCK_SIZE = 1 << 20
+
+
+def _find_url_column(columns) -> str:
+    url_column = next((col for col in columns if col.lower() in URL_COLUMNS), None)
+    if url_column is None:
+        raise ValueError(f"No URL column found. Available: {list(columns)}")
+    return url_column
+
+
+def reject_report_path(csv_path: Path) -> Path:
+    return csv_path.with_name(f"{csv_path.stem}.rejected.csv")
+
+
+class RejectReport:
+    """
+    `<stem>.rejected.csv` next to the input: one line per URL that is not a
+    LinkedIn /in/ profile (row number, url, reason). Created on the first
+    reject; a stale report from a previous load is removed up front.
+    """
+
+    def __init__(self, csv_path: Path, append: bool = False):
+        self.path = reject_report_path(csv_path)
+        if not append:
+            self.path.unlink(missing_ok=True)
+        self.count = 0
+        self._header = not self.path.exists()
+
+    def add(self, urls: pd.Series, rejections: pd.Series):
+        rejected = rejections.notna()
+        if not rejected.any():
+            return
+        pd.DataFrame({
+            "row": urls.index[rejected] + 1,
+            "url": urls[rejected],
+            "reason": rejections[rejected],
+        }).to_csv(self.path, mode="a", header=self._header, index=False)
+        self._header = False
+        self.count += int(rejected.sum())
+
+    def log(self, csv_path: Path):
+        if self.count:
+            logger.warning(f"Skipped {self.count:,} rows of {csv_path.name} that are not LinkedIn /in/ profile URLs "
+                           f"→ {self.path}")
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of bytes [start, end) of a file."""
+
+    def __init__(self, path: Path, start: int, end: int):
+        self._file = open(path, "rb")
+        self._file.seek(start)
+        self._left = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        read = self._file.readinto(memoryview(buffer)[:min(len(buffer), self._left)])
+        self._left -= read
+        return read
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def _url_chunks(
+        csv_path: Path,
+        columns: list,
+        url_column: str,
+        chunksize: int,
+        start: int = 0,
+        end: Optional[int] = None,
+        row_offset: int = 0,
+) -> Iterator[Tuple[int, pd.Series]]:
+    """
+    (rows read, non-blank stripped URLs) per CSV chunk of bytes [start, end).
+    A range starting past the header is parsed with the header's column names;
+    the URLs are indexed by data row, counting `row_offset` rows before `start`.
+    """
+    end = csv_path.stat().st_size if end is None else end
+    if end <= start:
+        return
+    header = {"header": 0} if start == 0 else {"header": None, "names": columns}
+    with io.TextIOWrapper(io.BufferedReader(_ByteRange(csv_path, start, end)), encoding="utf-8", newline="") as f:
+        for chunk in pd.read_csv(f, usecols=[url_column], dtype=str, chunksize=chunksize, **header):
+            urls = chunk[url_column].dropna().str.strip()
+            urls = urls[urls != ""]
+            urls.index = urls.index + row_offset
+            yield len(chunk), urls
+
+
+def _extracted_chunks(chunks, workers: int) -> Iterator[Tuple[int, pd.Series, pd.Series, pd.Series]]:
+    """Adds `extract_public_ids` to each chunk, in input order (see `ordered_pool_map`)."""
+    chunks, to_parse = tee(chunks)
+    extracted = ordered_pool_map(extract_public_ids, (urls for _, urls in to_parse), workers)
+    for (rows, urls), (public_ids, rejections) in zip(chunks, extracted):
+        yield rows, urls, public_ids, rejections
+
+
+def stage_profiles_csv(
+        session: "AccountSession",
+        csv_path: Path | str,
+        chunksize: int = CSV_CHUNK_SIZE,
+        workers: int = 1,
+        start: int = 0,
+        end: Optional[int] = None,
+        row_offset: int = 0,
+) -> int:
+    """
+    Stream a lead CSV into the `campaign_leads` table, `chunksize` rows at a time.
+
+    Only the URL column is parsed. Each chunk is cleaned and inserted in one
+    transaction; duplicates are dropped by the table's primary key, so memory
+    stays flat in the file size. URLs that are not /in/ profiles go to the reject report.
+    `workers` > 1 parses chunks in a process pool (worth it for millions of
+    rows). `start` / `end` restrict the read to a byte range of whole lines
+    (an appended tail: `start` > 0, `row_offset` data rows before it).
+    Returns the number of new leads staged.
+    """
     csv_path = Path(csv_path)
     if not csv_path.is_file():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    df = pd.read_csv(csv_path)
+    columns = list(pd.read_csv(csv_path, nrows=0).columns)
+    url_column = _find_url_column(columns)
+    source = str(csv_path.resolve())
+    report = RejectReport(csv_path, append=start > 0)
 
-    possible_cols = ["url", "linkedin_url", "profile_url"]
-    url_column = next(
-        (col for col in df.columns if col.lower() in [c.lower() for c in possible_cols]),
-        None,
-    )
+    rows_read = staged = 0
+    chunks = _url_chunks(csv_path, columns, url_column, chunksize, start, end, row_offset)
+    for rows, urls, public_ids, rejections in _extracted_chunks(chunks, workers):
+        rows_read += rows
+        report.add(urls, rejections)
 
-    if url_column is None:
-        raise ValueError(f"No URL column found. Available: {list(df.columns)}")
-
-    # Clean, dedupe, keep as DataFrame
-    urls_df = (
-        df[[url_column]]
-        .astype(str)
-        .apply(lambda col: col.str.strip())
-        .replace({"nan": None, "<NA>": None})
-        .dropna()
-        .drop_duplicates()
-    )
+        valid = rejections.isna()
+        batch = [{"public_identifier": public_id, "url": url} for public_id, url in zip(public_ids[valid], urls[valid])]
+        staged += stage_leads(session, batch, source=source)
+
+    report.log(csv_path)
+    logger.info(f"Staged {staged:,} new leads from {rows_read:,} rows of {csv_path.name}")
+    return staged
 
-    # Add public identifier
-    urls_df["public_identifier"] = urls_df[url_column].apply(url_to_public_id)
-    logger.debug(f"First 10 rows of {csv_path.name}:\n"
-                 f"{urls_df.head(10).to_string(index=False)}"
-                 )
-    logger.info(f"Loaded {len(urls_df):,} pristine LinkedIn profile URLs")
-    return urls_df
 
+class CsvScan(NamedTuple):
+    end: int  # offset just past the last complete line
+    content_hash: str  # SHA-256 of bytes [0, end)
+    prefix_hash: Optional[str]  # SHA-256 of bytes [0, prefix_end), None if the file is shorter
+    rows: int  # data rows in [0, end)
 
-def sort_profiles(session: "AccountSession", profiles_df: pd.DataFrame) -> list:
+
+def scan_csv(path: Path, prefix_end: int = 0) -> CsvScan:
     """
-    Return a new DataFrame sorted by updated_at (oldest first).
-    Profiles not in the database come first.
+    One sequential pass over `path`: fingerprints of the file up to its last
+    complete line and of its first `prefix_end` bytes (a previous `end`), plus
+    the data-row count up to there.
     """
-    if profiles_df.empty:
-        return []
+    digest = hashlib.sha256()
+    prefix_hash = None
+    hashed = newlines = 0
+    pending = b""
+    with open(path, "rb") as f:
+        while block := f.read(SCAN_BLOCK_SIZE):
+            data = pending + block
+            cut = data.rfind(b"\n") + 1
+            if not cut:
+                pending = data
+                continue
+            complete, pending = data[:cut], data[cut:]
+            if prefix_hash is None and hashed < prefix_end <= hashed + cut:
+                digest.update(complete[:prefix_end - hashed])
+                prefix_hash = digest.hexdigest()
+                digest.update(complete[prefix_end - hashed:])
+            else:
+                digest.update(complete)
+            newlines += complete.count(b"\n")
+            hashed += cut
 
-    public_ids = profiles_df["public_identifier"].tolist()
+    return CsvScan(hashed, digest.hexdigest(), prefix_hash, max(newlines - 1, 0))
 
-    # Get DB timestamps as DataFrame
-    db_df = get_updated_at_df(session, public_ids)
 
-    # Left join: keep all input profiles
-    merged = profiles_df.merge(db_df, on="public_identifier", how="left")
+def import_profiles_csv(
+        session: "AccountSession",
+        csv_path: Path | str,
+        chunksize: int = CSV_CHUNK_SIZE,
+        workers: int = 1,
+) -> int:
+    """
+    Stage `csv_path` into `campaign_leads`, reading as little of it as possible.
 
-    NOT_IN_DB = pd.Timestamp("1970-01-01 00:00:00")
+    `csv_imports` remembers how far the file was imported (byte offset of the
+    last complete line) and the SHA-256 of that prefix:
 
-    # Force datetime conversion first + fillna
-    merged["updated_at"] = (
-        pd.to_datetime(merged["updated_at"], errors="coerce")
-        .fillna(NOT_IN_DB)
-    )
+    - same size + mtime as last time → nothing is read at all
+    - prefix unchanged, file grew → only the appended tail is parsed
+    - prefix unchanged, same length (file was only touched) → fingerprint refreshed
+    - prefix changed → the leads of the old version are dropped and the file is re-staged
 
-    # Sort: oldest (including new profiles) first
-    sorted_df = merged.sort_values(by="updated_at").drop(columns="updated_at")
+    A last line without a trailing newline is staged but not counted as
+    imported, so it is read again (and deduped) once the file grows.
+    Returns the number of leads staged from the file.
+    """
+    csv_path = Path(csv_path)
+    if not csv_path.is_file():
+        raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    logger.debug(f"Sorted:\n"
-                 f"{sorted_df.head(10).to_string(index=False)}"
-                 )
-    not_in_db = (merged["updated_at"] == NOT_IN_DB).sum()
-    logger.info(
-        f"Sorted {len(sorted_df):,} profiles by last updated: "
-        f"{not_in_db} new, {len(sorted_df) - not_in_db} existing (oldest first)"
-    )
-    return sorted_df.to_dict(orient="records")
+    source = str(csv_path.resolve())
+    stat = csv_path.stat()
+    cached = get_csv_import(session, source)
+    if cached and (cached.size, cached.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+        logger.info(f"{csv_path.name} unchanged → reusing {cached.leads:,} staged leads")
+        return cached.leads
+
+    scan = scan_csv(csv_path, prefix_end=cached.byte_offset if cached else 0)
+
+    if cached and scan.prefix_hash == cached.content_hash:
+        if (scan.end, stat.st_size) == (cached.byte_offset, cached.size):
+            logger.info(f"{csv_path.name} touched but identical → reusing {cached.leads:,} staged leads")
+        else:
+            staged = stage_profiles_csv(session, csv_path, chunksize=chunksize, workers=workers,
+                                        start=cached.byte_offset, row_offset=cached.rows)
+            logger.info(f"{csv_path.name} grew by {scan.rows - cached.rows:,} rows → staged {staged:,} new leads "
+                        f"from the tail only")
+    else:
+        if cached:
+            dropped = clear_staged_leads(session, source)
+            logger.info(f"{csv_path.name} changed → re-staging (dropped {dropped:,} leads of the old version)")
+        stage_profiles_csv(session, csv_path, chunksize=chunksize, workers=workers)
+
+    leads = count_staged_leads(session, source)
+    record_csv_import(session, source, stat.st_size, stat.st_mtime_ns, scan.content_hash, leads,
+                      byte_offset=scan.end, rows=scan.rows)
+    return leads
 
 
 def launch_connect_follow_up_campaign(
@@ -112,9 +291,9 @@ def launch_connect_follow_up_campaign(
     input_csv = session.account_cfg['input_csv']
     logger.info(f"Launching campaign → running as @{handle} | CSV: {input_csv}")
 
-    profiles_df = load_profiles_df(input_csv)
-    profiles = sort_profiles(session, profiles_df)
+    leads = import_profiles_csv(session, input_csv)
+    profiles = iter_campaign_leads(session, source=str(Path(input_csv).resolve()))
 
-    logger.info(f"Loaded {len(profiles):,} profiles from CSV – ready for battle!")
+    logger.info(f"Loaded {leads:,} profiles from CSV – ready for battle!")
 
     start_campaign(handle, session, profiles)
@@ -0,0 +1,114 @@
+# linkedin/db/counters.py
+"""
+O(1) per-state profile counts.
+
+`state_counters` holds one row per state. SQLite triggers on `profiles` keep it
+current for every write path — ORM updates, bulk `INSERT OR IGNORE` (ignored
+rows fire no trigger), deletes — so reading a count is a single-row lookup.
+
+Check / repair an account database:
+
+    python -m linkedin.db.counters <handle> [--rebuild]
+"""
+import logging
+from typing import Dict
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Connection
+
+from linkedin.db.models import Profile, StateCounter
+from linkedin.navigation.enums import ProfileState
+
+logger = logging.getLogger(__name__)
+
+STATE_COUNTER_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_profiles_count_insert AFTER INSERT ON profiles
+    BEGIN
+        INSERT INTO state_counters (state, count) VALUES (NEW.state, 1)
+        ON CONFLICT(state) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_profiles_count_update AFTER UPDATE OF state ON profiles
+    WHEN OLD.state IS NOT NEW.state
+    BEGIN
+        UPDATE state_counters SET count = count - 1 WHERE state = OLD.state;
+        INSERT INTO state_counters (state, count) VALUES (NEW.state, 1)
+        ON CONFLICT(state) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_profiles_count_delete AFTER DELETE ON profiles
+    BEGIN
+        UPDATE state_counters SET count = count - 1 WHERE state = OLD.state;
+    END
+    """,
+]
+
+
+def install_state_counters(conn: Connection):
+    """Create the triggers (idempotent) and seed the counters from the current rows."""
+    for ddl in STATE_COUNTER_TRIGGERS:
+        conn.execute(text(ddl))
+    rebuild_state_counters(conn)
+
+
+def rebuild_state_counters(conn: Connection):
+    """Recompute every counter with a full COUNT(*) … GROUP BY state."""
+    conn.execute(text("DELETE FROM state_counters"))
+    conn.execute(text(
+        "INSERT INTO state_counters (state, count) SELECT state, COUNT(*) FROM profiles GROUP BY state"
+    ))
+
+
+def get_state_count(session: "AccountSession", state: ProfileState | str) -> int:
+    count = session.db_session.execute(
+        select(StateCounter.count).where(StateCounter.state == ProfileState(state).value)
+    ).scalar()
+    return count or 0
+
+
+def get_state_counts(session: "AccountSession") -> Dict[str, int]:
+    counts = dict(session.db_session.execute(select(StateCounter.state, StateCounter.count)).all())
+    return {state.value: counts.get(state.value, 0) for state in ProfileState}
+
+
+def check_state_counters(session: "AccountSession") -> Dict[str, tuple[int, int]]:
+    """Compare counters against a real COUNT(*). Returns {state: (counter, actual)} for every mismatch."""
+    db = session.db_session
+    actual = dict(db.execute(select(Profile.state, func.count()).group_by(Profile.state)).all())
+    stored = dict(db.execute(select(StateCounter.state, StateCounter.count)).all())
+    return {
+        state: (stored.get(state, 0), actual.get(state, 0))
+        for state in set(actual) | set(stored)
+        if stored.get(state, 0) != actual.get(state, 0)
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    from types import SimpleNamespace
+
+    from linkedin.db.engine import Database
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if len(sys.argv) not in (2, 3) or sys.argv[2:] not in ([], ["--rebuild"]):
+        print("Usage: python -m linkedin.db.counters <handle> [--rebuild]")
+        sys.exit(1)
+
+    db = Database.from_handle(sys.argv[1])
+    session = SimpleNamespace(db_session=db.get_session())
+
+    mismatches = check_state_counters(session)
+    for state, (stored, actual) in sorted(mismatches.items()):
+        print(f"MISMATCH {state:<12} counter={stored} actual={actual}")
+
+    if mismatches and "--rebuild" in sys.argv:
+        rebuild_state_counters(session.db_session.connection())
+        session.db_session.commit()
+        mismatches = {}
+
+    print(f"State counters {'OK' if not mismatches else 'STALE (run with --rebuild)'} → {get_state_counts(session)}")
+    sys.exit(2 if mismatches else 0)
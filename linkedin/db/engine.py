@@ -1,69 +1,230 @@
 # linkedin/db/engine.py
 import logging
+import re
+import time
 from pathlib import Path
+from typing import Any, Dict, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy import bindparam, create_engine, event, func, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker, scoped_session
 
 from linkedin.api.cloud_sync import sync_profiles
 from linkedin.conf import get_account_config
-from linkedin.db.models import Base, Profile
+from linkedin.db.migrations import ensure_schema
+from linkedin.db.models import Profile
 from linkedin.navigation.enums import ProfileState
 
 logger = logging.getLogger(__name__)
 
+# Profiles sent to the cloud (and checkpointed) per round-trip
+SYNC_BATCH_SIZE = 200
+
+
+# Flag one sent row as synced — unless it was written again since it was read
+_MARK_SYNCED = (
+    update(Profile.__table__)
+    .where(Profile.public_identifier == bindparam("pid"))
+    .where(Profile.sync_version == bindparam("version"))
+    .values(cloud_synced=True, updated_at=Profile.updated_at)
+)
+
+
+def _unsynced(query):
+    # IS 0 is answered from ix_profiles_cloud_synced (migration 9 rewrote the legacy 'false' literals)
+    return query.where(Profile.cloud_synced.is_(False)).where(Profile.state != ProfileState.DISCOVERED.value)
+
+
+# ----------------------------------------------------------------------
+# SQLite storage profiles (PRAGMAs applied on every new connection)
+# ----------------------------------------------------------------------
+STORAGE_PRAGMAS = ("journal_mode", "synchronous", "mmap_size", "cache_size", "temp_store")
+
+STORAGE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Plain SQLite defaults: rollback journal + fsync on every commit. Set explicitly, since
+    # WAL persists in the DB file — switching back from another profile undoes it
+    "legacy": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+    },
+    # WAL, still fsyncs every commit — nothing lost even on power failure
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "temp_store": "MEMORY",
+    },
+    # WAL + NORMAL: no fsync per commit, survives app crashes (may lose the last commits on power loss)
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16_000,  # KiB → 16 MB
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    # No fsync at all — scratch / benchmark databases only
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64_000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+# Durability is never weakened without opting in
+DEFAULT_STORAGE_PROFILE = "legacy"
+
+_PRAGMA_VALUE = re.compile(r"^-?\d+$|^[A-Za-z_]+$")
+
+
+def resolve_storage_profile(spec: Optional[str | Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Turn the `storage_profile` account setting into a dict of PRAGMAs.
+
+    Accepts a profile name (`balanced`), or a mapping of overrides with an
+    optional base profile: `{profile: balanced, mmap_size: 0}`. Unset → `legacy`.
+    """
+    if spec is None:
+        spec = DEFAULT_STORAGE_PROFILE
+
+    if isinstance(spec, str):
+        spec = {"profile": spec}
+
+    overrides = dict(spec)
+    name = overrides.pop("profile", DEFAULT_STORAGE_PROFILE)
+    if name not in STORAGE_PROFILES:
+        raise ValueError(f"Unknown storage profile {name!r}. Available: {list(STORAGE_PROFILES)}")
+
+    pragmas = {**STORAGE_PROFILES[name], **overrides}
+    for key, value in pragmas.items():
+        if key not in STORAGE_PRAGMAS:
+            raise ValueError(f"Unsupported storage setting {key!r}. Allowed: {list(STORAGE_PRAGMAS)}")
+        if not _PRAGMA_VALUE.match(str(value)):
+            raise ValueError(f"Invalid value for {key}: {value!r}")
+    return pragmas
+
+
+def _install_pragmas(engine, pragmas: Dict[str, Any]):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for key, value in pragmas.items():
+            cursor.execute(f"PRAGMA {key}={value}")
+        cursor.close()
+
 
 class Database:
     """
-    One account → one database.
-    Profiles are saved instantly using public_identifier as PK.
-    Sync to cloud happens ONLY when close() is called.
+    One account → one database, profiles keyed by public_identifier.
+    Writes commit immediately, or in batches with `write_behind`.
+    Unsynced profiles go to the cloud on close(), and periodically from a
+    CloudSyncWorker when `background_sync` is enabled.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, storage_profile: Optional[str | Dict[str, Any]] = None):
         db_url = f"sqlite:///{db_path}"
         logger.info("Initializing local DB → %s", Path(db_path).name)
         self.engine = create_engine(db_url, connect_args={"check_same_thread": False})
-        Base.metadata.create_all(bind=self.engine)
-        logger.debug("DB schema ready (tables ensured)")
+
+        self.pragmas = resolve_storage_profile(storage_profile)
+        _install_pragmas(self.engine, self.pragmas)
+        logger.debug("SQLite storage profile → %s", self.pragmas or "sqlite defaults")
+
+        ensure_schema(self.engine)
 
         session_factory = sessionmaker(bind=self.engine)
         self.Session = scoped_session(session_factory)
         self.db_path = Path(db_path)
 
+        # Sent but not yet flagged (write lock was busy): public_identifier → sync_version
+        self._sent_unflagged: Dict[str, int] = {}
+
     def get_session(self):
         return self.Session()
 
-    def close(self):
-        logger.info("DB.close() → syncing all unsynced profiles to cloud...")
-        self._sync_all_unsynced_profiles()
+    def close(self, sync: bool = True):
+        """Release this thread's session; by default push every unsynced profile first."""
+        if sync:
+            logger.info("DB.close() → syncing all unsynced profiles to cloud...")
+            self._sync_all_unsynced_profiles()
         self.Session.remove()
-        logger.info("DB closed and fully synced with cloud")
+        logger.info("DB closed%s", " and fully synced with cloud" if sync else "")
+
+    def count_unsynced_profiles(self) -> int:
+        """Sync backlog: profiles the next sync would send."""
+        # A session of its own: closing the thread-scoped one would drop the account session's pending writes
+        with Session(self.engine) as db_session:
+            return db_session.execute(_unsynced(select(func.count()).select_from(Profile))).scalar_one()
+
+    def _sync_all_unsynced_profiles(
+            self,
+            batch_size: int = SYNC_BATCH_SIZE,
+            deadline: Optional[float] = None,
+    ) -> int:
+        """
+        Stream unsynced profiles to the cloud in fixed-size batches.
+
+        Rows are paged by primary key (keyset, not OFFSET) and each batch that
+        the cloud accepts is flagged and committed, so memory stays flat and a
+        failure only leaves the remaining rows for the next sync. A row is
+        flagged only if its `sync_version` still matches the one read with the
+        batch: a profile re-saved while its batch was in flight stays unsynced
+        and goes out with its new data next time. With a `deadline` (time.monotonic()), stops between batches
+        once it has passed. Runs on its own session, never the thread-scoped
+        one. Returns the number of profiles flagged as synced.
+        """
+        synced = 0
+        last_id = None
+        with Session(self.engine) as db_session:
+            if self._sent_unflagged:
+                # Flag what the cloud already accepted before sending anything else
+                synced += self._flag_synced(db_session, self._sent_unflagged)
+                self._sent_unflagged = {}
 
-    def _sync_all_unsynced_profiles(self):
-        with self.get_session() as db_session:
-            # Fixed: was filtering on non-existent `scraped` column
-            unsynced = db_session.query(Profile).filter_by(
-                cloud_synced=False
-            ).filter(Profile.profile.isnot([ProfileState.DISCOVERED.value])).all()
+            while deadline is None or time.monotonic() < deadline:
+                query = (
+                    _unsynced(select(Profile.public_identifier, Profile.data, Profile.sync_version))
+                    .order_by(Profile.public_identifier)
+                    .limit(batch_size)
+                )
+                if last_id is not None:
+                    query = query.where(Profile.public_identifier > last_id)
+                rows = db_session.execute(query).all()
+                if not rows:
+                    break
 
-            if not unsynced:
-                logger.info("All profiles already synced")
-                return
+                payload = [row.data for row in rows if row.data]
+                if payload and not sync_profiles(payload):
+                    logger.error("Cloud sync failed after %s profile(s) — rest will retry on next sync", synced)
+                    return synced
 
-            payload = [p.data for p in unsynced if p.data]
-            if not payload:
-                return
+                sent = {row.public_identifier: row.sync_version for row in rows}
+                try:
+                    synced += self._flag_synced(db_session, sent)
+                except OperationalError:
+                    # e.g. "database is locked": flag them next time instead of sending them again
+                    self._sent_unflagged.update(sent)
+                    raise
+                last_id = rows[-1].public_identifier
 
-            success = sync_profiles(payload)
+        if synced:
+            logger.info("Synced %s new profile(s) to cloud", synced)
+        else:
+            logger.debug("No profiles synced")
+        return synced
 
-            if success:
-                for p in unsynced:
-                    p.cloud_synced = True
-                db_session.commit()
-                logger.info("Synced %s new profile(s) to cloud", len(payload))
-            else:
-                logger.error("Cloud sync failed — will retry on next close()")
+    @staticmethod
+    def _flag_synced(db_session, sent: Dict[str, int]) -> int:
+        """Flag sent rows whose `sync_version` is unchanged. Returns how many were flagged."""
+        try:
+            result = db_session.execute(_MARK_SYNCED, [
+                {"pid": public_identifier, "version": version} for public_identifier, version in sent.items()
+            ])
+            db_session.commit()
+        except Exception:
+            db_session.rollback()
+            raise
+        return result.rowcount
 
     @classmethod
     def from_handle(cls, handle: str) -> "Database":
@@ -71,4 +232,4 @@ class Database:
         config = get_account_config(handle)
         db_path = config["db_path"]
         logger.debug("DB path → %s", db_path)
-        return cls(db_path)
+        return cls(db_path, storage_profile=config.get("storage_profile"))
@@ -0,0 +1,98 @@
+# linkedin/db/events.py
+"""
+Time-windowed funnel queries over the `profile_events` transition log.
+
+    connects_sent = count_transitions(session, ProfileState.PENDING, since=week_ago)
+    median_accept = median_transition_time(session, ProfileState.PENDING, ProfileState.CONNECTED)
+"""
+import statistics
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased
+
+from linkedin.db.models import ProfileEvent
+from linkedin.navigation.enums import ProfileState
+
+
+def _in_window(query, column, since: Optional[datetime], until: Optional[datetime]):
+    if since is not None:
+        query = query.where(column >= since)
+    if until is not None:
+        query = query.where(column < until)
+    return query
+
+
+def count_transitions(
+        session: "AccountSession",
+        to_state: ProfileState | str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        from_state: Optional[ProfileState | str] = None,
+) -> int:
+    """How many transitions into `to_state` (optionally only from `from_state`) happened in [since, until)."""
+    query = select(func.count()).select_from(ProfileEvent) \
+        .where(ProfileEvent.to_state == ProfileState(to_state).value)
+    if from_state is not None:
+        query = query.where(ProfileEvent.from_state == ProfileState(from_state).value)
+    query = _in_window(query, ProfileEvent.created_at, since, until)
+    return session.db_session.execute(query).scalar_one()
+
+
+def funnel_counts(
+        session: "AccountSession",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+) -> Dict[str, int]:
+    """Transitions into every state within the window, e.g. {"enriched": 40, "pending": 25, ...}."""
+    query = select(ProfileEvent.to_state, func.count()).group_by(ProfileEvent.to_state)
+    query = _in_window(query, ProfileEvent.created_at, since, until)
+    counts = dict(session.db_session.execute(query).all())
+    return {state.value: counts.get(state.value, 0) for state in ProfileState}
+
+
+def transition_durations(
+        session: "AccountSession",
+        from_state: ProfileState | str,
+        to_state: ProfileState | str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+) -> List[timedelta]:
+    """
+    Time each profile spent going from `from_state` to `to_state`.
+
+    One sample per `to_state` transition inside the window, measured from the
+    latest earlier transition into `from_state` of the same profile.
+    Profiles that never passed through `from_state` are ignored.
+    """
+    entered = aliased(ProfileEvent)
+    reached = aliased(ProfileEvent)
+
+    entered_at = (
+        select(func.max(entered.created_at))
+        .where(entered.public_identifier == reached.public_identifier)
+        .where(entered.to_state == ProfileState(from_state).value)
+        .where(entered.created_at <= reached.created_at)
+        .scalar_subquery()
+    )
+    query = select(entered_at, reached.created_at).where(reached.to_state == ProfileState(to_state).value)
+    query = _in_window(query, reached.created_at, since, until)
+
+    return [
+        reached_at - started_at
+        for started_at, reached_at in session.db_session.execute(query)
+        if started_at is not None
+    ]
+
+
+def median_transition_time(
+        session: "AccountSession",
+        from_state: ProfileState | str,
+        to_state: ProfileState | str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+) -> Optional[timedelta]:
+    """Median of `transition_durations`, or None when there are no samples."""
+    durations = transition_durations(session, from_state, to_state, since, until)
+    return statistics.median(durations) if durations else None
@@ -0,0 +1,207 @@
+# linkedin/db/leads.py
+"""
+Campaign input staged in SQLite instead of an in-memory DataFrame.
+
+`stage_leads` appends CSV rows chunk by chunk (duplicates within a file are
+ignored by the `(source, public_identifier)` primary key); `iter_campaign_leads`
+streams them back in campaign order.
+`csv_imports` remembers which file version was staged, so it is read only once.
+"""
+import logging
+from datetime import datetime
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from sqlalchemy import and_, delete, distinct, func, insert, literal_column, or_, select
+
+from linkedin.db.limits import WEEKLY_CONNECTIONS, limit_is_active
+from linkedin.db.models import CampaignLead, CampaignQueue, CsvImport, Profile
+from linkedin.db.profiles import utcnow
+from linkedin.navigation.enums import ProfileState
+
+logger = logging.getLogger(__name__)
+
+# Leads fetched per keyset page while a campaign runs
+WORK_PAGE_SIZE = 500
+
+# Nothing left to do for these — skipped without ever reaching the campaign
+TERMINAL_STATES = frozenset({ProfileState.COMPLETED.value, ProfileState.FAILED.value})
+
+
+class Lead(NamedTuple):
+    """One unit of campaign work — a tuple, not a dict, so millions of them stay cheap."""
+    url: str
+    public_identifier: str
+    # Profile state when the page was fetched (None → not in `profiles` yet)
+    state: Optional[str] = None
+
+
+def stage_leads(session: "AccountSession", rows: List[Dict[str, str]], source: Optional[str] = None) -> int:
+    """
+    INSERT OR IGNORE `{"public_identifier", "url"}` rows in one transaction.
+    Returns the number of leads that were new to `source`.
+    """
+    if not rows:
+        return 0
+
+    db = session.db_session
+    # Driver-level executemany: skips per-row statement compilation on 50k-row chunks
+    result = db.connection().exec_driver_sql(
+        "INSERT OR IGNORE INTO campaign_leads (public_identifier, url, source) VALUES (?, ?, ?)",
+        [(r["public_identifier"], r["url"], source or "") for r in rows],
+    )
+    db.commit()
+    return result.rowcount
+
+
+def count_staged_leads(session: "AccountSession", source: Optional[str] = None) -> int:
+    query = session.db_session.query(func.count(distinct(CampaignLead.public_identifier)))
+    if source is not None:
+        query = query.filter(CampaignLead.source == source)
+    return query.scalar()
+
+
+def _campaign_order(*columns, source: Optional[str] = None, now: Optional[datetime] = None):
+    """
+    Staged leads that are due by `now`, in scheduler order.
+
+    A lead is due at its profile's `next_action_at` when set, else at its last
+    update (`added_at` for leads not in `profiles` yet). Leads are ranked by due
+    time within their state and the ranks are interleaved, so new leads,
+    invites to send, PENDING rechecks and follow-ups take turns instead of one
+    state starving the others. Within a turn never-seen leads go first, then
+    the earliest due; ties keep CSV order. Without a `source`, a lead staged
+    from several files is taken once, from the first of them.
+    """
+    rowid = literal_column("campaign_leads.rowid")
+    due_at = func.coalesce(Profile.next_action_at, Profile.updated_at, CampaignLead.added_at)
+    turn = func.row_number().over(
+        partition_by=func.coalesce(Profile.state, ProfileState.DISCOVERED.value),
+        order_by=(due_at, rowid),
+    )
+    query = (
+        select(*columns)
+        .outerjoin(Profile, Profile.public_identifier == CampaignLead.public_identifier)
+        .where(or_(Profile.next_action_at.is_(None), Profile.next_action_at <= (now or utcnow())))
+        .order_by(turn, Profile.public_identifier.is_not(None), due_at, rowid)
+    )
+    if source is not None:
+        query = query.where(CampaignLead.source == source)
+    else:
+        first_staged = (
+            select(func.min(literal_column("rowid")))
+            .select_from(CampaignLead)
+            .group_by(CampaignLead.public_identifier)
+            .correlate(None)
+        )
+        query = query.where(rowid.in_(first_staged))
+    return query
+
+
+def get_staged_profiles(session: "AccountSession", source: Optional[str] = None) -> List[Dict[str, str]]:
+    """Staged leads that are due now as `{"url", "public_identifier"}` dicts, in campaign order."""
+    query = _campaign_order(CampaignLead.url, CampaignLead.public_identifier, source=source)
+    return [dict(row._mapping) for row in session.db_session.execute(query)]
+
+
+def build_campaign_queue(session: "AccountSession", source: Optional[str] = None) -> int:
+    """
+    Snapshot the due leads, in campaign order, into `campaign_queue` (one
+    INSERT ... SELECT). ENRICHED leads are left out while the weekly connection
+    limit window is open. Returns the queue length.
+    """
+    db = session.db_session
+    db.execute(delete(CampaignQueue))
+    result = db.execute(
+        insert(CampaignQueue).from_select(
+            ["source", "public_identifier"],
+            _campaign_order(CampaignLead.source, CampaignLead.public_identifier, source=source)
+            # Connect work would only hit the weekly-limit popup again while its window is open
+            .where(or_(
+                Profile.state.is_distinct_from(ProfileState.ENRICHED.value),
+                ~limit_is_active(WEEKLY_CONNECTIONS),
+            )),
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+def iter_campaign_leads(
+        session: "AccountSession",
+        source: Optional[str] = None,
+        page_size: int = WORK_PAGE_SIZE,
+) -> Iterator[Lead]:
+    """
+    Lazily yield the campaign's unfinished leads, `page_size` at a time.
+
+    The order is fixed when iteration starts (`build_campaign_queue`), so
+    leads updated by the run itself don't move and are never revisited; leads
+    not due yet (e.g. a PENDING invite in its recheck backoff) are left out. Each
+    page is a keyset query on the queue's primary key that also prefetches
+    every lead's current state, so COMPLETED / FAILED leads are dropped here
+    without a per-row lookup. Pages are fetched only when the previous one is
+    used up, so states reflect the writes made while working through it.
+    """
+    total = build_campaign_queue(session, source)
+    logger.debug(f"Campaign queue → {total:,} leads")
+
+    db = session.db_session
+    last_position = 0
+    finished = 0
+    while True:
+        page = db.execute(
+            select(CampaignQueue.position, CampaignLead.url, CampaignLead.public_identifier, Profile.state)
+            # Outer join: a lead dropped mid-run leaves a hole, not an early end
+            .outerjoin(CampaignLead, and_(
+                CampaignLead.source == CampaignQueue.source,
+                CampaignLead.public_identifier == CampaignQueue.public_identifier,
+            ))
+            .outerjoin(Profile, Profile.public_identifier == CampaignQueue.public_identifier)
+            .where(CampaignQueue.position > last_position)
+            .order_by(CampaignQueue.position)
+            .limit(page_size)
+        ).all()
+        if not page:
+            break
+        for row in page:
+            if row.url is None:
+                continue
+            if row.state in TERMINAL_STATES:
+                finished += 1
+                continue
+            yield Lead(row.url, row.public_identifier, row.state)
+        last_position = page[-1].position
+
+    logger.info(f"Campaign queue done → skipped {finished:,} of {total:,} leads already completed or failed")
+
+
+def get_csv_import(session: "AccountSession", source: str) -> Optional[CsvImport]:
+    return session.db_session.get(CsvImport, source)
+
+
+def record_csv_import(
+        session: "AccountSession",
+        source: str,
+        size: int,
+        mtime_ns: int,
+        content_hash: str,
+        leads: int,
+        byte_offset: Optional[int] = None,
+        rows: int = 0,
+) -> CsvImport:
+    db = session.db_session
+    record = db.get(CsvImport, source) or CsvImport(source=source)
+    record.size, record.mtime_ns, record.content_hash, record.leads = size, mtime_ns, content_hash, leads
+    record.byte_offset = size if byte_offset is None else byte_offset
+    record.rows = rows
+    db.add(record)
+    db.commit()
+    return record
+
+
+def clear_staged_leads(session: "AccountSession", source: str) -> int:
+    """Drop the leads staged from `source` (before re-staging a changed file)."""
+    db = session.db_session
+    result = db.execute(delete(CampaignLead).where(CampaignLead.source == source))
+    db.commit()
+    return result.rowcount
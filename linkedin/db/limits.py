@@ -0,0 +1,55 @@
+# linkedin/db/limits.py
+"""
+Account limits that outlive a run.
+
+When LinkedIn shows the weekly-invitation popup, the hit is stored in
+`limit_windows` with an expiry. Until then the scheduler leaves connect work
+(ENRICHED leads) out of the campaign queue, so those profiles are neither
+loaded nor navigated to on the next runs.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import exists
+
+from linkedin.db.models import LimitWindow
+from linkedin.db.profiles import utcnow
+
+logger = logging.getLogger(__name__)
+
+WEEKLY_CONNECTIONS = "weekly_connections"
+
+# LinkedIn's invitation quota is a rolling week: probe again a day later rather than idling for seven
+CONNECTION_LIMIT_WINDOW = timedelta(days=1)
+
+
+def record_limit_hit(session: "AccountSession", name: str, window: timedelta) -> datetime:
+    """Open (or extend) the `name` window for `window` from now. Committed immediately; returns the expiry."""
+    db = session.db_session
+    now = utcnow()
+    row = db.get(LimitWindow, name) or LimitWindow(name=name)
+    row.hit_at, row.expires_at = now, now + window
+    db.add(row)
+    db.commit()
+    logger.info(f"Limit {name} reached → paused until {row.expires_at:%Y-%m-%d %H:%M} UTC")
+    return row.expires_at
+
+
+def limit_is_active(name: str, now: Optional[datetime] = None):
+    """SQL condition: the `name` window is open — for filtering work DB-side."""
+    return exists().where(LimitWindow.name == name, LimitWindow.expires_at > (now or utcnow()))
+
+
+def active_limit_until(session: "AccountSession", name: str) -> Optional[datetime]:
+    """Expiry of the `name` window if it is still open, else None."""
+    expires_at = session.db_session.query(LimitWindow.expires_at).filter_by(name=name).scalar()
+    return expires_at if expires_at and expires_at > utcnow() else None
+
+
+def record_connection_limit(session: "AccountSession") -> datetime:
+    return record_limit_hit(session, WEEKLY_CONNECTIONS, CONNECTION_LIMIT_WINDOW)
+
+
+def connection_limit_active(session: "AccountSession") -> bool:
+    return active_limit_until(session, WEEKLY_CONNECTIONS) is not None
@@ -0,0 +1,189 @@
+# linkedin/db/migrations.py
+"""
+Versioned schema migrations for the per-account SQLite database.
+
+`Base.metadata.create_all` only creates missing tables — it never touches
+tables that already exist. Everything else (new indexes, new columns, data
+rewrites) lives here as an ordered list of idempotent upgrade steps.
+
+The applied version is tracked in the `schema_version` table. Every step runs
+in its own transaction, so an interrupted upgrade resumes where it stopped.
+"""
+import logging
+from typing import Callable, List, NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from linkedin.db.counters import install_state_counters
+from linkedin.db.models import Base, CampaignLead, Profile
+from linkedin.db.types import decode_json_blob, encode_json_blob
+
+logger = logging.getLogger(__name__)
+
+REWRITE_BATCH_SIZE = 500
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, description: str):
+    """Register an upgrade step. Steps must be idempotent."""
+
+    def decorator(fn: Callable[[Connection], None]):
+        MIGRATIONS.append(Migration(version, description, fn))
+        return fn
+
+    return decorator
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+def _create_model_index(conn: Connection, table, name: str):
+    """Create an index declared on a model (`__table_args__`) if it is missing."""
+    index = next(ix for ix in table.indexes if ix.name == name)
+    index.create(bind=conn, checkfirst=True)
+
+
+def _add_column(conn: Connection, table: str, column_ddl: str) -> bool:
+    """ALTER TABLE ... ADD COLUMN unless the table is missing or already has it. Returns True if added."""
+    column = column_ddl.split()[0]
+    existing = {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+    if not existing or column in existing:
+        return False
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column_ddl}"))
+    return True
+
+
+# ----------------------------------------------------------------------
+# Migrations (append only — never edit or renumber a shipped step)
+# ----------------------------------------------------------------------
+@migration(1, "index profiles(state, updated_at)")
+def _index_profiles_state_updated_at(conn: Connection):
+    _create_model_index(conn, Profile.__table__, "ix_profiles_state_updated_at")
+
+
+@migration(2, "index profiles(cloud_synced)")
+def _index_profiles_cloud_synced(conn: Connection):
+    _create_model_index(conn, Profile.__table__, "ix_profiles_cloud_synced")
+
+
+@migration(3, "compress profiles.data")
+def _compress_profiles_data(conn: Connection):
+    select_batch = text(
+        "SELECT rowid, data FROM profiles WHERE typeof(data) = 'text' AND rowid > :after ORDER BY rowid LIMIT :limit"
+    )
+    update = text("UPDATE profiles SET data = :data WHERE rowid = :rowid")
+
+    after, rewritten = 0, 0
+    while rows := conn.execute(select_batch, {"after": after, "limit": REWRITE_BATCH_SIZE}).all():
+        conn.execute(update, [
+            {"rowid": rowid, "data": encode_json_blob(decode_json_blob(data))}
+            for rowid, data in rows
+        ])
+        after = rows[-1].rowid
+        rewritten += len(rows)
+
+    logger.info("Compressed raw data of %d profile(s)", rewritten)
+
+
+@migration(4, "maintain state_counters with triggers")
+def _state_counter_triggers(conn: Connection):
+    install_state_counters(conn)
+
+
+@migration(5, "csv_imports: imported byte offset + row count")
+def _csv_import_offsets(conn: Connection):
+    if _add_column(conn, "csv_imports", "byte_offset INTEGER NOT NULL DEFAULT 0"):
+        # Existing rows were fingerprinted over the whole file
+        conn.execute(text("UPDATE csv_imports SET byte_offset = size"))
+    _add_column(conn, "csv_imports", "rows INTEGER NOT NULL DEFAULT 0")
+
+
+@migration(6, "profiles: next_action_at + recheck_count")
+def _profile_schedule(conn: Connection):
+    # Existing rows keep next_action_at NULL → due on the next run
+    _add_column(conn, "profiles", "next_action_at DATETIME")
+    _add_column(conn, "profiles", "recheck_count INTEGER NOT NULL DEFAULT 0")
+
+
+@migration(7, "campaign_leads keyed by (source, public_identifier)")
+def _campaign_leads_per_source(conn: Connection):
+    columns = conn.execute(text("PRAGMA table_info(campaign_leads)")).all()
+    key = [row[1] for row in sorted(columns, key=lambda r: r[5]) if row[5]]
+    if key and key != ["source", "public_identifier"]:
+        # SQLite can't change a primary key in place: rebuild, keeping rowid (CSV) order
+        conn.execute(text("ALTER TABLE campaign_leads RENAME TO campaign_leads_old"))
+        CampaignLead.__table__.create(bind=conn)
+        conn.execute(text(
+            "INSERT INTO campaign_leads (source, public_identifier, url, added_at) "
+            "SELECT coalesce(source, ''), public_identifier, url, added_at FROM campaign_leads_old ORDER BY rowid"
+        ))
+        conn.execute(text("DROP TABLE campaign_leads_old"))
+    _add_column(conn, "campaign_queue", "source VARCHAR NOT NULL DEFAULT ''")
+
+
+
+@migration(8, "profiles: sync_version")
+def _profile_sync_version(conn: Connection):
+    _add_column(conn, "profiles", "sync_version INTEGER NOT NULL DEFAULT 0")
+
+
+@migration(9, "profiles.cloud_synced: legacy 'false' literal to 0")
+def _normalize_cloud_synced(conn: Connection):
+    # Rows that took the old server default store the text 'false', which an
+    # indexed `cloud_synced IS 0` lookup would miss
+    fixed = conn.execute(text("UPDATE profiles SET cloud_synced = 0 WHERE cloud_synced NOT IN (0, 1)")).rowcount
+    logger.info("Normalised cloud_synced of %d profile(s)", fixed)
+
+
+# ----------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------
+def get_schema_version(conn: Connection) -> int:
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_version ("
+        " version INTEGER PRIMARY KEY,"
+        " description TEXT NOT NULL,"
+        " applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+    ))
+    return conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar() or 0
+
+
+def run_migrations(engine: Engine) -> int:
+    """
+    Apply every pending migration in version order.
+    Returns the schema version the database is at afterwards.
+    """
+    with engine.begin() as conn:
+        current = get_schema_version(conn)
+
+    for step in sorted(MIGRATIONS, key=lambda m: m.version):
+        if step.version <= current:
+            continue
+
+        logger.info("Migrating DB schema → v%d (%s)", step.version, step.description)
+        with engine.begin() as conn:
+            step.upgrade(conn)
+            conn.execute(
+                text("INSERT INTO schema_version (version, description) VALUES (:version, :description)"),
+                {"version": step.version, "description": step.description},
+            )
+        current = step.version
+
+    return current
+
+
+def ensure_schema(engine: Engine) -> int:
+    """Create missing tables, then bring the schema up to the latest version."""
+    Base.metadata.create_all(bind=engine)
+    version = run_migrations(engine)
+    logger.debug("DB schema ready (v%d)", version)
+    return version
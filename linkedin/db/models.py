@@ -1,14 +1,22 @@
 # linkedin/db_models.py
 
-from sqlalchemy import Column, String, JSON, DateTime, Boolean, Integer
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import Column, String, JSON, DateTime, Boolean, Index, Integer
+from sqlalchemy.orm import declarative_base, deferred
 from sqlalchemy.sql import func
 
+from linkedin.db.types import CompressedJSON
+
 Base = declarative_base()
 
 
 class Profile(Base):
     __tablename__ = 'profiles'
+    __table_args__ = (
+        # Work queue lookups (next DISCOVERED to scrape, pending counts, oldest-first sorting)
+        Index("ix_profiles_state_updated_at", "state", "updated_at"),
+        # Cloud sync backlog scan
+        Index("ix_profiles_cloud_synced", "cloud_synced"),
+    )
 
     # USING public_identifier as primary key
     public_identifier = Column(String, primary_key=True)
@@ -16,13 +24,125 @@ class Profile(Base):
     # Parsed / cleaned data (what you return from get_profile)
     profile = Column(JSON, nullable=True)
 
-    # Full raw JSON from LinkedIn's API (for debugging, re-parsing, etc.)
-    data = Column(JSON, nullable=True)
+    # Full raw JSON from LinkedIn's API (for debugging, re-parsing, etc.) — zlib-compressed on disk.
+    # Deferred: tens of KB per row, loaded only when the attribute is accessed.
+    data = deferred(Column(CompressedJSON, nullable=True))
 
     # Whether this profile has been sent to your backend / cloud / CRM
-    cloud_synced = Column(Boolean, default=False, server_default='false', nullable=False)
+    cloud_synced = Column(Boolean, default=False, server_default='0', nullable=False)
+    # Bumped by every write that needs a re-sync, so a sync only flags rows unchanged since it read them
+    sync_version = Column(Integer, nullable=False, default=0, server_default='0')
 
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    state = Column(String, nullable=False, default="discovered")
\ No newline at end of file
+    state = Column(String, nullable=False, default="discovered")
+
+    # When the campaign should look at this profile again (None → as soon as it comes up)
+    next_action_at = Column(DateTime, nullable=True)
+    # Consecutive PENDING checks that found nothing new — drives the recheck backoff
+    recheck_count = Column(Integer, nullable=False, default=0, server_default='0')
+
+
+class ProfileEvent(Base):
+    """Append-only log of state transitions, written in the same transaction as the state update."""
+    __tablename__ = 'profile_events'
+    __table_args__ = (
+        # Time-windowed funnel counts ("connects sent this week")
+        Index("ix_profile_events_to_state_created_at", "to_state", "created_at"),
+        # Per-profile history (time spent between two states)
+        Index("ix_profile_events_public_identifier_created_at", "public_identifier", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    public_identifier = Column(String, nullable=False)
+
+    # None when the transition created the profile
+    from_state = Column(String, nullable=True)
+    to_state = Column(String, nullable=False)
+
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+
+class StateCounter(Base):
+    """Row count per profile state, kept current by SQLite triggers on `profiles` (see linkedin/db/counters.py)."""
+    __tablename__ = 'state_counters'
+
+    state = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0, server_default='0')
+
+
+class CampaignLead(Base):
+    """Input leads staged from a campaign CSV, one row per (source, public_identifier) (see linkedin/db/leads.py)."""
+    __tablename__ = 'campaign_leads'
+
+    # Resolved path of the input file ('' when staged without one); leading the key, so it indexes per-file lookups
+    source = Column(String, primary_key=True, default='', server_default='')
+    public_identifier = Column(String, primary_key=True)
+    url = Column(String, nullable=False)
+
+    added_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+
+class CampaignQueue(Base):
+    """
+    Run-start snapshot of the campaign order: `position` follows the sort, so the
+    run pages through it by primary key (see `iter_campaign_leads`).
+    """
+    __tablename__ = 'campaign_queue'
+
+    position = Column(Integer, primary_key=True)
+    source = Column(String, nullable=False, default='', server_default='')
+    public_identifier = Column(String, nullable=False)
+
+
+class CsvImport(Base):
+    """Fingerprint of the last CSV staged into `campaign_leads`, so an unchanged file is not re-read."""
+    __tablename__ = 'csv_imports'
+
+    # Resolved path of the input file (same value as CampaignLead.source)
+    source = Column(String, primary_key=True)
+
+    size = Column(Integer, nullable=False)
+    mtime_ns = Column(Integer, nullable=False)
+
+    # Imported prefix: bytes [0, byte_offset) up to the last complete line, its SHA-256
+    # and how many data rows it holds. An append-only file only needs its tail read.
+    byte_offset = Column(Integer, nullable=False, default=0, server_default='0')
+    content_hash = Column(String, nullable=False)
+    rows = Column(Integer, nullable=False, default=0, server_default='0')
+
+    # Leads staged from this file
+    leads = Column(Integer, nullable=False, default=0)
+
+    imported_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class LimitWindow(Base):
+    """An account-level limit LinkedIn reported, and when to try again (see linkedin/db/limits.py)."""
+    __tablename__ = 'limit_windows'
+
+    # e.g. "weekly_connections"
+    name = Column(String, primary_key=True)
+
+    hit_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+
+class ReparseRun(Base):
+    """Checkpoint of an offline re-parse pass over `profiles.data` (see linkedin/db/reparse.py)."""
+    __tablename__ = 'reparse_runs'
+
+    # Which parser the pass runs, e.g. "voyager"
+    name = Column(String, primary_key=True)
+
+    # Last public_identifier whose batch was written; the pass resumes after it
+    last_key = Column(String, nullable=True)
+
+    processed = Column(Integer, nullable=False, default=0)
+    changed = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+
+    started_at = Column(DateTime, nullable=False)
+    # None while the pass is unfinished
+    finished_at = Column(DateTime, nullable=True)
@@ -1,7 +1,9 @@
 # linkedin/db/profiles.py
 import json
 import logging
-from typing import Dict, Any, Optional
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Tuple
 from typing import List
 from urllib.parse import urlparse, unquote
 
@@ -9,11 +11,58 @@ import pandas as pd
 from sqlalchemy import func
 from termcolor import colored
 
-from linkedin.db.models import Profile
+from linkedin.db.counters import get_state_count
+from linkedin.db.models import Profile, ProfileEvent
+from linkedin.db.types import dumps_json
 from linkedin.navigation.enums import ProfileState
 
 logger = logging.getLogger(__name__)
 
+# PENDING invites are rechecked after 12h, 24h, 48h, ... capped at a week
+PENDING_RECHECK_BASE = timedelta(hours=12)
+PENDING_RECHECK_CAP = timedelta(days=7)
+
+
+def _commit(session: "AccountSession"):
+    """Commit now, or hand the write to the session's write-behind buffer if it has one."""
+    write_buffer = getattr(session, "write_buffer", None)
+    if write_buffer is None:
+        session.db_session.commit()
+    else:
+        write_buffer.record()
+
+
+def _record_transition(db, public_identifier: str, from_state: Optional[str], to_state: str):
+    """Append to the event log — caller commits, so it shares the state update's transaction."""
+    if from_state == to_state:
+        return
+    db.add(ProfileEvent(public_identifier=public_identifier, from_state=from_state, to_state=to_state))
+
+
+def utcnow() -> datetime:
+    """Naive UTC, the same clock as SQLite's CURRENT_TIMESTAMP defaults."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def pending_recheck_delay(recheck_count: int) -> timedelta:
+    # Clamp the exponent first: 2**n overflows timedelta long before the cap matters
+    return min(PENDING_RECHECK_BASE * 2 ** min(recheck_count, 16), PENDING_RECHECK_CAP)
+
+
+def _schedule_next_action(row: Profile, from_state: Optional[str], to_state: str):
+    """
+    Set when the campaign should come back to this profile.
+
+    A fresh PENDING invite waits PENDING_RECHECK_BASE; every check that finds
+    it still pending doubles the wait. Any other state is due right away.
+    """
+    if to_state == ProfileState.PENDING.value:
+        row.recheck_count = (row.recheck_count or 0) + 1 if from_state == to_state else 0
+        row.next_action_at = utcnow() + pending_recheck_delay(row.recheck_count)
+    else:
+        row.recheck_count = 0
+        row.next_action_at = None
+
 
 def add_profile_urls(session: "AccountSession", urls: List[str]):
     if not urls:
@@ -25,53 +74,114 @@ def add_profile_urls(session: "AccountSession", urls: List[str]):
 
     db = session.db_session
     to_insert = [{"public_identifier": pid} for pid in public_ids]
-    db.execute(
+    # RETURNING only yields the rows OR IGNORE actually inserted: log those as discovered
+    inserted = db.execute(
         Profile.__table__.insert()
         .prefix_with("OR IGNORE")
         .values(to_insert)
-    )
-    db.commit()
+        .returning(Profile.public_identifier)
+    ).scalars().all()
+    if inserted:
+        db.execute(
+            ProfileEvent.__table__.insert(),
+            [{"public_identifier": pid, "to_state": ProfileState.DISCOVERED.value} for pid in inserted],
+        )
+    _commit(session)
 
-    logger.debug(f"Discovered {len(public_ids)} unique LinkedIn profiles")
+    logger.debug(f"Discovered {len(inserted)} new of {len(public_ids)} unique LinkedIn profiles")
 
 
-def save_scraped_profile(
-        session: "AccountSession",
-        url: str,
-        profile: Dict[str, Any],
-        data: Optional[Dict[str, Any]] = None,
-):
-    public_id = url_to_public_id(url)
-    if not public_id:
-        logger.warning(f"Invalid LinkedIn URL, cannot save profile: {url}")
-        return
-
-    db = session.db_session
-
-    # Get existing or create new instance
-    profile_db = db.get(Profile, public_id)
+def _apply_scraped(db, profile_db: Optional[Profile], public_id: str, profile, data) -> Profile:
+    """Write a scraped profile onto its row (created if `profile_db` is None) as ENRICHED — caller commits."""
     if profile_db is None:
+        previous_state = None
         profile_db = Profile(public_identifier=public_id)
         db.add(profile_db)
         logger.debug(f"New profile created in DB: {public_id}")
     else:
+        previous_state = profile_db.state
         logger.debug(f"Updating existing profile: {public_id}")
 
     # Now safely update fields
     profile_db.profile = profile
     profile_db.data = data
     profile_db.cloud_synced = False
+    if previous_state is not None:
+        # In SQL, so a sync that read the row before this write won't flag it as synced
+        profile_db.sync_version = Profile.sync_version + 1
     # Force re-sync on next close()
     profile_db.updated_at = func.now()
     profile_db.state = ProfileState.ENRICHED.value
+    _schedule_next_action(profile_db, previous_state, ProfileState.ENRICHED.value)
+    _record_transition(db, public_id, previous_state, ProfileState.ENRICHED.value)
+    return profile_db
 
-    db.commit()
+
+def save_scraped_profile(
+        session: "AccountSession",
+        url: str,
+        profile: Dict[str, Any],
+        data: Optional[Dict[str, Any] | bytes] = None,
+):
+    """Store a scraped profile as ENRICHED. `data` is the raw response — as a dict, or its JSON bytes stored verbatim."""
+    public_id = url_to_public_id(url)
+    if not public_id:
+        logger.warning(f"Invalid LinkedIn URL, cannot save profile: {url}")
+        return
+
+    db = session.db_session
+    _apply_scraped(db, db.get(Profile, public_id), public_id, profile, data)
+    _commit(session)
 
     debug_profile_preview(profile) if logger.isEnabledFor(logging.DEBUG) else None
 
     logger.debug(f"SUCCESS: Saved enriched profile → {public_id}")
 
 
+def save_scraped_profiles(
+        session: "AccountSession",
+        profiles: Dict[str, Dict[str, Any]],
+        data: Optional[Dict[str, Any] | bytes] = None,
+) -> int:
+    """
+    Store several parsed profiles from one response (`parse_many`) as ENRICHED
+    in a single transaction, each under the public_identifier it is keyed by.
+    Existing rows are loaded with one query; every row gets the shared raw
+    response `data`, which holds each profile's entity, so a re-parse can
+    refresh any of them. Returns the number saved.
+    """
+    by_id = {public_id: profile for public_id, profile in profiles.items() if public_id}
+    if not by_id:
+        return 0
+
+    if isinstance(data, dict):
+        data = dumps_json(data)  # serialize once for every row
+
+    db = session.db_session
+    # A response embeds a handful of members — one IN (...) query covers them
+    existing = {
+        row.public_identifier: row
+        for row in db.query(Profile).filter(Profile.public_identifier.in_(list(by_id)))
+    }
+
+    for public_id, profile in by_id.items():
+        _apply_scraped(db, existing.get(public_id), public_id, profile, data)
+    _commit(session)
+
+    logger.debug(f"SUCCESS: Saved {len(by_id)} enriched profiles → {', '.join(by_id)}")
+    return len(by_id)
+
+
+def get_profile_states(session: "AccountSession", public_identifiers: List[str]) -> Dict[str, str]:
+    """`{public_identifier: state}` for the ones that exist, in one query."""
+    if not public_identifiers:
+        return {}
+    rows = session.db_session \
+        .query(Profile.public_identifier, Profile.state) \
+        .filter(Profile.public_identifier.in_(public_identifiers))
+    return dict(rows.all())
+
+
 def get_next_url_to_scrape(session: "AccountSession", limit: int = 1) -> List[str]:
     rows = (session.db_session
             .query(Profile.public_identifier)
@@ -82,10 +192,8 @@ def get_next_url_to_scrape(session: "AccountSession", limit: int = 1) -> List[st
 
 
 def count_pending_scrape(session: "AccountSession") -> int:
-    return (session.db_session
-            .query(Profile)
-            .filter(Profile.state == ProfileState.DISCOVERED.value)
-            .count())
+    # Single-row read from the trigger-maintained counters — no COUNT(*) scan
+    return get_state_count(session, ProfileState.DISCOVERED)
 
 
 def url_to_public_id(url: str) -> str:
@@ -108,6 +216,34 @@ def url_to_public_id(url: str) -> str:
     return unquote(public_id)
 
 
+# Common case of url_to_public_id: absolute http(s) URL whose id needs no percent-decoding.
+# Anything else (relative paths, %-escapes, params, whitespace, odd netlocs) goes through url_to_public_id.
+_CLEAN_PROFILE_URL_RE = re.compile(
+    r"^(?i:https?)://[^/?#\s\[\]]*/in/([^/?#;%\s]+)(?:/[^?#;\s]*)?(?:[?#]\S*)?$"
+)
+
+
+def extract_public_ids(urls: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Vectorized, non-raising `url_to_public_id` over a Series of URLs.
+
+    Returns `(public_ids, rejections)` aligned with `urls`: for every row exactly
+    one of them is set — the public id, or the reason the URL was rejected.
+    """
+    public_ids = urls.str.extract(_CLEAN_PROFILE_URL_RE, expand=False).astype(object)
+    rejections = pd.Series([None] * len(urls), index=urls.index, dtype=object)
+
+    for idx in public_ids.index[public_ids.isna()]:
+        url = urls.at[idx]
+        try:
+            public_ids.at[idx] = url_to_public_id(url if isinstance(url, str) else "")
+        except ValueError as e:
+            public_ids.at[idx] = None
+            rejections.at[idx] = str(e)
+
+    return public_ids, rejections
+
+
 def public_id_to_url(public_id: str) -> str:
     """
     Convert public_identifier back to a clean LinkedIn profile URL.
@@ -129,21 +265,56 @@ def get_profile_from_url(session: "AccountSession", url: str):
 
 
 def get_profile(session: "AccountSession", public_identifier: str) -> Any:
+    """Full ORM row. The raw `data` blob is deferred — it only loads if accessed."""
     return session.db_session \
         .query(Profile) \
         .filter_by(public_identifier=public_identifier) \
         .first()
 
 
+# ── Projection lookups: read only the columns the caller needs, no ORM row ──
+
+def get_profile_state(session: "AccountSession", public_identifier: str) -> Optional[str]:
+    return session.db_session \
+        .query(Profile.state) \
+        .filter_by(public_identifier=public_identifier) \
+        .scalar()
+
+
+def get_parsed_profile(session: "AccountSession", public_identifier: str) -> Optional[Dict[str, Any]]:
+    return session.db_session \
+        .query(Profile.profile) \
+        .filter_by(public_identifier=public_identifier) \
+        .scalar()
+
+
+def get_state_and_profile(
+        session: "AccountSession",
+        public_identifier: str,
+) -> tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """(state, parsed profile) in one query, or (None, None) when the profile is unknown."""
+    row = session.db_session \
+        .query(Profile.state, Profile.profile) \
+        .filter_by(public_identifier=public_identifier) \
+        .first()
+    return (row.state, row.profile) if row else (None, None)
+
+
 def set_profile_state(session: "AccountSession", public_identifier, new_state: str):
+    new_state = ProfileState(new_state).value
+
     db = session.db_session
     row = db.get(Profile, public_identifier)
     if not row:
+        previous_state = None
         row = Profile(public_identifier=public_identifier, state=new_state)
         db.add(row)
     else:
+        previous_state = row.state
         row.state = new_state
-    db.commit()
+    _schedule_next_action(row, previous_state, new_state)
+    _record_transition(db, public_identifier, previous_state, new_state)
+    _commit(session)
 
     log_msg = None
     match new_state:
@@ -167,28 +338,3 @@ def debug_profile_preview(enriched):
     pretty = json.dumps(enriched, indent=2, ensure_ascii=False, default=str)
     preview_lines = pretty.splitlines()[:3]
     logger.debug("=== ENRICHED PROFILE PREVIEW ===\n%s\n...", '\n'.join(preview_lines))
-
-
-def get_updated_at_df(session: "AccountSession", public_identifiers: List[str]) -> pd.DataFrame:
-    """
-    Return a DataFrame with public_identifier and updated_at for existing profiles.
-    """
-    if not public_identifiers:
-        return pd.DataFrame(columns=["public_identifier", "updated_at"])
-
-    db = session.db_session
-
-    results = (
-        db.query(Profile.public_identifier, Profile.updated_at)
-        .filter(Profile.public_identifier.in_(public_identifiers))
-        .all()
-    )
-
-    if not results:
-        return pd.DataFrame(columns=["public_identifier", "updated_at"])
-
-    df = pd.DataFrame(results, columns=["public_identifier", "updated_at"])
-
-    logger.debug(f"Retrieved updated_at for {len(df)} profiles from DB")
-
-    return df
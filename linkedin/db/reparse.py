@@ -0,0 +1,189 @@
+# linkedin/db/reparse.py
+"""
+Offline re-parse of the raw Voyager payloads kept in `profiles.data`.
+
+When `parse_linkedin_voyager_response` improves, stored profiles can be
+refreshed without a browser. Raw blobs are streamed from the account DB in
+keyset batches, then decoded and parsed in a process pool. Only the rows whose
+parsed profile changed are written back, one transaction per batch, and they
+are flagged for cloud sync again.
+
+The pass is checkpointed in `reparse_runs` inside each batch's transaction, so
+an interrupted run resumes after the last batch written.
+
+    python -m linkedin.db.reparse <handle> [--workers N] [--batch-size N] [--restart]
+"""
+import logging
+import time
+from itertools import tee
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import LargeBinary, bindparam, func, select, type_coerce, update
+
+from linkedin.api.voyager import parse_linkedin_voyager_response
+from linkedin.db.models import Profile, ReparseRun
+from linkedin.db.profiles import utcnow
+from linkedin.db.types import decode_json_blob
+from linkedin.utils import ordered_pool_map
+
+logger = logging.getLogger(__name__)
+
+REPARSE_BATCH_SIZE = 500
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 5.0
+
+VOYAGER = "voyager"
+
+profiles_table = Profile.__table__
+
+# Raw column value: blobs cross the process boundary still compressed
+RAW_DATA = type_coerce(profiles_table.c.data, LargeBinary)
+
+WRITE_BACK = (
+    update(profiles_table)
+    .where(profiles_table.c.public_identifier == bindparam("pid"))
+    # Keep updated_at: a re-parse is not campaign activity and must not reorder the work queue
+    .values(
+        profile=bindparam("new_profile"),
+        cloud_synced=False,
+        sync_version=profiles_table.c.sync_version + 1,
+        updated_at=profiles_table.c.updated_at,
+    )
+)
+
+ParseResult = Tuple[str, Optional[Dict[str, Any]], Optional[str]]
+
+
+def parse_raw_batch(rows: List[Tuple[str, bytes]]) -> List[ParseResult]:
+    """Decode + parse `(public_identifier, raw blob)` rows → `(public_identifier, profile, error)`. Runs in workers."""
+    results = []
+    for public_identifier, blob in rows:
+        try:
+            profile = parse_linkedin_voyager_response(decode_json_blob(blob), public_identifier=public_identifier)
+        except Exception as e:
+            results.append((public_identifier, None, f"{type(e).__name__}: {e}"))
+        else:
+            results.append((public_identifier, profile, None))
+    return results
+
+
+def _raw_batches(db, after: Optional[str], batch_size: int) -> Iterator[List[tuple]]:
+    """`(public_identifier, stored profile, raw blob)` rows with a payload, in key order, `batch_size` at a time."""
+    while True:
+        query = (
+            select(profiles_table.c.public_identifier, profiles_table.c.profile, RAW_DATA)
+            .where(profiles_table.c.data.is_not(None))
+            .order_by(profiles_table.c.public_identifier)
+            .limit(batch_size)
+        )
+        if after is not None:
+            query = query.where(profiles_table.c.public_identifier > after)
+        batch = db.execute(query).all()
+        if not batch:
+            return
+        after = batch[-1].public_identifier
+        yield batch
+
+
+def _parsed_batches(batches: Iterator[List[tuple]], workers: int) -> Iterator[Tuple[List[tuple], List[ParseResult]]]:
+    """Pairs each batch with its parse results, in input order (see `ordered_pool_map`)."""
+    batches, to_parse = tee(batches)
+    raw = ([(row.public_identifier, row.data) for row in batch] for batch in to_parse)
+    yield from zip(batches, ordered_pool_map(parse_raw_batch, raw, workers))
+
+
+def _start_or_resume(db, restart: bool) -> ReparseRun:
+    run = db.get(ReparseRun, VOYAGER)
+    if run is not None and run.finished_at is None and not restart:
+        logger.info(f"Resuming re-parse after {run.last_key!r} ({run.processed:,} profiles done)")
+        return run
+
+    run = run or ReparseRun(name=VOYAGER)
+    run.last_key, run.processed, run.changed, run.failed = None, 0, 0, 0
+    run.started_at, run.finished_at = utcnow(), None
+    db.add(run)
+    db.commit()
+    return run
+
+
+def reparse_profiles(
+        session: "AccountSession",
+        workers: int = 1,
+        batch_size: int = REPARSE_BATCH_SIZE,
+        restart: bool = False,
+) -> ReparseRun:
+    """
+    Re-run the Voyager parser over every stored raw payload.
+
+    Resumes an unfinished pass unless `restart`; a finished one starts over.
+    Rows the parser rejects keep their current profile and are counted as failed.
+    Returns the checkpoint row with the final counts.
+    """
+    db = session.db_session
+    run = _start_or_resume(db, restart)
+
+    remaining = select(func.count()).select_from(profiles_table).where(profiles_table.c.data.is_not(None))
+    if run.last_key is not None:
+        remaining = remaining.where(profiles_table.c.public_identifier > run.last_key)
+    total = run.processed + db.execute(remaining).scalar()
+
+    started = last_report = time.perf_counter()
+    done_before = run.processed
+    for batch, results in _parsed_batches(_raw_batches(db, run.last_key, batch_size), workers):
+        stored = {row.public_identifier: row.profile for row in batch}
+        changes = []
+        for public_identifier, profile, error in results:
+            if error is not None:
+                run.failed += 1
+                logger.debug(f"Re-parse failed → {public_identifier}: {error}")
+            elif profile != stored[public_identifier]:
+                changes.append({"pid": public_identifier, "new_profile": profile})
+
+        if changes:
+            db.execute(WRITE_BACK, changes)
+        run.last_key = batch[-1].public_identifier
+        run.processed += len(batch)
+        run.changed += len(changes)
+        db.commit()
+
+        now = time.perf_counter()
+        if now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            rate = (run.processed - done_before) / (now - started)
+            eta = (total - run.processed) / rate if rate else 0
+            logger.info(
+                f"Re-parse {run.processed:,}/{total:,} │ {rate:,.0f} profiles/s │ "
+                f"{run.changed:,} changed │ {run.failed:,} failed │ ETA {eta:,.0f}s"
+            )
+
+    run.finished_at = utcnow()
+    db.commit()
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"Re-parse done → {run.processed:,} profiles ({run.changed:,} changed, {run.failed:,} failed) "
+        f"in {elapsed:,.1f}s"
+    )
+    return run
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    from types import SimpleNamespace
+
+    from linkedin.db.engine import Database
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("handle")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=REPARSE_BATCH_SIZE)
+    parser.add_argument("--restart", action="store_true", help="start over instead of resuming an unfinished pass")
+    args = parser.parse_args()
+
+    db = Database.from_handle(args.handle)
+    session = SimpleNamespace(db_session=db.get_session())
+    reparse_profiles(session, workers=args.workers, batch_size=args.batch_size, restart=args.restart)
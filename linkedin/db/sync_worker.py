@@ -0,0 +1,154 @@
+# linkedin/db/sync_worker.py
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 300.0
+DEFAULT_BACKLOG_THRESHOLD = 200
+DEFAULT_POLL_SECONDS = 10.0
+DEFAULT_SHUTDOWN_TIMEOUT = 15.0
+
+
+class CloudSyncWorker:
+    """
+    Pushes unsynced profiles to the cloud from a daemon thread.
+
+    The worker never touches the account's long-lived session: `Database.Session`
+    is thread-scoped, so every sync runs on the worker's own session and
+    connection, and the Playwright thread is never blocked by it. A sync runs
+
+    - every `interval_seconds`
+    - as soon as the backlog reaches `backlog_threshold` profiles (checked every `poll_seconds`)
+    - once more on `stop()`, bounded by `shutdown_timeout` — whatever is left
+      is picked up by the next run
+
+    With a `write_buffer`, the account session holds SQLite's write lock from
+    its first buffered write until the buffer commits; a sync is skipped while
+    writes are pending, rather than sending a batch it could not flag.
+
+    `lag_seconds`, `backlog`, `synced_total` and `failures` expose how far behind the cloud is.
+    """
+
+    def __init__(
+            self,
+            db,
+            interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+            backlog_threshold: int = DEFAULT_BACKLOG_THRESHOLD,
+            poll_seconds: float = DEFAULT_POLL_SECONDS,
+            shutdown_timeout: float = DEFAULT_SHUTDOWN_TIMEOUT,
+            write_buffer=None,
+    ):
+        if backlog_threshold < 1:
+            raise ValueError("backlog_threshold must be >= 1")
+
+        self.db = db
+        self.interval_seconds = interval_seconds
+        self.backlog_threshold = backlog_threshold
+        self.poll_seconds = min(poll_seconds, interval_seconds)
+        self.shutdown_timeout = shutdown_timeout
+        self.write_buffer = write_buffer
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_run_at = time.monotonic()
+
+        # Stats
+        self.started_at = time.monotonic()
+        self.last_success_at: Optional[float] = None
+        self.backlog: Optional[int] = None
+        self.synced_total = 0
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+
+    @classmethod
+    def from_config(
+            cls, db, spec: Optional[bool | Dict[str, Any]], write_buffer=None,
+    ) -> Optional["CloudSyncWorker"]:
+        """Build from the `background_sync` account setting (false/None → disabled, true → defaults)."""
+        if not spec:
+            return None
+        if spec is True:
+            return cls(db, write_buffer=write_buffer)
+        return cls(db, write_buffer=write_buffer, **spec)
+
+    @property
+    def lag_seconds(self) -> float:
+        """Seconds since the last sync that left no backlog behind (or since start)."""
+        return time.monotonic() - (self.last_success_at or self.started_at)
+
+    def start(self) -> "CloudSyncWorker":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="cloud-sync", daemon=True)
+            self._thread.start()
+            logger.debug("Background cloud sync started → %r", self)
+        return self
+
+    def stop(self) -> bool:
+        """Final drain within `shutdown_timeout`. Returns True if the backlog was fully synced."""
+        if self._thread is None:
+            return self.backlog == 0
+        self._stop.set()
+        # Drain deadline + a grace period for the batch in flight
+        self._thread.join(self.shutdown_timeout + 5.0)
+        if self._thread.is_alive():
+            logger.warning("Background cloud sync still busy after %.0fs — leaving it for the next run",
+                           self.shutdown_timeout)
+        self._thread = None
+        logger.info("Background cloud sync stopped → %r", self)
+        return self.backlog == 0
+
+    def sync_once(self, deadline: Optional[float] = None) -> int:
+        """One sync pass on the calling thread's session. Errors are counted, never raised."""
+        self.runs += 1
+        self._last_run_at = time.monotonic()
+        if self.write_buffer and self.write_buffer.pending_ops:
+            # The account session holds the write lock until its buffer commits
+            self.skipped += 1
+            logger.debug("Background cloud sync deferred → %d buffered write(s) pending",
+                         self.write_buffer.pending_ops)
+            return 0
+        try:
+            synced = self.db._sync_all_unsynced_profiles(deadline=deadline)
+            self.synced_total += synced
+            self.backlog = self.db.count_unsynced_profiles()
+        except OperationalError as e:
+            # e.g. "database is locked" while the campaign thread holds a write — retry next tick
+            self.failures += 1
+            logger.warning("Background cloud sync skipped: %s", e)
+            return 0
+        except Exception:
+            self.failures += 1
+            logger.exception("Background cloud sync failed")
+            return 0
+
+        if self.backlog == 0:
+            self.last_success_at = time.monotonic()
+        return synced
+
+    def _due(self) -> bool:
+        if time.monotonic() - self._last_run_at >= self.interval_seconds:
+            return True
+        try:
+            self.backlog = self.db.count_unsynced_profiles()
+        except OperationalError:
+            return False
+        return self.backlog >= self.backlog_threshold
+
+    def _run(self):
+        try:
+            while not self._stop.wait(self.poll_seconds):
+                if self._due():
+                    self.sync_once()
+            self.sync_once(deadline=time.monotonic() + self.shutdown_timeout)
+        finally:
+            self.db.Session.remove()
+
+    def __repr__(self) -> str:
+        return (f"<CloudSyncWorker backlog={self.backlog} synced={self.synced_total} "
+                f"runs={self.runs} skipped={self.skipped} failures={self.failures} lag={self.lag_seconds:.0f}s>")
@@ -0,0 +1,68 @@
+# linkedin/db/types.py
+import json
+import zlib
+from typing import Any, Optional
+
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+try:  # much faster than the stdlib codec; plain json is used when it is missing
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# First byte of every stored blob names its codec, so it can change without a rewrite
+ZLIB_JSON = b"\x01"
+
+COMPRESSION_LEVEL = 1  # fastest level; Voyager JSON still shrinks ~5x
+
+
+def dumps_json(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(raw: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def encode_json_blob(value: Any) -> Optional[bytes]:
+    """
+    JSON-encode + compress a value for storage.
+    Already-serialized JSON (`bytes`) is compressed as-is, without a decode/encode round trip.
+    """
+    if value is None:
+        return None
+    raw = bytes(value) if isinstance(value, (bytes, bytearray, memoryview)) else dumps_json(value)
+    return ZLIB_JSON + zlib.compress(raw, COMPRESSION_LEVEL)
+
+
+def decode_json_blob(stored: Optional[bytes | str]) -> Any:
+    if stored is None:
+        return None
+    # Rows written before compression existed hold plain JSON text
+    if isinstance(stored, str):
+        return loads_json(stored)
+    if stored[:1] == ZLIB_JSON:
+        return loads_json(zlib.decompress(stored[1:]))
+    raise ValueError(f"Unknown JSON blob codec tag: {stored[:1]!r}")
+
+
+class CompressedJSON(TypeDecorator):
+    """
+    JSON column stored as a compressed BLOB, decoded transparently on read.
+
+    Legacy rows that still hold plain JSON text are read as well;
+    migration 3 rewrites them into the compressed format.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return encode_json_blob(value)
+
+    def process_result_value(self, value, dialect):
+        return decode_json_blob(value)
@@ -0,0 +1,92 @@
+# linkedin/db/write_buffer.py
+import logging
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING_OPS = 50
+DEFAULT_MAX_PENDING_SECONDS = 30.0
+
+
+class WriteBehindBuffer:
+    """
+    Defers `db_session.commit()` so consecutive profile writes share ONE transaction.
+
+    The long-lived SQLAlchemy session is already a unit of work: repeated
+    changes to the same row are coalesced in its identity map, and queries on
+    the same session see them (autoflush). This buffer only decides WHEN that
+    work gets committed:
+
+    - after `max_pending_ops` writes (also the upper bound on what a crash can lose)
+    - when the oldest unflushed write is older than `max_pending_seconds`
+    - on `flush()` — called by AccountSession.close() and available on demand
+    """
+
+    def __init__(
+            self,
+            db_session,
+            max_pending_ops: int = DEFAULT_MAX_PENDING_OPS,
+            max_pending_seconds: float = DEFAULT_MAX_PENDING_SECONDS,
+    ):
+        if max_pending_ops < 1:
+            raise ValueError("max_pending_ops must be >= 1")
+
+        self.db_session = db_session
+        self.max_pending_ops = max_pending_ops
+        self.max_pending_seconds = max_pending_seconds
+
+        self.pending_ops = 0
+        self.oldest_pending_at: Optional[float] = None
+
+        # Stats
+        self.ops_total = 0
+        self.flushes = 0
+
+    @classmethod
+    def from_config(cls, db_session, spec: Optional[bool | Dict[str, Any]]) -> Optional["WriteBehindBuffer"]:
+        """Build from the `write_behind` account setting (false/None → disabled, true → defaults)."""
+        if not spec:
+            return None
+        if spec is True:
+            return cls(db_session)
+        return cls(db_session, **spec)
+
+    def record(self):
+        """Register one write in place of an immediate commit."""
+        self.pending_ops += 1
+        self.ops_total += 1
+        if self.oldest_pending_at is None:
+            self.oldest_pending_at = time.monotonic()
+
+        if self.pending_ops >= self.max_pending_ops:
+            self.flush()
+        else:
+            self.maybe_flush()
+
+    def maybe_flush(self) -> int:
+        """Flush if the time threshold has passed. Cheap — call it from idle loops."""
+        if self.oldest_pending_at is None:
+            return 0
+        if time.monotonic() - self.oldest_pending_at < self.max_pending_seconds:
+            return 0
+        return self.flush()
+
+    def flush(self) -> int:
+        """Commit everything pending. Returns the number of writes flushed."""
+        flushed = self.pending_ops
+        if not flushed:
+            return 0
+
+        self.db_session.commit()
+        self.pending_ops = 0
+        self.oldest_pending_at = None
+        self.flushes += 1
+
+        logger.debug("Write-behind flush → %d write(s) in 1 transaction (%d flushes so far)",
+                     flushed, self.flushes)
+        return flushed
+
+    def __repr__(self) -> str:
+        return (f"<WriteBehindBuffer pending={self.pending_ops} "
+                f"total={self.ops_total} flushes={self.flushes}>")
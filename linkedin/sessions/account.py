@@ -6,6 +6,8 @@ import random
 import time
 
 from linkedin.actions.profile import PlaywrightLinkedinAPI
+from linkedin.api.client import ApiHeaderCache
+from linkedin.api.cloud_sync import close_backend
 from linkedin.conf import get_account_config, MIN_DELAY, MAX_DELAY, OPPORTUNISTIC_SCRAPING
 from linkedin.navigation.login import init_playwright_session
 from linkedin.navigation.throttle import determine_batch_size
@@ -22,15 +24,57 @@ def human_delay(min_val, max_val):
     time.sleep(delay)
 
 
+def scrape_with_embedded(session, api, url: str) -> int:
+    """
+    Scrape `url` and save it as ENRICHED under the URL's public_identifier.
+    Other leads embedded in the same response that are still DISCOVERED are
+    saved with it, in one transaction. Returns the number of profiles saved.
+    """
+    from linkedin.db.profiles import get_profile_states, save_scraped_profile, save_scraped_profiles, url_to_public_id
+    from linkedin.navigation.enums import ProfileState
+
+    profiles, data = api.get_profiles(profile_url=url)
+    if not profiles:
+        save_scraped_profile(session, url, None, None)
+        return 1
+
+    public_id = url_to_public_id(url)
+    profile, embedded = profiles[0], profiles[1:]
+    states = get_profile_states(session, [p["public_identifier"] for p in embedded if p.get("public_identifier")])
+    waiting = {
+        p["public_identifier"]: p for p in embedded
+        if p.get("public_identifier") != public_id
+        and states.get(p.get("public_identifier")) == ProfileState.DISCOVERED.value
+    }
+    saved = save_scraped_profiles(session, {public_id: profile, **waiting}, data)
+    logger.debug(f"Auto-scraped → {profile.get('full_name')} – {url}")
+    for extra in waiting.values():
+        logger.debug(f"Auto-scraped (embedded) → {extra.get('full_name')} – {extra.get('url')}")
+    return saved
+
+
 class AccountSession:
     def __init__(self, handle: str):
         from linkedin.db.engine import Database
+        from linkedin.db.sync_worker import CloudSyncWorker
+        from linkedin.db.write_buffer import WriteBehindBuffer
 
         self.handle = handle.strip().lower()
 
         self.account_cfg = get_account_config(self.handle)
         self.db = Database.from_handle(self.handle)
         self.db_session = self.db.get_session()  # long-lived session per account
+        # Optional: batch commits of profile writes (None → commit every write)
+        self.write_buffer = WriteBehindBuffer.from_config(self.db_session, self.account_cfg.get("write_behind"))
+        # Optional: push profiles to the cloud from a background thread (None → only on close)
+        self.sync_worker = CloudSyncWorker.from_config(
+            self.db, self.account_cfg.get("background_sync"), write_buffer=self.write_buffer,
+        )
+        if self.sync_worker:
+            self.sync_worker.start()
+
+        # Voyager headers shared by every PlaywrightLinkedinAPI of this session
+        self.api_headers = ApiHeaderCache()
 
         # Playwright objects – created on first access or after crash
         self.page = None
@@ -45,6 +89,9 @@ class AccountSession:
             init_playwright_session(session=self, handle=self.handle)
 
     def wait(self, min_delay=MIN_DELAY, max_delay=MAX_DELAY, to_scrape=OPPORTUNISTIC_SCRAPING):
+        if self.write_buffer:
+            self.write_buffer.maybe_flush()
+
         if not to_scrape:
             human_delay(min_delay, max_delay)
             self.page.wait_for_load_state("load")
@@ -61,16 +108,13 @@ class AccountSession:
             self.page.wait_for_load_state("load")
             return
 
-        from linkedin.db.profiles import save_scraped_profile
         min_api_delay = max(min_delay / len(urls), MIN_API_DELAY)
         max_api_delay = max(max_delay / len(urls), MAX_API_DELAY)
         api = PlaywrightLinkedinAPI(session=self)
 
         for url in urls:
             human_delay(min_api_delay, max_api_delay)
-            profile, data = api.get_profile(profile_url=url)
-            save_scraped_profile(self, url, profile, data)
-            logger.debug(f"Auto-scraped → {profile.get('full_name')} – {url}") if profile else None
+            scrape_with_embedded(self, api, url)
 
     def close(self):
         if self.context:
@@ -86,7 +130,24 @@ class AccountSession:
             finally:
                 self.page = self.context = self.browser = self.playwright = None
 
-        self.db.close()
+        cache = self.api_headers
+        if cache.builds:
+            logger.info(
+                "API headers → built %d×, reused %d× (%.1f ms per build, ~%.2fs saved)",
+                cache.builds, cache.hits, 1000 * cache.build_seconds / cache.builds, cache.saved_seconds,
+            )
+        self.api_headers = ApiHeaderCache()
+
+        if self.write_buffer:
+            self.write_buffer.flush()
+        if self.sync_worker:
+            # Bounded final drain; anything left is synced on the next run
+            self.sync_worker.stop()
+            self.sync_worker = None
+            self.db.close(sync=False)
+        else:
+            self.db.close()
+        close_backend()
         logger.info("Account session closed → %s", self.handle)
 
     def __del__(self):
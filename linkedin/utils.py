@@ -0,0 +1,28 @@
+# linkedin/utils.py
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_pool_map(fn: Callable[[T], R], items: Iterable[T], workers: int) -> Iterator[R]:
+    """
+    Lazily yields `fn(item)` for each item, in input order. With `workers` > 1
+    items are mapped in a process pool, at most 2 × workers items ahead, so a
+    long input is never materialised. `fn` must be a picklable module-level function.
+    """
+    if workers <= 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for item in items:
+            in_flight.append(pool.submit(fn, item))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
@@ -0,0 +1,129 @@
+# tests/api/test_client.py
+from pathlib import Path
+
+import pytest
+
+from linkedin.api.client import ApiHeaderCache, PlaywrightLinkedinAPI
+
+PROFILE_RESPONSE = (Path(__file__).parent.parent / "fixtures" / "profiles" / "linkedin_profile.json").read_bytes()
+
+HINTS = {
+    "userAgent": "Mozilla/5.0",
+    "acceptLanguage": "en-US,en",
+    "secChUa": '"Chromium";v="140"',
+    "secChUaMobile": "?0",
+    "secChUaPlatform": '"Linux"',
+}
+
+
+class FakeContext:
+    def __init__(self, jsessionid="ajax:1"):
+        self.jsessionid = jsessionid
+        self.cookie_reads = 0
+
+    def cookies(self):
+        self.cookie_reads += 1
+        return [{"name": "JSESSIONID", "value": f'"{self.jsessionid}"'}, {"name": "li_at", "value": "x"}]
+
+
+class FakePage:
+    def __init__(self, url="https://www.linkedin.com/feed/"):
+        self.url = url
+        self.evaluates = 0
+
+    def evaluate(self, script):
+        self.evaluates += 1
+        return HINTS
+
+
+class FakeSession:
+    def __init__(self):
+        self.context, self.page = FakeContext(), FakePage()
+        self.api_headers = ApiHeaderCache()
+
+
+class TestApiHeaderCache:
+    def test_one_evaluate_builds_the_full_bundle(self):
+        session = FakeSession()
+        headers = PlaywrightLinkedinAPI(session).headers
+        assert session.page.evaluates == 1
+        assert headers["csrf-token"] == "ajax:1"
+        assert headers["user-agent"] == "Mozilla/5.0"
+        assert headers["sec-ch-ua-platform"] == '"Linux"'
+        assert headers["referer"] == "https://www.linkedin.com/feed/"
+
+    def test_reused_across_api_instances(self):
+        session = FakeSession()
+        for _ in range(5):
+            PlaywrightLinkedinAPI(session)
+        assert session.page.evaluates == 1
+        assert (session.api_headers.builds, session.api_headers.hits) == (1, 4)
+        assert session.api_headers.saved_seconds >= 0
+
+    def test_referer_follows_current_page(self):
+        session = FakeSession()
+        PlaywrightLinkedinAPI(session)
+        session.page.url = "https://www.linkedin.com/in/alice/"
+        assert PlaywrightLinkedinAPI(session).headers["referer"] == "https://www.linkedin.com/in/alice/"
+
+    def test_rebuilt_when_jsessionid_rotates(self):
+        session = FakeSession()
+        PlaywrightLinkedinAPI(session)
+        session.context.jsessionid = "ajax:2"
+        assert PlaywrightLinkedinAPI(session).headers["csrf-token"] == "ajax:2"
+        assert session.api_headers.builds == 2
+
+    def test_rebuilt_for_a_new_browser_context(self):
+        session = FakeSession()
+        PlaywrightLinkedinAPI(session)
+        session.context, session.page = FakeContext(), FakePage()
+        PlaywrightLinkedinAPI(session)
+        assert session.page.evaluates == 1
+        assert session.api_headers.builds == 2
+
+
+class FakeResponse:
+    def __init__(self, status=200, body=PROFILE_RESPONSE):
+        self.status, self.ok, self._body = status, status < 400, body
+
+    def body(self):
+        return self._body
+
+    def json(self):
+        return {}
+
+
+class FakeRequest:
+    def __init__(self, response):
+        self.response = response
+        self.params = []
+
+    def get(self, url, params=None, headers=None):
+        self.params.append(params)
+        return self.response
+
+
+def _api(response):
+    session = FakeSession()
+    session.context.request = FakeRequest(response)
+    return PlaywrightLinkedinAPI(session)
+
+
+class TestGetProfiles:
+    @pytest.mark.parametrize("public_identifier, first, embedded", [
+        ("eracle", "eracle", ["lexfridman"]),
+        ("lexfridman", "lexfridman", ["eracle"]),
+        # Renamed vanity URL: no entity carries the id → the response's main element
+        ("lex-fridman-old", "lexfridman", ["eracle"]),
+    ])
+    def test_requested_member_comes_first(self, public_identifier, first, embedded):
+        api = _api(FakeResponse())
+        profiles, raw = api.get_profiles(profile_url=f"https://www.linkedin.com/in/{public_identifier}/")
+
+        assert raw == PROFILE_RESPONSE
+        assert api.context.request.params[0]["memberIdentity"] == public_identifier
+        assert profiles[0] == api.get_profile(public_identifier)[0]
+        assert [p["public_identifier"] for p in profiles] == [first, *embedded]
+
+    def test_inaccessible_profile(self):
+        assert _api(FakeResponse(status=404)).get_profiles("alice") == ([], None)
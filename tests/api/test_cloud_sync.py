@@ -0,0 +1,161 @@
+# tests/api/test_cloud_sync.py
+import gzip
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from benchmarks.sync_server import SyncServer
+from linkedin.api import cloud_sync
+from linkedin.api.cloud_sync import (
+    HttpSyncBackend,
+    NullBackend,
+    SyncBackend,
+    encode_ndjson_gzip,
+    retry_after_seconds,
+    sync_profiles,
+)
+
+
+@pytest.fixture
+def server():
+    with SyncServer() as srv:
+        yield srv
+
+
+@pytest.fixture
+def backend(server):
+    http = HttpSyncBackend(server.url, max_retries=2, backoff_base=0.001)
+    yield http
+    http.close()
+
+
+BATCH = [{"public_identifier": "alice", "n": 1}, {"public_identifier": "bob", "n": 2}]
+
+
+class TestEncoding:
+    def test_ndjson_round_trip_and_stable_key(self):
+        body, key = encode_ndjson_gzip(BATCH)
+        lines = gzip.decompress(body).splitlines()
+        assert [json.loads(line) for line in lines] == BATCH
+        assert encode_ndjson_gzip(BATCH)[1] == key
+        assert encode_ndjson_gzip(BATCH[:1])[1] != key
+
+
+class TestRetryAfter:
+    def _response(self, value):
+        response = requests.Response()
+        if value is not None:
+            response.headers["Retry-After"] = value
+        return response
+
+    def test_delay_in_seconds(self):
+        assert retry_after_seconds(self._response("7")) == 7.0
+
+    def test_http_date(self):
+        when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+        assert 55 <= retry_after_seconds(self._response(when)) <= 60
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        assert retry_after_seconds(self._response(value)) is None
+
+
+class TestHttpSyncBackend:
+    def test_sends_batch(self, server, backend):
+        assert backend.send(BATCH) is True
+        assert server.profiles_received == 2
+        assert backend.batches_sent == 1
+
+    def test_retries_transient_failures(self, server, backend):
+        server.fail_next = 2
+        assert backend.send(BATCH) is True
+        assert (server.requests, backend.retries) == (3, 2)
+        assert server.profiles_received == 2
+
+    @pytest.mark.parametrize("header, expected", [("2", 2.0), ("120", 30.0)])
+    def test_waits_for_retry_after_capped_at_backoff_cap(self, monkeypatch, server, backend, header, expected):
+        sleeps = []
+        monkeypatch.setattr(cloud_sync.time, "sleep", sleeps.append)
+        server.fail_next, server.retry_after = 1, header
+        assert backend.send(BATCH) is True
+        assert sleeps == [expected]
+
+    def test_gives_up_after_max_retries(self, server, backend):
+        server.fail_next = 10
+        assert backend.send(BATCH) is False
+        assert server.requests == 3
+        assert server.profiles_received == 0
+
+    def test_resent_batch_is_deduplicated_by_key(self, server, backend):
+        backend.send(BATCH)
+        backend.send(BATCH)
+        assert server.profiles_received == 2
+        assert server.duplicates == 1
+
+    def test_connection_refused_returns_false(self):
+        closed = SyncServer()
+        url = closed.url
+        closed.server_close()
+        http = HttpSyncBackend(url, max_retries=1, backoff_base=0.001, timeout=1)
+        assert http.send(BATCH) is False
+
+
+class TestSyncProfiles:
+    def test_backend_must_implement_send(self):
+        class Incomplete(SyncBackend):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_defaults_to_null_backend_without_url(self, monkeypatch):
+        monkeypatch.setattr("linkedin.conf.CLOUD_SYNC_URL", None)
+        cloud_sync.set_backend(None)
+        try:
+            assert isinstance(cloud_sync.get_backend(), NullBackend)
+            assert sync_profiles(BATCH) is True
+        finally:
+            cloud_sync.set_backend(None)
+
+    def test_uses_configured_backend(self, server, backend):
+        cloud_sync.set_backend(backend)
+        try:
+            assert sync_profiles(BATCH) is True
+        finally:
+            cloud_sync.set_backend(None)
+        assert server.profiles_received == 2
+
+    def test_concurrent_first_use_builds_one_backend(self, monkeypatch):
+        built = []
+
+        class SlowBackend(NullBackend):
+            def __init__(self, url, token=None):
+                time.sleep(0.01)
+                built.append(self)
+
+        monkeypatch.setattr("linkedin.conf.CLOUD_SYNC_URL", "http://127.0.0.1:1/profiles")
+        monkeypatch.setattr(cloud_sync, "HttpSyncBackend", SlowBackend)
+        cloud_sync.set_backend(None)
+        try:
+            threads = [threading.Thread(target=cloud_sync.get_backend) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert len(built) == 1
+        finally:
+            cloud_sync.set_backend(None)
+
+    def test_close_backend_closes_and_resets(self, monkeypatch, backend):
+        closed = []
+        monkeypatch.setattr(backend, "close", lambda: closed.append(True))
+        cloud_sync.set_backend(backend)
+        cloud_sync.close_backend()
+        assert closed == [True]
+        assert cloud_sync._backend is None
+        cloud_sync.close_backend()  # nothing to close
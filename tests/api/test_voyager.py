@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from linkedin.api.voyager import parse_linkedin_voyager_response
+from linkedin.api.voyager import PARSED_ENTITY_TYPES, extract_entities, parse_linkedin_voyager_response, parse_many
 
 
 @pytest.fixture
@@ -94,3 +94,124 @@ def test_no_exceptions_on_empty_or_minimal_profiles():
     profile = parse_linkedin_voyager_response(minimal)
     assert profile["full_name"] == "John Doe"
     assert profile["connection_degree"] is None
+
+
+def _with_invitation(profile_data, invitation_union):
+    """The fixture with its main profile's relationship replaced by `invitation_union`."""
+    data = json.loads(json.dumps(profile_data))
+    main = next(e for e in data["included"] if e.get("publicIdentifier") == "lexfridman")
+    rel = next(e for e in data["included"] if e.get("entityUrn") == main["*memberRelationship"])
+    rel["memberRelationshipUnion"]["noConnection"]["invitationUnion"] = invitation_union
+    rel.pop("memberRelationshipData", None)
+    return parse_linkedin_voyager_response(data, public_identifier="lexfridman")
+
+
+def test_no_invitation_is_reported(profile):
+    assert profile["invitation_pending"] is False
+
+
+def test_pending_invitation_is_detected(profile_data):
+    pending = _with_invitation(profile_data, {"invitation": {"invitationState": "PENDING", "inviter": "urn:li:me"}})
+    assert (pending["connection_degree"], pending["invitation_pending"]) == (2, True)
+
+
+def test_incoming_invitation_is_not_ours(profile_data):
+    main_urn = next(e for e in profile_data["included"] if e.get("publicIdentifier") == "lexfridman")["entityUrn"]
+    incoming = _with_invitation(profile_data, {"invitation": {"invitationState": "PENDING", "inviter": main_urn}})
+    assert incoming["invitation_pending"] is None
+
+
+def test_invitation_without_state_is_ambiguous(profile_data):
+    unknown = _with_invitation(profile_data, {"invitation": {"inviter": "urn:li:me"}})
+    assert unknown["invitation_pending"] is None
+
+
+def test_invitation_without_inviter_is_ambiguous(profile_data):
+    unknown = _with_invitation(profile_data, {"invitation": {"invitationState": "PENDING"}})
+    assert unknown["invitation_pending"] is None
+
+
+@pytest.mark.parametrize("public_identifier", [None, "lexfridman", "eracle", "nobody"])
+def test_output_is_byte_identical_to_snapshot(profile_data, public_identifier):
+    snapshot_path = Path(__file__).parent.parent / "fixtures" / "profiles" / "linkedin_profile.parsed.json"
+    with open(snapshot_path, encoding="utf-8") as f:
+        expected = json.load(f)[str(public_identifier)]
+
+    parsed = parse_linkedin_voyager_response(profile_data, public_identifier=public_identifier)
+    assert json.dumps(parsed, ensure_ascii=False) == json.dumps(expected, ensure_ascii=False)
+
+
+def test_validation_accepts_parser_output(profile_data):
+    assert parse_linkedin_voyager_response(profile_data, validate=True) == parse_linkedin_voyager_response(profile_data)
+
+
+class TestParseMany:
+    def test_every_profile_entity_is_parsed_in_order(self, profile_data):
+        profiles = parse_many(profile_data)
+        assert [p["public_identifier"] for p in profiles] == ["lexfridman", "eracle"]
+        for parsed in profiles:
+            single = parse_linkedin_voyager_response(profile_data, public_identifier=parsed["public_identifier"])
+            assert json.dumps(parsed, ensure_ascii=False) == json.dumps(single, ensure_ascii=False)
+
+    def test_duplicate_entities_are_parsed_once(self, profile_data):
+        main = next(e for e in profile_data["included"] if e.get("publicIdentifier") == "lexfridman")
+        profile_data["included"].append(dict(main))
+        assert [p["public_identifier"] for p in parse_many(profile_data)] == ["lexfridman", "eracle"]
+
+    @pytest.mark.parametrize("public_identifier", ["eracle", "nobody"])
+    def test_requested_member_comes_first(self, profile_data, public_identifier):
+        profiles = parse_many(profile_data, public_identifier=public_identifier)
+        single = parse_linkedin_voyager_response(profile_data, public_identifier=public_identifier)
+        assert profiles[0] == single
+        others = {"eracle": "lexfridman", "nobody": "eracle"}[public_identifier]
+        assert [p["public_identifier"] for p in profiles[1:]] == [others]
+
+    def test_no_profile_raises_like_the_single_parser(self):
+        with pytest.raises(ValueError, match="Could not find profile entity"):
+            parse_many({"included": []})
+
+
+class TestExtractEntities:
+    @pytest.fixture
+    def raw(self):
+        fixture_path = Path(__file__).parent.parent / "fixtures" / "profiles" / "linkedin_profile.json"
+        return fixture_path.read_bytes()
+
+    def test_keeps_only_parsed_entity_types(self, raw):
+        slim = extract_entities(raw)
+        kept_types = {e.get("$type") for e in slim["included"]}
+        assert kept_types <= PARSED_ENTITY_TYPES
+        assert "com.linkedin.voyager.dash.identity.profile.Skill" not in kept_types
+        assert slim["data"] == json.loads(raw)["data"]
+
+    @pytest.mark.parametrize("public_identifier", [None, "lexfridman", "eracle", "nobody"])
+    def test_parses_like_the_full_response(self, raw, public_identifier):
+        full = parse_linkedin_voyager_response(json.loads(raw), public_identifier=public_identifier)
+        slim = parse_linkedin_voyager_response(extract_entities(raw), public_identifier=public_identifier)
+        assert json.dumps(slim, ensure_ascii=False) == json.dumps(full, ensure_ascii=False)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_values_split_across_windows(self, raw, chunk_size):
+        assert extract_entities(raw, chunk_size=chunk_size) == extract_entities(raw)
+        mixed = '{"n": 12345, "included": [{"$type": "x", "s": "é€😀"}, 1.5e10]}'.encode("utf-8")
+        assert extract_entities(mixed, keep_types={"x"}, chunk_size=chunk_size) == {
+            "n": 12345, "included": [{"$type": "x", "s": "é€😀"}],
+        }
+
+    @pytest.mark.parametrize("padding", range(12))
+    def test_every_split_offset(self, padding):
+        doc = '{"n": 12345, "included": [{"$type": "x", "s": "é€😀", "f": -0.25E+3}, 1.5e10], "z": 1.0}'
+        raw = (" " * padding + doc).encode("utf-8")
+        expected = {"n": 12345, "included": [{"$type": "x", "s": "é€😀", "f": -250.0}], "z": 1.0}
+        for chunk_size in range(1, len(raw) + 1):
+            assert extract_entities(raw, keep_types={"x"}, chunk_size=chunk_size) == expected, chunk_size
+
+    def test_untyped_entities_and_other_keys_are_kept(self):
+        raw = '{ "meta": {"a": [1, 2]}, "included": [ {"entityUrn": "x"}, {"$type": "Skill"}, 3 ] }'
+        assert extract_entities(raw) == {"meta": {"a": [1, 2]}, "included": [{"entityUrn": "x"}]}
+        assert extract_entities(b"{}") == {}
+
+    @pytest.mark.parametrize("raw", ['{"included": [{}', '{"a" 1}', "[1]", '{"a": 1'])
+    def test_malformed_input_raises_decode_error(self, raw):
+        with pytest.raises(json.JSONDecodeError):
+            extract_entities(raw)
@@ -3,17 +3,18 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 
+from linkedin.db.migrations import ensure_schema
 from linkedin.db.models import Base
 
 
 @pytest.fixture(scope="function")
 def db_session():
     """
-    Yields a clean, in-memory SQLite session with all tables created.
+    Yields a clean, in-memory SQLite session with the full, migrated schema.
     Every test gets its own fresh database → no state leaks.
     """
     engine = create_engine("sqlite:///:memory:", echo=False, future=True)
-    Base.metadata.create_all(bind=engine)
+    ensure_schema(engine)
 
     SessionFactory = sessionmaker(bind=engine)
     Session = scoped_session(SessionFactory)
@@ -0,0 +1,59 @@
+# tests/db/test_counters.py
+from sqlalchemy import text
+
+from linkedin.db.counters import (
+    check_state_counters,
+    get_state_count,
+    get_state_counts,
+    rebuild_state_counters,
+)
+from linkedin.db.models import Profile
+from linkedin.db.profiles import add_profile_urls, save_scraped_profile, set_profile_state
+from linkedin.navigation.enums import ProfileState
+
+
+def _urls(*names):
+    return [f"https://www.linkedin.com/in/{name}/" for name in names]
+
+
+class TestStateCounters:
+    def test_bulk_insert_or_ignore_counts_only_new_rows(self, fake_session):
+        add_profile_urls(fake_session, _urls("alice", "bob"))
+        add_profile_urls(fake_session, _urls("alice", "bob", "carol"))
+        assert get_state_count(fake_session, ProfileState.DISCOVERED) == 3
+        assert check_state_counters(fake_session) == {}
+
+    def test_transitions_move_counts(self, fake_session):
+        add_profile_urls(fake_session, _urls("alice", "bob"))
+        save_scraped_profile(fake_session, _urls("alice")[0], {"full_name": "Alice"}, None)
+        set_profile_state(fake_session, "alice", ProfileState.PENDING.value)
+        set_profile_state(fake_session, "alice", ProfileState.PENDING.value)
+
+        counts = get_state_counts(fake_session)
+        assert counts["discovered"] == 1
+        assert counts["enriched"] == 0
+        assert counts["pending"] == 1
+        assert check_state_counters(fake_session) == {}
+
+    def test_delete_decrements(self, fake_session):
+        add_profile_urls(fake_session, _urls("alice", "bob"))
+        db = fake_session.db_session
+        db.delete(db.get(Profile, "alice"))
+        db.commit()
+        assert get_state_count(fake_session, "discovered") == 1
+
+    def test_check_detects_drift_and_rebuild_fixes_it(self, fake_session):
+        add_profile_urls(fake_session, _urls("alice", "bob"))
+        db = fake_session.db_session
+        db.execute(text("UPDATE state_counters SET count = 99 WHERE state = 'discovered'"))
+        db.commit()
+
+        assert check_state_counters(fake_session) == {"discovered": (99, 2)}
+
+        rebuild_state_counters(db.connection())
+        db.commit()
+        assert check_state_counters(fake_session) == {}
+        assert get_state_count(fake_session, ProfileState.DISCOVERED) == 2
+
+    def test_unknown_state_counts_zero(self, fake_session):
+        assert get_state_count(fake_session, ProfileState.FAILED) == 0
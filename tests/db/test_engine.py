@@ -0,0 +1,156 @@
+# tests/db/test_engine.py
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from linkedin.db.engine import Database, STORAGE_PROFILES, resolve_storage_profile
+from linkedin.db.models import Profile
+from linkedin.db.profiles import get_profile, save_scraped_profile
+from linkedin.db.types import encode_json_blob
+
+
+def _pragma(db, name):
+    with db.engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+class TestResolveStorageProfile:
+    def test_default_is_legacy(self):
+        assert resolve_storage_profile(None) == STORAGE_PROFILES["legacy"]
+
+    def test_by_name(self):
+        assert resolve_storage_profile("legacy") == {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+    def test_overrides_on_top_of_base_profile(self):
+        pragmas = resolve_storage_profile({"profile": "durable", "mmap_size": 0})
+        assert pragmas["synchronous"] == "FULL"
+        assert pragmas["mmap_size"] == 0
+
+    def test_unknown_profile_raises(self):
+        with pytest.raises(ValueError, match="Unknown storage profile"):
+            resolve_storage_profile("turbo")
+
+    def test_unsupported_pragma_raises(self):
+        with pytest.raises(ValueError, match="Unsupported storage setting"):
+            resolve_storage_profile({"locking_mode": "EXCLUSIVE"})
+
+    def test_rejects_injected_values(self):
+        with pytest.raises(ValueError, match="Invalid value"):
+            resolve_storage_profile({"synchronous": "OFF; DROP TABLE profiles"})
+
+
+class TestDatabasePragmas:
+    def test_balanced_profile_applied_on_connect(self, tmp_path):
+        db = Database(str(tmp_path / "acct.db"), storage_profile="balanced")
+        assert _pragma(db, "journal_mode") == "wal"
+        assert _pragma(db, "synchronous") == 1  # NORMAL
+        assert _pragma(db, "temp_store") == 2  # MEMORY
+        db.close()
+
+    def test_legacy_profile_keeps_rollback_journal(self, tmp_path):
+        db = Database(str(tmp_path / "acct.db"), storage_profile="legacy")
+        assert _pragma(db, "journal_mode") == "delete"
+        db.close()
+
+    def test_legacy_profile_undoes_persisted_wal(self, tmp_path):
+        db = Database(str(tmp_path / "acct.db"), storage_profile="balanced")
+        db.close()
+        db.engine.dispose()
+
+        db = Database(str(tmp_path / "acct.db"))
+        assert _pragma(db, "journal_mode") == "delete"
+        assert _pragma(db, "synchronous") == 2  # FULL
+        db.close()
+
+
+class TestCloudSync:
+    def _seed(self, db, n, state="enriched"):
+        with db.engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO profiles (public_identifier, state, updated_at, data) "
+                     "VALUES (:pid, :state, '2020-01-01 00:00:00', :data)"),
+                [{"pid": f"p{i:03d}", "state": state, "data": encode_json_blob({"i": i})} for i in range(n)],
+            )
+
+    def _synced(self, db):
+        with db.engine.connect() as conn:
+            return conn.execute(text("SELECT COUNT(*) FROM profiles WHERE cloud_synced")).scalar()
+
+    def test_sends_fixed_size_batches_and_flags_rows(self, tmp_path, monkeypatch):
+        batches = []
+        monkeypatch.setattr("linkedin.db.engine.sync_profiles", lambda data: batches.append(data) or True)
+        db = Database(str(tmp_path / "acct.db"))
+        self._seed(db, 5)
+
+        assert db._sync_all_unsynced_profiles(batch_size=2) == 5
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert batches[0][0] == {"i": 0}
+        assert self._synced(db) == 5
+        with db.engine.connect() as conn:
+            assert conn.execute(text("SELECT DISTINCT updated_at FROM profiles")).scalar() == "2020-01-01 00:00:00"
+
+    def test_discovered_profiles_are_not_synced(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("linkedin.db.engine.sync_profiles", lambda data: True)
+        db = Database(str(tmp_path / "acct.db"))
+        self._seed(db, 3, state="discovered")
+        assert db._sync_all_unsynced_profiles() == 0
+        assert self._synced(db) == 0
+
+    def test_failure_keeps_earlier_batches_checkpointed(self, tmp_path, monkeypatch):
+        calls = []
+
+        def flaky(data):
+            calls.append(len(data))
+            return len(calls) < 3
+
+        monkeypatch.setattr("linkedin.db.engine.sync_profiles", flaky)
+        db = Database(str(tmp_path / "acct.db"))
+        self._seed(db, 7)
+
+        assert db._sync_all_unsynced_profiles(batch_size=2) == 4
+        assert self._synced(db) == 4
+
+        calls.clear()
+        monkeypatch.setattr("linkedin.db.engine.sync_profiles", lambda data: calls.append(len(data)) or True)
+        db.close()
+        assert calls == [3]
+        assert self._synced(db) == 7
+
+    def test_sync_leaves_the_thread_session_pending_writes_alone(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("linkedin.db.engine.sync_profiles", lambda data: True)
+        db = Database(str(tmp_path / "acct.db"))
+        self._seed(db, 2)
+        account_session = db.get_session()
+        account_session.add(Profile(public_identifier="pending", state="enriched"))
+
+        assert db.count_unsynced_profiles() == 2
+        assert db._sync_all_unsynced_profiles() == 2
+
+        assert db.get_session() is account_session
+        assert [p.public_identifier for p in account_session.new] == ["pending"]
+        account_session.commit()
+        assert db.count_unsynced_profiles() == 1
+        db.close(sync=False)
+
+    def test_profile_resaved_while_its_batch_is_in_flight_stays_unsynced(self, tmp_path, monkeypatch):
+        db = Database(str(tmp_path / "acct.db"))
+        account = SimpleNamespace(db_session=db.get_session())
+        url = "https://www.linkedin.com/in/alice/"
+        save_scraped_profile(account, url, {"v": 1}, {"v": 1})
+
+        sent = []
+
+        def send_then_resave(data):
+            sent.append(data)
+            if len(sent) == 1:
+                save_scraped_profile(account, url, {"v": 2}, {"v": 2})
+            return True
+
+        monkeypatch.setattr("linkedin.db.engine.sync_profiles", send_then_resave)
+        assert db._sync_all_unsynced_profiles() == 0
+        assert get_profile(account, "alice").cloud_synced is False
+
+        assert db._sync_all_unsynced_profiles() == 1
+        assert sent == [[{"v": 1}], [{"v": 2}]]
+        db.close(sync=False)
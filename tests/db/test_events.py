@@ -0,0 +1,87 @@
+# tests/db/test_events.py
+from datetime import datetime, timedelta
+
+from linkedin.db.events import (
+    count_transitions,
+    funnel_counts,
+    median_transition_time,
+    transition_durations,
+)
+from linkedin.db.models import ProfileEvent
+from linkedin.db.profiles import save_scraped_profile, set_profile_state
+from linkedin.navigation.enums import ProfileState
+
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+
+
+def _event(db, pid, from_state, to_state, hours_ago):
+    db.add(ProfileEvent(
+        public_identifier=pid,
+        from_state=from_state and from_state.value,
+        to_state=to_state.value,
+        created_at=NOW - timedelta(hours=hours_ago),
+    ))
+
+
+class TestTransitionLogging:
+    def test_set_state_appends_events(self, fake_session):
+        set_profile_state(fake_session, "alice", ProfileState.ENRICHED.value)
+        set_profile_state(fake_session, "alice", ProfileState.PENDING.value)
+
+        events = fake_session.db_session.query(ProfileEvent).order_by(ProfileEvent.id).all()
+        assert [(e.from_state, e.to_state) for e in events] == [
+            (None, "enriched"),
+            ("enriched", "pending"),
+        ]
+
+    def test_unchanged_state_is_not_logged(self, fake_session):
+        set_profile_state(fake_session, "alice", ProfileState.PENDING.value)
+        set_profile_state(fake_session, "alice", ProfileState.PENDING.value)
+        assert fake_session.db_session.query(ProfileEvent).count() == 1
+
+    def test_save_scraped_profile_logs_enrichment(self, fake_session):
+        set_profile_state(fake_session, "alice", ProfileState.DISCOVERED.value)
+        save_scraped_profile(fake_session, "https://www.linkedin.com/in/alice/", {"full_name": "A"}, None)
+
+        last = fake_session.db_session.query(ProfileEvent).order_by(ProfileEvent.id.desc()).first()
+        assert (last.from_state, last.to_state) == ("discovered", "enriched")
+
+
+class TestFunnelQueries:
+    def _seed(self, db):
+        # alice: invited 100h ago, accepted 40h later
+        _event(db, "alice", ProfileState.ENRICHED, ProfileState.PENDING, 100)
+        _event(db, "alice", ProfileState.PENDING, ProfileState.CONNECTED, 60)
+        # bob: invited 50h ago, accepted 10h later
+        _event(db, "bob", ProfileState.ENRICHED, ProfileState.PENDING, 50)
+        _event(db, "bob", ProfileState.PENDING, ProfileState.CONNECTED, 40)
+        # carol: invited 2h ago, still pending
+        _event(db, "carol", ProfileState.ENRICHED, ProfileState.PENDING, 2)
+        db.commit()
+
+    def test_connects_sent_in_window(self, fake_session):
+        self._seed(fake_session.db_session)
+        week = count_transitions(fake_session, ProfileState.PENDING, since=NOW - timedelta(days=7))
+        last_day = count_transitions(fake_session, ProfileState.PENDING, since=NOW - timedelta(days=1))
+        assert (week, last_day) == (3, 1)
+
+    def test_count_filtered_by_origin_state(self, fake_session):
+        self._seed(fake_session.db_session)
+        assert count_transitions(fake_session, ProfileState.CONNECTED, from_state=ProfileState.PENDING) == 2
+        assert count_transitions(fake_session, ProfileState.CONNECTED, from_state=ProfileState.ENRICHED) == 0
+
+    def test_funnel_counts(self, fake_session):
+        self._seed(fake_session.db_session)
+        counts = funnel_counts(fake_session, since=NOW - timedelta(days=7))
+        assert counts["pending"] == 3
+        assert counts["connected"] == 2
+        assert counts["completed"] == 0
+
+    def test_pending_to_connected_durations(self, fake_session):
+        self._seed(fake_session.db_session)
+        durations = transition_durations(fake_session, ProfileState.PENDING, ProfileState.CONNECTED)
+        assert sorted(durations) == [timedelta(hours=10), timedelta(hours=40)]
+        assert median_transition_time(fake_session, "pending", "connected") == timedelta(hours=25)
+
+    def test_median_is_none_without_samples(self, fake_session):
+        assert median_transition_time(fake_session, ProfileState.PENDING, ProfileState.CONNECTED) is None
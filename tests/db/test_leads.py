@@ -0,0 +1,139 @@
+# tests/db/test_leads.py
+
+from sqlalchemy import event, update
+
+from linkedin.db.leads import Lead, clear_staged_leads, count_staged_leads, iter_campaign_leads, stage_leads
+from linkedin.db.models import Profile
+from linkedin.db.profiles import PENDING_RECHECK_BASE, get_profile, set_profile_state, utcnow
+from linkedin.navigation.enums import ProfileState
+
+
+def _stage(session, *names, source="leads.csv"):
+    rows = [{"public_identifier": n, "url": f"https://www.linkedin.com/in/{n}/"} for n in names]
+    return stage_leads(session, rows, source=source)
+
+
+class TestIterCampaignLeads:
+    def test_yields_compact_records_in_campaign_order(self, fake_session):
+        set_profile_state(fake_session, "bob", ProfileState.CONNECTED.value)
+        _stage(fake_session, "bob", "alice", "carol")
+
+        leads = list(iter_campaign_leads(fake_session))
+        assert leads == [
+            Lead("https://www.linkedin.com/in/alice/", "alice"),
+            Lead("https://www.linkedin.com/in/bob/", "bob", "connected"),
+            Lead("https://www.linkedin.com/in/carol/", "carol"),
+        ]
+
+    def test_pages_through_everything(self, fake_session):
+        names = [f"lead{i:02d}" for i in range(23)]
+        _stage(fake_session, *names)
+        assert [lead.public_identifier for lead in iter_campaign_leads(fake_session, page_size=5)] == names
+
+    def test_is_lazy_and_order_is_fixed_at_start(self, fake_session):
+        _stage(fake_session, "alice", "bob", "carol")
+        leads = iter_campaign_leads(fake_session, page_size=1)
+
+        seen = []
+        for lead in leads:
+            seen.append(lead.public_identifier)
+            # Processing touches updated_at; the lead must not come around again
+            set_profile_state(fake_session, lead.public_identifier, ProfileState.ENRICHED.value)
+            if lead.public_identifier == "alice":
+                _stage(fake_session, "dave")
+        assert seen == ["alice", "bob", "carol"]
+
+    def test_filters_by_source_and_skips_dropped_leads(self, fake_session):
+        _stage(fake_session, "alice", "bob", "carol", source="a.csv")
+        _stage(fake_session, "zed", source="b.csv")
+
+        leads = iter_campaign_leads(fake_session, source="a.csv", page_size=1)
+        assert next(leads).public_identifier == "alice"
+        clear_staged_leads(fake_session, "a.csv")
+        _stage(fake_session, "carol", source="a.csv")
+        assert [lead.public_identifier for lead in leads] == ["carol"]
+
+    def test_lead_shared_by_two_files_is_in_both_campaigns(self, fake_session):
+        _stage(fake_session, "alice", "bob", source="a.csv")
+        assert _stage(fake_session, "bob", "carol", source="b.csv") == 2
+
+        def campaign(source):
+            return [lead.public_identifier for lead in iter_campaign_leads(fake_session, source=source)]
+
+        assert campaign("b.csv") == ["bob", "carol"]
+        assert clear_staged_leads(fake_session, "a.csv") == 2
+        assert campaign("a.csv") == []
+        assert campaign("b.csv") == ["bob", "carol"]
+
+    def test_without_source_each_lead_comes_once(self, fake_session):
+        _stage(fake_session, "alice", "bob", source="a.csv")
+        _stage(fake_session, "bob", "carol", source="b.csv")
+        assert [lead.public_identifier for lead in iter_campaign_leads(fake_session)] == ["alice", "bob", "carol"]
+        assert count_staged_leads(fake_session) == 3
+        assert count_staged_leads(fake_session, "b.csv") == 2
+
+    def test_finished_leads_are_skipped_without_per_row_queries(self, fake_session):
+        names = [f"lead{i:02d}" for i in range(40)]
+        _stage(fake_session, *names)
+        for i, name in enumerate(names):
+            if i % 10:
+                set_profile_state(fake_session, name, (ProfileState.COMPLETED if i % 2 else ProfileState.FAILED).value)
+
+        selects = []
+
+        def count_selects(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        engine = fake_session.db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", count_selects)
+        try:
+            leads = list(iter_campaign_leads(fake_session, page_size=10))
+        finally:
+            event.remove(engine, "before_cursor_execute", count_selects)
+
+        assert [lead.public_identifier for lead in leads] == ["lead00", "lead10", "lead20", "lead30"]
+        assert len(selects) == 5  # four pages + the empty one that ends the scan
+
+
+class TestDueTimeScheduling:
+    def _make_due(self, session, *names):
+        session.db_session.execute(
+            update(Profile).where(Profile.public_identifier.in_(names)).values(next_action_at=utcnow())
+        )
+        session.db_session.commit()
+
+    def test_pending_rechecks_back_off_exponentially(self, fake_session):
+        set_profile_state(fake_session, "bob", ProfileState.ENRICHED.value)
+        delays = []
+        for _ in range(3):
+            before = utcnow()
+            set_profile_state(fake_session, "bob", ProfileState.PENDING.value)
+            row = get_profile(fake_session, "bob")
+            delays.append(row.next_action_at - before)
+        assert [round(d / PENDING_RECHECK_BASE) for d in delays] == [1, 2, 4]
+        assert row.recheck_count == 2
+
+        set_profile_state(fake_session, "bob", ProfileState.CONNECTED.value)
+        row = get_profile(fake_session, "bob")
+        assert (row.next_action_at, row.recheck_count) == (None, 0)
+
+    def test_pending_leads_wait_until_due(self, fake_session):
+        for name in ("bob", "dave"):
+            set_profile_state(fake_session, name, ProfileState.PENDING.value)
+        _stage(fake_session, "bob", "dave", "alice")
+        assert [lead.public_identifier for lead in iter_campaign_leads(fake_session)] == ["alice"]
+
+        self._make_due(fake_session, "dave")
+        assert [lead.public_identifier for lead in iter_campaign_leads(fake_session)] == ["alice", "dave"]
+
+    def test_due_work_is_interleaved_with_new_leads(self, fake_session):
+        names = [f"new{i}" for i in range(4)]
+        set_profile_state(fake_session, "c1", ProfileState.CONNECTED.value)
+        for name in ("p1", "p2"):
+            set_profile_state(fake_session, name, ProfileState.PENDING.value)
+        self._make_due(fake_session, "p1", "p2")
+        _stage(fake_session, *names, "p1", "p2", "c1")
+
+        order = [lead.public_identifier for lead in iter_campaign_leads(fake_session)]
+        assert order == ["new0", "c1", "p1", "new1", "p2", "new2", "new3"]
@@ -0,0 +1,54 @@
+# tests/db/test_limits.py
+from datetime import timedelta
+
+from linkedin.db.leads import iter_campaign_leads, stage_leads
+from linkedin.db.limits import (
+    CONNECTION_LIMIT_WINDOW,
+    WEEKLY_CONNECTIONS,
+    active_limit_until,
+    connection_limit_active,
+    record_connection_limit,
+    record_limit_hit,
+)
+from linkedin.db.profiles import set_profile_state, utcnow
+from linkedin.navigation.enums import ProfileState
+
+
+class TestLimitWindows:
+    def test_no_window_by_default(self, fake_session):
+        assert not connection_limit_active(fake_session)
+        assert active_limit_until(fake_session, WEEKLY_CONNECTIONS) is None
+
+    def test_hit_opens_window_until_expiry(self, fake_session):
+        before = utcnow()
+        expires_at = record_connection_limit(fake_session)
+        assert before + CONNECTION_LIMIT_WINDOW <= expires_at <= utcnow() + CONNECTION_LIMIT_WINDOW
+        assert connection_limit_active(fake_session)
+
+    def test_expired_window_is_inactive(self, fake_session):
+        record_limit_hit(fake_session, WEEKLY_CONNECTIONS, timedelta(seconds=-1))
+        assert not connection_limit_active(fake_session)
+
+    def test_repeat_hit_extends_window(self, fake_session):
+        first = record_limit_hit(fake_session, WEEKLY_CONNECTIONS, timedelta(hours=1))
+        second = record_limit_hit(fake_session, WEEKLY_CONNECTIONS, timedelta(hours=2))
+        assert active_limit_until(fake_session, WEEKLY_CONNECTIONS) == second > first
+
+
+class TestSchedulerSkipsConnectWork:
+    def _run(self, session):
+        return [lead.public_identifier for lead in iter_campaign_leads(session)]
+
+    def test_enriched_leads_wait_for_window_to_close(self, fake_session):
+        set_profile_state(fake_session, "bob", ProfileState.ENRICHED.value)
+        set_profile_state(fake_session, "carol", ProfileState.CONNECTED.value)
+        stage_leads(fake_session, [
+            {"public_identifier": n, "url": f"https://www.linkedin.com/in/{n}/"} for n in ("alice", "bob", "carol")
+        ])
+        assert self._run(fake_session) == ["alice", "bob", "carol"]
+
+        record_connection_limit(fake_session)
+        assert self._run(fake_session) == ["alice", "carol"]
+
+        record_limit_hit(fake_session, WEEKLY_CONNECTIONS, timedelta(seconds=-1))
+        assert self._run(fake_session) == ["alice", "bob", "carol"]
@@ -0,0 +1,162 @@
+# tests/db/test_migrations.py
+from sqlalchemy import create_engine, func, inspect, select, text
+from sqlalchemy.orm import Session
+
+from linkedin.db.engine import _unsynced
+from linkedin.db.migrations import MIGRATIONS, ensure_schema, run_migrations
+from linkedin.db.models import Profile
+
+LATEST = max(m.version for m in MIGRATIONS)
+
+LEGACY_PROFILES_DDL = """
+CREATE TABLE profiles (
+    public_identifier VARCHAR NOT NULL PRIMARY KEY,
+    profile JSON,
+    data JSON,
+    cloud_synced BOOLEAN DEFAULT 'false' NOT NULL,
+    created_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL,
+    updated_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL,
+    state VARCHAR NOT NULL
+)
+"""
+
+
+def _index_names(engine, table="profiles"):
+    return {ix["name"] for ix in inspect(engine).get_indexes(table)}
+
+
+def _legacy_engine(tmp_path):
+    """A DB as created before migrations existed: bare table, JSON-text rows, no indexes."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(LEGACY_PROFILES_DDL))
+        conn.execute(text("INSERT INTO profiles (public_identifier, state) VALUES ('alice', 'pending')"))
+        conn.execute(text(
+            "INSERT INTO profiles (public_identifier, state, data) "
+            "VALUES ('bob', 'enriched', '{\"included\": [{\"a\": 1}]}')"
+        ))
+    return engine
+
+
+class TestMigrations:
+    def test_versions_are_unique_and_ordered(self):
+        versions = [m.version for m in MIGRATIONS]
+        assert versions == sorted(set(versions))
+
+    def test_fresh_db_reaches_latest_version(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+        assert ensure_schema(engine) == LATEST
+        assert {"ix_profiles_state_updated_at", "ix_profiles_cloud_synced"} <= _index_names(engine)
+
+    def test_upgrades_legacy_db_and_keeps_rows(self, tmp_path):
+        engine = _legacy_engine(tmp_path)
+        assert _index_names(engine) == set()
+
+        assert ensure_schema(engine) == LATEST
+
+        assert {"ix_profiles_state_updated_at", "ix_profiles_cloud_synced"} <= _index_names(engine)
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT state FROM profiles WHERE public_identifier = 'alice'")).scalar() == "pending"
+
+    def test_rewrites_legacy_json_text_as_compressed_blob(self, tmp_path):
+        engine = _legacy_engine(tmp_path)
+        ensure_schema(engine)
+
+        with engine.connect() as conn:
+            stored = conn.execute(text("SELECT typeof(data) FROM profiles WHERE public_identifier = 'bob'")).scalar()
+        assert stored == "blob"
+        with Session(engine) as session:
+            assert session.get(Profile, "bob").data == {"included": [{"a": 1}]}
+            assert session.get(Profile, "alice").data is None
+
+    def test_rerun_is_a_noop(self, tmp_path):
+        engine = _legacy_engine(tmp_path)
+        ensure_schema(engine)
+        assert run_migrations(engine) == LATEST
+        with engine.connect() as conn:
+            applied = conn.execute(text("SELECT COUNT(*) FROM schema_version")).scalar()
+        assert applied == len(MIGRATIONS)
+
+    def test_state_query_uses_index(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'plan.db'}")
+        ensure_schema(engine)
+        with engine.connect() as conn:
+            plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM profiles WHERE state = 'discovered'"
+            )).all()
+        assert any("ix_profiles_state_updated_at" in row[-1] for row in plan)
+
+    def test_seeds_state_counters_from_existing_rows(self, tmp_path):
+        engine = _legacy_engine(tmp_path)
+        ensure_schema(engine)
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO profiles (public_identifier, state) VALUES ('carol', 'pending')"))
+            counts = dict(conn.execute(text("SELECT state, count FROM state_counters")).all())
+        assert counts == {"pending": 2, "enriched": 1}
+
+    def test_adds_csv_import_offsets_to_existing_table(self, tmp_path):
+        engine = _legacy_engine(tmp_path)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE csv_imports (source VARCHAR PRIMARY KEY, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, content_hash VARCHAR NOT NULL, leads INTEGER NOT NULL, "
+                "imported_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL)"
+            ))
+            conn.execute(text("INSERT INTO csv_imports VALUES ('a.csv', 120, 1, 'h', 3, CURRENT_TIMESTAMP)"))
+        ensure_schema(engine)
+        with engine.connect() as conn:
+            row = conn.execute(text("SELECT byte_offset, rows FROM csv_imports")).one()
+        assert tuple(row) == (120, 0)
+
+    def test_adds_schedule_columns_with_existing_rows_due(self, tmp_path):
+        engine = _legacy_engine(tmp_path)
+        ensure_schema(engine)
+        with engine.connect() as conn:
+            rows = conn.execute(text("SELECT next_action_at, recheck_count FROM profiles")).all()
+        assert [tuple(r) for r in rows] == [(None, 0), (None, 0)]
+
+    def test_rekeys_campaign_leads_by_source(self, tmp_path):
+        engine = _legacy_engine(tmp_path)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE campaign_leads (public_identifier VARCHAR PRIMARY KEY, url VARCHAR NOT NULL, "
+                "source VARCHAR, added_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL)"
+            ))
+            conn.execute(text(
+                "INSERT INTO campaign_leads (public_identifier, url, source) "
+                "VALUES ('zed', 'u/zed', 'a.csv'), ('amy', 'u/amy', NULL)"
+            ))
+            conn.execute(text("CREATE TABLE campaign_queue (position INTEGER PRIMARY KEY, public_identifier VARCHAR)"))
+        ensure_schema(engine)
+
+        assert inspect(engine).get_pk_constraint("campaign_leads")["constrained_columns"] == [
+            "source", "public_identifier",
+        ]
+        assert "source" in {c["name"] for c in inspect(engine).get_columns("campaign_queue")}
+        with engine.connect() as conn:
+            rows = conn.execute(text("SELECT source, public_identifier FROM campaign_leads ORDER BY rowid")).all()
+        assert [tuple(r) for r in rows] == [("a.csv", "zed"), ("", "amy")]
+
+    def test_adds_sync_version(self, tmp_path):
+        engine = _legacy_engine(tmp_path)
+        ensure_schema(engine)
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT DISTINCT sync_version FROM profiles")).all() == [(0,)]
+
+    def test_normalizes_legacy_cloud_synced_literal(self, tmp_path):
+        engine = _legacy_engine(tmp_path)
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE profiles SET cloud_synced = 1 WHERE public_identifier = 'bob'"))
+        ensure_schema(engine)
+        with engine.connect() as conn:
+            rows = conn.execute(text("SELECT public_identifier, cloud_synced FROM profiles ORDER BY 1")).all()
+        assert [tuple(r) for r in rows] == [("alice", 0), ("bob", 1)]
+
+    def test_unsynced_query_uses_index(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'plan.db'}")
+        ensure_schema(engine)
+        query = _unsynced(select(func.count()).select_from(Profile))
+        with engine.connect() as conn:
+            compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+            plan = conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+        assert any("ix_profiles_cloud_synced" in row[-1] for row in plan)
@@ -1,17 +1,27 @@
 # tests/db/test_profiles.py
+import zlib
+
+import pandas as pd
 import pytest
+from sqlalchemy import LargeBinary, event, select, type_coerce
 
-from linkedin.db.models import Profile
+from linkedin.db.events import funnel_counts
+from linkedin.db.models import Profile, ProfileEvent
 from linkedin.db.profiles import (
     url_to_public_id,
+    extract_public_ids,
     public_id_to_url,
     set_profile_state,
     get_profile,
     save_scraped_profile,
-    get_updated_at_df,
+    save_scraped_profiles,
+    get_profile_states,
     add_profile_urls,
     get_next_url_to_scrape,
     count_pending_scrape,
+    get_profile_state,
+    get_parsed_profile,
+    get_state_and_profile,
 )
 from linkedin.navigation.enums import ProfileState
 
@@ -47,6 +57,41 @@ class TestUrlToPublicId:
             url_to_public_id("https://www.linkedin.com/")
 
 
+# ── extract_public_ids (vectorized url_to_public_id) ──
+
+EXTRACTION_CASES = [
+    "https://www.linkedin.com/in/johndoe/",
+    "HTTPS://linkedin.com/in/johndoe?foo=bar#x",
+    "https://www.linkedin.com/in/johndoe/detail/contact-info/",
+    "https://www.linkedin.com/in/jos%C3%A9/",
+    "https://www.linkedin.com/in/eve;tracking",
+    "https://www.linkedin.com//in/dave",
+    "https://www.linkedin.com/in//z",
+    "/in/carol",
+    "www.linkedin.com/in/no-scheme",
+    "https://www.linkedin.com/company/acme/",
+    "https://www.linkedin.com/",
+    "",
+]
+
+
+class TestExtractPublicIds:
+    def test_matches_url_to_public_id(self):
+        public_ids, rejections = extract_public_ids(pd.Series(EXTRACTION_CASES))
+        for url, public_id, reason in zip(EXTRACTION_CASES, public_ids, rejections):
+            try:
+                expected = url_to_public_id(url)
+            except ValueError as e:
+                assert (public_id, reason) == (None, str(e)), url
+            else:
+                assert (public_id, reason) == (expected, None), url
+
+    def test_missing_values_are_rejected(self):
+        public_ids, rejections = extract_public_ids(pd.Series([None, "https://www.linkedin.com/in/a/"]))
+        assert public_ids.tolist() == [None, "a"]
+        assert rejections.tolist() == ["Empty URL", None]
+
+
 # ── public_id_to_url (pure function) ──
 
 class TestPublicIdToUrl:
@@ -79,6 +124,33 @@ class TestSetAndGetProfile:
         assert get_profile(fake_session, "nobody") is None
 
 
+class TestProjectionLookups:
+    URL = "https://www.linkedin.com/in/alice/"
+
+    def test_state_only(self, fake_session):
+        set_profile_state(fake_session, "alice", ProfileState.PENDING.value)
+        assert get_profile_state(fake_session, "alice") == ProfileState.PENDING.value
+        assert get_profile_state(fake_session, "nobody") is None
+
+    def test_parsed_profile_only(self, fake_session):
+        save_scraped_profile(fake_session, self.URL, {"full_name": "Alice"}, {"included": []})
+        assert get_parsed_profile(fake_session, "alice") == {"full_name": "Alice"}
+        assert get_parsed_profile(fake_session, "nobody") is None
+
+    def test_state_and_profile(self, fake_session):
+        save_scraped_profile(fake_session, self.URL, {"full_name": "Alice"}, {"included": []})
+        assert get_state_and_profile(fake_session, "alice") == (ProfileState.ENRICHED.value, {"full_name": "Alice"})
+        assert get_state_and_profile(fake_session, "nobody") == (None, None)
+
+    def test_get_profile_defers_raw_data(self, fake_session):
+        save_scraped_profile(fake_session, self.URL, {"full_name": "Alice"}, {"included": [1]})
+        fake_session.db_session.expire_all()
+
+        row = get_profile(fake_session, "alice")
+        assert "data" not in row.__dict__
+        assert row.data == {"included": [1]}
+
+
 class TestSaveScrapedProfile:
     def test_saves_new_profile(self, fake_session):
         profile_data = {"full_name": "Alice Smith", "headline": "Engineer"}
@@ -107,11 +179,64 @@ class TestSaveScrapedProfile:
         assert row.profile["full_name"] == "Alice Smith v2"
         assert row.state == ProfileState.ENRICHED.value
 
+    def test_raw_response_bytes_are_archived_verbatim(self, fake_session):
+        raw = b'{"included": [{"entityUrn": "urn:li:x", "name": "caf\xc3\xa9"}], "data": {}}'
+        save_scraped_profile(fake_session, "https://www.linkedin.com/in/alicesmith/", {"full_name": "Alice"}, raw)
+
+        stored = fake_session.db_session.execute(
+            select(type_coerce(Profile.__table__.c.data, LargeBinary))
+        ).scalar()
+        assert zlib.decompress(stored[1:]) == raw
+        assert get_profile(fake_session, "alicesmith").data["included"][0]["name"] == "café"
+
     def test_invalid_url_raises(self, fake_session):
         with pytest.raises(ValueError, match="Not a valid /in/ profile URL"):
             save_scraped_profile(fake_session, "https://linkedin.com/feed/", {}, None)
 
 
+class TestSaveScrapedProfiles:
+    def test_saves_every_profile_in_one_transaction(self, fake_session):
+        set_profile_state(fake_session, "bob", ProfileState.DISCOVERED.value)
+        commits = []
+
+        def count_commits(conn):
+            commits.append(conn)
+
+        engine = fake_session.db_session.get_bind()
+        event.listen(engine, "commit", count_commits)
+        try:
+            saved = save_scraped_profiles(fake_session, {
+                "alice": {"public_identifier": "alice", "full_name": "Alice"},
+                # Stored under its key, whatever id the parsed entity carries
+                "bob": {"public_identifier": "bob-renamed", "full_name": "Bob"},
+                None: {"full_name": "No id"},
+            }, {"included": []})
+        finally:
+            event.remove(engine, "commit", count_commits)
+
+        assert saved == 2 and len(commits) == 1
+        for public_id, name in (("alice", "Alice"), ("bob", "Bob")):
+            row = get_profile(fake_session, public_id)
+            assert row.state == ProfileState.ENRICHED.value
+            assert row.profile["full_name"] == name
+            assert row.data == {"included": []}
+        assert get_profile(fake_session, "bob-renamed") is None
+
+    def test_nothing_to_save(self, fake_session):
+        assert save_scraped_profiles(fake_session, {None: {"full_name": "No id"}}) == 0
+
+
+class TestGetProfileStates:
+    def test_returns_known_states_only(self, fake_session):
+        set_profile_state(fake_session, "alice", ProfileState.DISCOVERED.value)
+        set_profile_state(fake_session, "bob", ProfileState.PENDING.value)
+        assert get_profile_states(fake_session, ["alice", "bob", "zed"]) == {
+            "alice": ProfileState.DISCOVERED.value,
+            "bob": ProfileState.PENDING.value,
+        }
+        assert get_profile_states(fake_session, []) == {}
+
+
 class TestAddProfileUrls:
     def test_adds_discovered_profiles(self, fake_session):
         urls = [
@@ -131,6 +256,17 @@ class TestAddProfileUrls:
         add_profile_urls(fake_session, [])
         assert fake_session.db_session.query(Profile).count() == 0
 
+    def test_logs_discovered_event_for_new_profiles_only(self, fake_session):
+        add_profile_urls(fake_session, ["https://www.linkedin.com/in/alice/"])
+        add_profile_urls(fake_session, ["https://www.linkedin.com/in/alice/", "https://www.linkedin.com/in/bob/"])
+
+        events = fake_session.db_session.query(ProfileEvent).order_by(ProfileEvent.public_identifier).all()
+        assert [(e.public_identifier, e.from_state, e.to_state) for e in events] == [
+            ("alice", None, "discovered"),
+            ("bob", None, "discovered"),
+        ]
+        assert funnel_counts(fake_session)["discovered"] == 2
+
 
 class TestGetNextUrlToScrape:
     def test_returns_discovered_profiles(self, fake_session):
@@ -160,20 +296,3 @@ class TestCountPendingScrape:
 
     def test_zero_when_empty(self, fake_session):
         assert count_pending_scrape(fake_session) == 0
-
-
-class TestGetUpdatedAtDf:
-    def test_returns_timestamps_for_existing(self, fake_session):
-        set_profile_state(fake_session, "alice", ProfileState.ENRICHED.value)
-        df = get_updated_at_df(fake_session, ["alice", "nobody"])
-        assert len(df) == 1
-        assert df.iloc[0]["public_identifier"] == "alice"
-
-    def test_empty_input_returns_empty_df(self, fake_session):
-        df = get_updated_at_df(fake_session, [])
-        assert len(df) == 0
-        assert list(df.columns) == ["public_identifier", "updated_at"]
-
-    def test_no_matches_returns_empty_df(self, fake_session):
-        df = get_updated_at_df(fake_session, ["nobody"])
-        assert len(df) == 0
@@ -0,0 +1,93 @@
+# tests/db/test_reparse.py
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from linkedin.db.migrations import ensure_schema
+from linkedin.db.models import ReparseRun
+from linkedin.db.profiles import get_profile, save_scraped_profile
+from linkedin.db.reparse import VOYAGER, reparse_profiles
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "profiles" / "linkedin_profile.json"
+
+
+@pytest.fixture(scope="module")
+def raw_profile():
+    with open(FIXTURE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save(session, name, profile, data):
+    save_scraped_profile(session, f"https://www.linkedin.com/in/{name}/", profile, data)
+
+
+def _mark_synced(session):
+    session.db_session.execute(text("UPDATE profiles SET cloud_synced = 1, updated_at = '2020-01-01 00:00:00'"))
+    session.db_session.commit()
+
+
+class TestReparseProfiles:
+    def test_refreshes_stale_profiles_only(self, fake_session, raw_profile):
+        _save(fake_session, "lexfridman", {"full_name": "stale"}, raw_profile)
+        run = reparse_profiles(fake_session)
+        fresh = get_profile(fake_session, "lexfridman").profile
+        assert fresh["full_name"] == "Lex Fridman"
+        assert (run.processed, run.changed, run.failed) == (1, 1, 0)
+        assert run.finished_at is not None
+
+        run = reparse_profiles(fake_session)
+        assert (run.processed, run.changed) == (1, 0)
+
+    def test_changed_rows_resync_without_touching_updated_at(self, fake_session, raw_profile):
+        _save(fake_session, "lexfridman", {"full_name": "stale"}, raw_profile)
+        _mark_synced(fake_session)
+        reparse_profiles(fake_session)
+        row = fake_session.db_session.execute(
+            text("SELECT cloud_synced, updated_at FROM profiles WHERE public_identifier = 'lexfridman'")
+        ).one()
+        assert tuple(row) == (0, "2020-01-01 00:00:00")
+
+    def test_unparseable_payload_is_counted_and_left_alone(self, fake_session, raw_profile):
+        _save(fake_session, "broken", {"full_name": "Kept"}, {"included": []})
+        _save(fake_session, "lexfridman", {"full_name": "stale"}, raw_profile)
+        _save(fake_session, "nodata", {"full_name": "No payload"}, None)
+
+        run = reparse_profiles(fake_session, batch_size=1)
+        assert (run.processed, run.changed, run.failed) == (2, 1, 1)
+        assert get_profile(fake_session, "broken").profile == {"full_name": "Kept"}
+
+    def test_resumes_an_unfinished_pass_after_its_checkpoint(self, fake_session, raw_profile):
+        for name in ("alice", "bob", "carol"):
+            _save(fake_session, name, {"full_name": "stale"}, raw_profile)
+        reparse_profiles(fake_session)
+        for name in ("alice", "bob", "carol"):
+            _save(fake_session, name, {"full_name": "stale"}, raw_profile)
+
+        # Interrupted after the batch ending at "alice"
+        run = fake_session.db_session.get(ReparseRun, VOYAGER)
+        run.last_key, run.processed, run.changed, run.finished_at = "alice", 1, 1, None
+        fake_session.db_session.commit()
+
+        run = reparse_profiles(fake_session, batch_size=1)
+        assert (run.processed, run.changed) == (3, 3)
+        assert get_profile(fake_session, "alice").profile == {"full_name": "stale"}
+        assert get_profile(fake_session, "carol").profile["full_name"] == "Lex Fridman"
+
+        run = reparse_profiles(fake_session, restart=True)
+        assert (run.processed, run.changed) == (3, 1)
+
+    def test_process_pool_gives_the_same_result(self, tmp_path, raw_profile):
+        # Workers are separate processes: use a file DB rather than the in-memory fixture
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+        ensure_schema(engine)
+        session = SimpleNamespace(db_session=sessionmaker(bind=engine)())
+        for i in range(6):
+            _save(session, f"lead{i}", {"full_name": "stale"}, raw_profile)
+
+        run = reparse_profiles(session, workers=2, batch_size=2)
+        assert (run.processed, run.changed, run.failed) == (6, 6, 0)
+        assert get_profile(session, "lead5").profile["full_name"] == "Lex Fridman"
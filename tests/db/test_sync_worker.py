@@ -0,0 +1,118 @@
+# tests/db/test_sync_worker.py
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from linkedin.db.engine import Database
+from linkedin.db.profiles import get_profile, save_scraped_profile
+from linkedin.db.sync_worker import CloudSyncWorker
+from linkedin.db.types import encode_json_blob
+from linkedin.db.write_buffer import WriteBehindBuffer
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "acct.db"))
+    yield database
+    database.close(sync=False)
+
+
+@pytest.fixture
+def pushed(monkeypatch):
+    """Records payloads sent to the cloud and which thread sent them."""
+    calls = []
+    monkeypatch.setattr(
+        "linkedin.db.engine.sync_profiles",
+        lambda data: calls.append((threading.current_thread().name, len(data))) or True,
+    )
+    return calls
+
+
+def _seed(db, start, n):
+    with db.engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO profiles (public_identifier, state, data) VALUES (:pid, 'enriched', :data)"),
+            [{"pid": f"p{i:04d}", "data": encode_json_blob({"i": i})} for i in range(start, start + n)],
+        )
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestCloudSyncWorker:
+    def test_from_config(self, db):
+        assert CloudSyncWorker.from_config(db, None) is None
+        assert CloudSyncWorker.from_config(db, True).backlog_threshold == 200
+        assert CloudSyncWorker.from_config(db, {"backlog_threshold": 5}).backlog_threshold == 5
+
+    def test_backlog_threshold_triggers_sync_on_worker_thread(self, db, pushed):
+        worker = CloudSyncWorker(db, interval_seconds=3600, backlog_threshold=3, poll_seconds=0.01).start()
+        _seed(db, 0, 2)
+        time.sleep(0.1)
+        assert pushed == []
+
+        _seed(db, 2, 2)
+        assert _wait_for(lambda: worker.synced_total == 4)
+        assert {name for name, _ in pushed} == {"cloud-sync"}
+        assert worker.stop() is True
+        assert worker.backlog == 0
+
+    def test_stop_drains_remaining_backlog(self, db, pushed):
+        worker = CloudSyncWorker(db, interval_seconds=3600, backlog_threshold=1000).start()
+        _seed(db, 0, 5)
+        assert worker.stop() is True
+        assert db.count_unsynced_profiles() == 0
+        assert worker.lag_seconds < 1
+
+    def test_locked_database_is_counted_not_raised(self, db, monkeypatch):
+        def locked(**kwargs):
+            raise OperationalError("UPDATE profiles", {}, Exception("database is locked"))
+
+        monkeypatch.setattr(db, "_sync_all_unsynced_profiles", locked)
+        worker = CloudSyncWorker(db)
+        assert worker.sync_once() == 0
+        assert worker.failures == 1
+        assert worker.last_success_at is None
+
+    def test_waits_for_buffered_writes_instead_of_failing(self, db, pushed):
+        buffer = WriteBehindBuffer(db.get_session(), max_pending_seconds=3600)
+        account = SimpleNamespace(db_session=buffer.db_session, write_buffer=buffer)
+        _seed(db, 0, 3)
+        save_scraped_profile(account, "https://www.linkedin.com/in/alice/", {"n": 1}, {"n": 1})
+        get_profile(account, "alice")  # autoflush: the account session now holds the write lock
+
+        worker = CloudSyncWorker(db, interval_seconds=0.02, poll_seconds=0.01, write_buffer=buffer).start()
+        assert _wait_for(lambda: worker.skipped >= 3)
+        assert (pushed, worker.failures) == ([], 0)
+
+        buffer.flush()
+        assert _wait_for(lambda: worker.synced_total == 4)
+        assert worker.stop() is True
+        assert worker.failures == 0
+
+    def test_batch_sent_while_locked_is_flagged_not_resent(self, db, pushed, monkeypatch):
+        _seed(db, 0, 3)
+        flag = db._flag_synced
+
+        def locked_once(db_session, sent):
+            monkeypatch.setattr(db, "_flag_synced", flag)
+            raise OperationalError("UPDATE profiles", {}, Exception("database is locked"))
+
+        monkeypatch.setattr(db, "_flag_synced", locked_once)
+        worker = CloudSyncWorker(db)
+        assert worker.sync_once() == 0
+        assert (len(pushed), worker.failures) == (1, 1)
+
+        assert worker.sync_once() == 3
+        assert len(pushed) == 1
+        assert worker.backlog == 0
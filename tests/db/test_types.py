@@ -0,0 +1,54 @@
+# tests/db/test_types.py
+import json
+
+import pytest
+
+from linkedin.conf import FIXTURE_PROFILES_DIR
+from linkedin.db.models import Profile
+from linkedin.db.types import ZLIB_JSON, decode_json_blob, encode_json_blob
+
+
+@pytest.fixture
+def raw_profile():
+    with open(FIXTURE_PROFILES_DIR / "linkedin_profile.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestJsonBlobCodec:
+    def test_roundtrip(self, raw_profile):
+        blob = encode_json_blob(raw_profile)
+        assert blob.startswith(ZLIB_JSON)
+        assert decode_json_blob(blob) == raw_profile
+
+    def test_compresses_voyager_payload(self, raw_profile):
+        plain = json.dumps(raw_profile).encode()
+        assert len(encode_json_blob(raw_profile)) < len(plain) / 4
+
+    def test_none_stays_none(self):
+        assert encode_json_blob(None) is None
+        assert decode_json_blob(None) is None
+
+    def test_serialized_bytes_are_stored_as_is(self):
+        raw = b'{"included":[],"data":{"a":1}}'
+        assert decode_json_blob(encode_json_blob(raw)) == {"included": [], "data": {"a": 1}}
+
+    def test_reads_legacy_json_text(self):
+        assert decode_json_blob('{"a": [1, 2]}') == {"a": [1, 2]}
+        assert decode_json_blob("null") is None
+
+    def test_unknown_codec_raises(self):
+        with pytest.raises(ValueError, match="Unknown JSON blob codec"):
+            decode_json_blob(b"\x7fgarbage")
+
+
+class TestCompressedColumn:
+    def test_orm_roundtrip(self, db_session, raw_profile):
+        db_session.add(Profile(public_identifier="lex", data=raw_profile))
+        db_session.commit()
+        db_session.expire_all()
+
+        assert db_session.get(Profile, "lex").data == raw_profile
+        stored = db_session.connection().exec_driver_sql(
+            "SELECT typeof(data) FROM profiles WHERE public_identifier = 'lex'"
+        ).scalar()
+        assert stored == "blob"
@@ -0,0 +1,76 @@
+# tests/db/test_write_buffer.py
+import pytest
+from sqlalchemy import event
+
+from linkedin.db.profiles import get_profile, save_scraped_profile, set_profile_state
+from linkedin.db.write_buffer import WriteBehindBuffer
+from linkedin.navigation.enums import ProfileState
+
+
+@pytest.fixture
+def commits(db_session):
+    """Counts real COMMITs issued on the session."""
+    counter = {"n": 0}
+
+    @event.listens_for(db_session, "after_commit")
+    def _count(_):
+        counter["n"] += 1
+
+    return counter
+
+
+def _buffered(fake_session, **kwargs):
+    fake_session.write_buffer = WriteBehindBuffer(fake_session.db_session, **kwargs)
+    return fake_session.write_buffer
+
+
+class TestWriteBehindBuffer:
+    def test_without_buffer_every_write_commits(self, fake_session, commits):
+        for name in ["a", "b", "c"]:
+            set_profile_state(fake_session, name, ProfileState.DISCOVERED.value)
+        assert commits["n"] == 3
+
+    def test_flushes_on_count_threshold(self, fake_session, commits):
+        buffer = _buffered(fake_session, max_pending_ops=10, max_pending_seconds=3600)
+        for i in range(25):
+            set_profile_state(fake_session, f"lead{i}", ProfileState.DISCOVERED.value)
+        assert commits["n"] == 2
+        assert buffer.pending_ops == 5
+
+    def test_pending_writes_are_visible_before_flush(self, fake_session, commits):
+        _buffered(fake_session, max_pending_ops=100)
+        set_profile_state(fake_session, "alice", ProfileState.DISCOVERED.value)
+        save_scraped_profile(fake_session, "https://www.linkedin.com/in/alice/", {"full_name": "Alice"}, None)
+        set_profile_state(fake_session, "alice", ProfileState.PENDING.value)
+
+        row = get_profile(fake_session, "alice")
+        assert row.state == ProfileState.PENDING.value
+        assert row.profile == {"full_name": "Alice"}
+        assert commits["n"] == 0
+
+    def test_flush_on_demand(self, fake_session, commits):
+        buffer = _buffered(fake_session, max_pending_ops=100)
+        set_profile_state(fake_session, "alice", ProfileState.DISCOVERED.value)
+        assert buffer.flush() == 1
+        assert buffer.flush() == 0
+        assert commits["n"] == 1
+
+    def test_flushes_on_time_threshold(self, fake_session, commits, mocker):
+        clock = mocker.patch("linkedin.db.write_buffer.time.monotonic", return_value=100.0)
+        buffer = _buffered(fake_session, max_pending_ops=100, max_pending_seconds=5)
+        set_profile_state(fake_session, "alice", ProfileState.DISCOVERED.value)
+        assert buffer.maybe_flush() == 0
+
+        clock.return_value = 106.0
+        assert buffer.maybe_flush() == 1
+        assert commits["n"] == 1
+
+    def test_from_config(self, db_session):
+        assert WriteBehindBuffer.from_config(db_session, None) is None
+        assert WriteBehindBuffer.from_config(db_session, False) is None
+        assert WriteBehindBuffer.from_config(db_session, True).max_pending_ops == 50
+        assert WriteBehindBuffer.from_config(db_session, {"max_pending_ops": 7}).max_pending_ops == 7
+
+    def test_rejects_zero_cap(self, db_session):
+        with pytest.raises(ValueError):
+            WriteBehindBuffer(db_session, max_pending_ops=0)
@@ -0,0 +1,52 @@
+# tests/test_account.py
+import pytest
+
+from linkedin.db.profiles import get_profile, set_profile_state
+from linkedin.navigation.enums import ProfileState
+from linkedin.sessions.account import scrape_with_embedded
+
+URL = "https://www.linkedin.com/in/alice/"
+
+
+class FakeApi:
+    def __init__(self, profiles, data=b'{"included": []}'):
+        self.profiles, self.data = profiles, data
+
+    def get_profiles(self, profile_url):
+        return self.profiles, (self.data if self.profiles else None)
+
+
+def _profile(public_id):
+    return {"public_identifier": public_id, "full_name": public_id.title()}
+
+
+class TestScrapeWithEmbedded:
+    @pytest.fixture(autouse=True)
+    def leads(self, fake_session):
+        for public_id in ("alice", "bob"):
+            set_profile_state(fake_session, public_id, ProfileState.DISCOVERED.value)
+        set_profile_state(fake_session, "carol", ProfileState.PENDING.value)
+
+    def test_saves_requested_and_waiting_embedded_leads(self, fake_session):
+        api = FakeApi([_profile("alice"), _profile("bob"), _profile("carol"), _profile("viewer")])
+        assert scrape_with_embedded(fake_session, api, URL) == 2
+
+        assert get_profile(fake_session, "alice").state == ProfileState.ENRICHED.value
+        assert get_profile(fake_session, "bob").profile["full_name"] == "Bob"
+        assert get_profile(fake_session, "carol").state == ProfileState.PENDING.value
+        assert get_profile(fake_session, "viewer") is None
+
+    def test_requested_profile_is_saved_under_the_url_id(self, fake_session):
+        # Renamed vanity URL: the main entity carries another id
+        api = FakeApi([_profile("alice-new"), _profile("bob")])
+        scrape_with_embedded(fake_session, api, URL)
+
+        row = get_profile(fake_session, "alice")
+        assert row.state == ProfileState.ENRICHED.value
+        assert row.profile["public_identifier"] == "alice-new"
+        assert get_profile(fake_session, "alice-new") is None
+
+    def test_inaccessible_profile_is_marked_enriched_without_data(self, fake_session):
+        assert scrape_with_embedded(fake_session, FakeApi([]), URL) == 1
+        row = get_profile(fake_session, "alice")
+        assert (row.state, row.profile) == (ProfileState.ENRICHED.value, None)
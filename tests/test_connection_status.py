@@ -0,0 +1,92 @@
+# tests/test_connection_status.py
+import pytest
+
+from linkedin.actions import connection_status
+from linkedin.actions.connection_status import STATUS_CHECK_PATHS, get_connection_status
+from linkedin.navigation.enums import ProfileState
+from linkedin.navigation.exceptions import AuthenticationError
+
+PROFILE = {"public_identifier": "alice", "url": "https://www.linkedin.com/in/alice/", "connection_degree": 2}
+
+
+class FakeSession:
+    def ensure_browser(self):
+        pass
+
+
+@pytest.fixture
+def paths(monkeypatch):
+    STATUS_CHECK_PATHS.clear()
+    ui_calls = []
+
+    def fake_ui(session, profile, degree):
+        ui_calls.append(degree)
+        return ProfileState.ENRICHED
+
+    monkeypatch.setattr(connection_status, "_status_from_ui", fake_ui)
+    yield ui_calls
+    STATUS_CHECK_PATHS.clear()
+
+
+def _api_returns(monkeypatch, fresh):
+    monkeypatch.setattr(connection_status, "_fetch_relationship", lambda session, profile: fresh)
+
+
+class TestApiFirstStatus:
+    @pytest.mark.parametrize("fresh, expected", [
+        ({"connection_degree": 1, "invitation_pending": False}, ProfileState.CONNECTED),
+        ({"connection_degree": 2, "invitation_pending": True}, ProfileState.PENDING),
+        ({"connection_degree": 3, "invitation_pending": False}, ProfileState.ENRICHED),
+    ])
+    def test_conclusive_api_answer_skips_the_page(self, monkeypatch, paths, fresh, expected):
+        _api_returns(monkeypatch, fresh)
+        assert get_connection_status(FakeSession(), PROFILE) == expected
+        assert paths == []
+        assert STATUS_CHECK_PATHS == {"api": 1}
+
+    @pytest.mark.parametrize("fresh", [
+        None,  # request failed
+        {"connection_degree": None, "invitation_pending": False},  # out of network
+        {"connection_degree": 2, "invitation_pending": None},  # relationship not in the response
+    ])
+    def test_ambiguous_answer_falls_back_to_ui(self, monkeypatch, paths, fresh):
+        _api_returns(monkeypatch, fresh)
+        assert get_connection_status(FakeSession(), PROFILE) == ProfileState.ENRICHED
+        assert paths == [(fresh or PROFILE)["connection_degree"]]
+        assert STATUS_CHECK_PATHS == {"ui": 1}
+
+    def test_just_fetched_profile_is_not_requested_again(self, monkeypatch, paths):
+        def no_fetch(session, profile):
+            raise AssertionError("relationship fetched again")
+
+        monkeypatch.setattr(connection_status, "_fetch_relationship", no_fetch)
+        fresh = {"connection_degree": 2, "invitation_pending": True}
+        assert get_connection_status(FakeSession(), PROFILE, fresh=fresh) == ProfileState.PENDING
+        assert STATUS_CHECK_PATHS == {"api": 1}
+
+    def test_api_fetches_are_paced(self, monkeypatch, paths):
+        delays = []
+        monkeypatch.setattr(connection_status, "human_delay", lambda lo, hi: delays.append((lo, hi)))
+
+        class FakeApi:
+            def __init__(self, session):
+                pass
+
+            def get_profile(self, public_identifier=None, profile_url=None):
+                return {"connection_degree": 1, "invitation_pending": False}, b"{}"
+
+        monkeypatch.setattr(connection_status, "PlaywrightLinkedinAPI", FakeApi)
+        for _ in range(3):
+            assert get_connection_status(FakeSession(), PROFILE) == ProfileState.CONNECTED
+        assert delays == [(connection_status.MIN_API_DELAY, connection_status.MAX_API_DELAY)] * 3
+
+    def test_auth_errors_are_not_swallowed(self, monkeypatch, paths):
+        monkeypatch.setattr(connection_status, "human_delay", lambda lo, hi: None)
+
+        class ExpiredApi:
+            def __init__(self, session):
+                raise AuthenticationError("401")
+
+        monkeypatch.setattr(connection_status, "PlaywrightLinkedinAPI", ExpiredApi)
+        with pytest.raises(AuthenticationError):
+            get_connection_status(FakeSession(), PROFILE)
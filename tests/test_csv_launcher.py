@@ -1,53 +1,184 @@
 # tests/test_csv_launcher.py
+import os
+
+import pandas as pd
 import pytest
 
-from linkedin.csv_launcher import load_profiles_df
-
-
-class TestLoadProfilesDf:
-    def test_loads_url_column(self, tmp_path):
-        csv = tmp_path / "urls.csv"
-        csv.write_text("url\nhttps://www.linkedin.com/in/alice/\nhttps://www.linkedin.com/in/bob/\n")
-        df = load_profiles_df(csv)
-        assert len(df) == 2
-        assert "public_identifier" in df.columns
-
-    def test_recognizes_linkedin_url_column(self, tmp_path):
-        csv = tmp_path / "urls.csv"
-        csv.write_text("linkedin_url\nhttps://www.linkedin.com/in/alice/\n")
-        df = load_profiles_df(csv)
-        assert len(df) == 1
-
-    def test_recognizes_profile_url_column(self, tmp_path):
-        csv = tmp_path / "urls.csv"
-        csv.write_text("profile_url\nhttps://www.linkedin.com/in/alice/\n")
-        df = load_profiles_df(csv)
-        assert len(df) == 1
-
-    def test_deduplicates_urls(self, tmp_path):
-        csv = tmp_path / "urls.csv"
-        csv.write_text("url\nhttps://www.linkedin.com/in/alice/\nhttps://www.linkedin.com/in/alice/\n")
-        df = load_profiles_df(csv)
-        assert len(df) == 1
-
-    def test_strips_whitespace(self, tmp_path):
-        csv = tmp_path / "urls.csv"
-        csv.write_text("url\n  https://www.linkedin.com/in/alice/  \n")
-        df = load_profiles_df(csv)
-        assert len(df) == 1
-
-    def test_missing_file_raises(self, tmp_path):
+from linkedin.csv_launcher import import_profiles_csv, reject_report_path, stage_profiles_csv
+from linkedin.db.leads import count_staged_leads, get_staged_profiles
+from linkedin.db.profiles import set_profile_state
+from linkedin.navigation.enums import ProfileState
+
+
+class TestStageProfilesCsv:
+    def _write(self, tmp_path, names, header="url"):
+        csv = tmp_path / "leads.csv"
+        lines = [header] + [f"https://www.linkedin.com/in/{n}/" for n in names]
+        csv.write_text("\n".join(lines) + "\n")
+        return csv
+
+    def test_streams_in_chunks_and_dedupes_across_chunks(self, tmp_path, fake_session):
+        csv = self._write(tmp_path, ["alice", "bob", "alice", "carol", "bob", "dave"])
+        assert stage_profiles_csv(fake_session, csv, chunksize=2) == 4
+        assert count_staged_leads(fake_session) == 4
+
+    def test_restaging_same_file_adds_nothing(self, tmp_path, fake_session):
+        csv = self._write(tmp_path, ["alice", "bob"])
+        stage_profiles_csv(fake_session, csv)
+        assert stage_profiles_csv(fake_session, csv) == 0
+
+    def test_process_pool_gives_same_result(self, tmp_path, fake_session):
+        csv = self._write(tmp_path, [f"lead{i % 7}" for i in range(30)])
+        assert stage_profiles_csv(fake_session, csv, chunksize=4, workers=2) == 7
+        order = [p["public_identifier"] for p in get_staged_profiles(fake_session)]
+        assert order == [f"lead{i}" for i in range(7)]
+
+    def test_reject_report_lists_rows_across_chunks(self, tmp_path, fake_session):
+        csv = tmp_path / "leads.csv"
+        csv.write_text(
+            "url\n"
+            "https://www.linkedin.com/in/alice/\n"
+            "not a url\n"
+            "https://www.linkedin.com/in/bob/\n"
+            "https://www.linkedin.com/school/mit/\n"
+        )
+        stage_profiles_csv(fake_session, csv, chunksize=2)
+        report = pd.read_csv(reject_report_path(csv))
+        assert report["row"].tolist() == [2, 4]
+        assert report["reason"].str.startswith("Not a valid /in/ profile URL").all()
+
+    def test_clean_file_removes_stale_report(self, tmp_path, fake_session):
+        csv = self._write(tmp_path, ["alice"])
+        reject_report_path(csv).write_text("row,url,reason\n")
+        stage_profiles_csv(fake_session, csv)
+        assert not reject_report_path(csv).exists()
+
+    def test_skips_blank_and_non_profile_rows(self, tmp_path, fake_session):
+        csv = tmp_path / "leads.csv"
+        csv.write_text(
+            "name,profile_url\n"
+            "a, https://www.linkedin.com/in/alice/ \n"
+            "b,\n"
+            "c,https://www.linkedin.com/company/acme/\n"
+        )
+        assert stage_profiles_csv(fake_session, csv, chunksize=1) == 1
+        assert get_staged_profiles(fake_session) == [
+            {"url": "https://www.linkedin.com/in/alice/", "public_identifier": "alice"},
+        ]
+
+    def test_staged_order_interleaves_new_leads_with_due_work(self, tmp_path, fake_session):
+        for name in ("bob", "dave"):
+            set_profile_state(fake_session, name, ProfileState.ENRICHED.value)
+        set_profile_state(fake_session, "erin", ProfileState.PENDING.value)  # invite just sent → not due
+        csv = self._write(tmp_path, ["bob", "dave", "erin", "alice", "carol"])
+        stage_profiles_csv(fake_session, csv)
+        order = [p["public_identifier"] for p in get_staged_profiles(fake_session, source=str(csv.resolve()))]
+        assert order == ["alice", "bob", "carol", "dave"]
+
+    def test_recognizes_linkedin_url_column(self, tmp_path, fake_session):
+        csv = self._write(tmp_path, ["alice"], header="LinkedIn_URL")
+        assert stage_profiles_csv(fake_session, csv) == 1
+
+    def test_missing_file_raises(self, tmp_path, fake_session):
         with pytest.raises(FileNotFoundError):
-            load_profiles_df(tmp_path / "nope.csv")
+            stage_profiles_csv(fake_session, tmp_path / "nope.csv")
 
-    def test_no_url_column_raises(self, tmp_path):
+    def test_no_url_column_raises(self, tmp_path, fake_session):
         csv = tmp_path / "bad.csv"
         csv.write_text("name,email\nalice,alice@example.com\n")
         with pytest.raises(ValueError, match="No URL column found"):
-            load_profiles_df(csv)
+            stage_profiles_csv(fake_session, csv)
+
+
+class TestImportProfilesCsv:
+    def _write(self, path, names):
+        path.write_text("url\n" + "".join(f"https://www.linkedin.com/in/{n}/\n" for n in names))
+
+    @pytest.fixture
+    def staged(self, monkeypatch):
+        """Counts how often the file is actually parsed."""
+        import linkedin.csv_launcher as launcher
+        calls = []
+        real = launcher.stage_profiles_csv
+        monkeypatch.setattr(launcher, "stage_profiles_csv", lambda *a, **kw: calls.append(1) or real(*a, **kw))
+        return calls
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, fake_session, staged):
+        csv = tmp_path / "leads.csv"
+        self._write(csv, ["alice", "bob"])
+        assert import_profiles_csv(fake_session, csv) == 2
+        assert import_profiles_csv(fake_session, csv) == 2
+        assert len(staged) == 1
+
+    def test_touched_but_identical_file_is_not_reparsed(self, tmp_path, fake_session, staged):
+        csv = tmp_path / "leads.csv"
+        self._write(csv, ["alice", "bob"])
+        import_profiles_csv(fake_session, csv)
+        stat = csv.stat()
+        os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert import_profiles_csv(fake_session, csv) == 2
+        assert len(staged) == 1
+
+    def test_changed_file_is_restaged(self, tmp_path, fake_session, staged):
+        csv = tmp_path / "leads.csv"
+        self._write(csv, ["alice", "bob"])
+        import_profiles_csv(fake_session, csv)
+        self._write(csv, ["bob", "carol", "dave"])
+        stat = csv.stat()
+        os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert import_profiles_csv(fake_session, csv) == 3
+        assert len(staged) == 2
+        assert {p["public_identifier"] for p in get_staged_profiles(fake_session)} == {"bob", "carol", "dave"}
+
+    def _append(self, path, names, newline=True):
+        with open(path, "a") as f:
+            f.write("".join(f"https://www.linkedin.com/in/{n}/\n" for n in names) if newline else names)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_appended_rows_parse_only_the_tail(self, tmp_path, fake_session, monkeypatch):
+        import linkedin.csv_launcher as launcher
+        ranges = []
+        real = launcher.stage_profiles_csv
+        monkeypatch.setattr(launcher, "stage_profiles_csv",
+                            lambda *a, **kw: ranges.append(kw.get("start", 0)) or real(*a, **kw))
+
+        csv = tmp_path / "leads.csv"
+        self._write(csv, ["alice", "bob"])
+        import_profiles_csv(fake_session, csv)
+        imported = csv.stat().st_size
+
+        self._append(csv, ["carol", "alice", "dave"])
+        assert import_profiles_csv(fake_session, csv) == 4
+        assert ranges == [0, imported]
+        order = [p["public_identifier"] for p in get_staged_profiles(fake_session)]
+        assert order == ["alice", "bob", "carol", "dave"]
+
+    def test_tail_rejects_keep_absolute_row_numbers(self, tmp_path, fake_session):
+        csv = tmp_path / "leads.csv"
+        self._write(csv, ["alice", "bob"])
+        import_profiles_csv(fake_session, csv)
+        with open(csv, "a") as f:
+            f.write("https://www.linkedin.com/feed/\n")
+        import_profiles_csv(fake_session, csv)
+        assert pd.read_csv(reject_report_path(csv))["row"].tolist() == [3]
+
+    def test_partial_last_line_is_read_again(self, tmp_path, fake_session):
+        csv = tmp_path / "leads.csv"
+        csv.write_text("url\nhttps://www.linkedin.com/in/alice/\nhttps://www.linkedin.com/in/bob/")
+        assert import_profiles_csv(fake_session, csv) == 2
+
+        self._append(csv, "\nhttps://www.linkedin.com/in/carol/\n", newline=False)
+        assert import_profiles_csv(fake_session, csv) == 3
+
+    def test_rewritten_prefix_forces_full_rescan(self, tmp_path, fake_session):
+        csv = tmp_path / "leads.csv"
+        self._write(csv, ["alice", "bob"])
+        import_profiles_csv(fake_session, csv)
+        self._write(csv, ["zed", "bob", "carol"])
+        stat = csv.stat()
+        os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
 
-    def test_extracts_public_identifier(self, tmp_path):
-        csv = tmp_path / "urls.csv"
-        csv.write_text("url\nhttps://www.linkedin.com/in/johndoe/\n")
-        df = load_profiles_df(csv)
-        assert df.iloc[0]["public_identifier"] == "johndoe"
+        assert import_profiles_csv(fake_session, csv) == 3
+        assert {p["public_identifier"] for p in get_staged_profiles(fake_session)} == {"zed", "bob", "carol"}
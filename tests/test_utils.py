@@ -0,0 +1,24 @@
+# tests/test_utils.py
+from itertools import count, islice
+
+from linkedin.utils import ordered_pool_map
+
+
+class TestOrderedPoolMap:
+    def test_maps_in_process(self):
+        assert list(ordered_pool_map(abs, [-3, 1, -2], workers=1)) == [3, 1, 2]
+
+    def test_pool_keeps_input_order(self):
+        items = [-i for i in range(50)]
+        assert list(ordered_pool_map(abs, items, workers=3)) == list(range(50))
+
+    def test_reads_a_bounded_window_ahead(self):
+        consumed = []
+
+        def items():
+            for i in count():
+                consumed.append(i)
+                yield -i
+
+        assert list(islice(ordered_pool_map(abs, items(), workers=2), 3)) == [0, 1, 2]
+        assert len(consumed) <= 3 + 2 * 2